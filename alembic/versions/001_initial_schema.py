@@ -4,8 +4,12 @@ Revision ID: 001_initial_schema
 Revises:
 Create Date: 2026-02-09 00:00:00.000000
 
-Creates all core-banking tables: customers, accounts, transactions, admin_users.
+Creates all core-banking tables: customers, accounts, transactions, admin_users,
+together with their primary keys and unique indexes.
 Seeds the 3 default admin users for the fraud-ops portal.
+
+Non-unique secondary indexes are built separately (``002_secondary_indexes``)
+with ``CREATE INDEX CONCURRENTLY`` so they never hold a write lock.
 """
 
 import uuid
@@ -24,6 +28,9 @@ depends_on: Union[str, Sequence[str], None] = None
 # Deterministic UUIDs derived from username — ensures idempotent migrations
 _NS = uuid.NAMESPACE_DNS
 
+# Rows per multi-row INSERT statement when seeding
+SEED_BATCH_SIZE = 1000
+
 # Pre-computed bcrypt hashes (passwords: admin123, analyst123, viewer123)
 SEED_USERS = [
     {
@@ -57,7 +64,7 @@ SEED_USERS = [
 
 
 def upgrade() -> None:
-    """Create all tables and seed admin users."""
+    """Create all tables (PKs + unique indexes) and seed admin users."""
 
     # -- customers --
     op.create_table(
@@ -91,8 +98,6 @@ def upgrade() -> None:
         sa.PrimaryKeyConstraint("id"),
     )
     op.create_index("ix_customers_external_id", "customers", ["external_id"], unique=True)
-    op.create_index("idx_customer_status", "customers", ["status"])
-    op.create_index("idx_customer_tier", "customers", ["tier"])
     op.create_index("idx_customer_email", "customers", ["email"], unique=True)
     op.create_index("idx_customer_id_number", "customers", ["id_number"], unique=True)
 
@@ -128,8 +133,6 @@ def upgrade() -> None:
         sa.PrimaryKeyConstraint("id"),
     )
     op.create_index("ix_accounts_account_number", "accounts", ["account_number"], unique=True)
-    op.create_index("ix_accounts_customer_id", "accounts", ["customer_id"])
-    op.create_index("idx_account_customer_type", "accounts", ["customer_id", "account_type"])
 
     # -- transactions --
     op.create_table(
@@ -174,10 +177,6 @@ def upgrade() -> None:
         sa.PrimaryKeyConstraint("id"),
     )
     op.create_index("ix_transactions_external_id", "transactions", ["external_id"], unique=True)
-    op.create_index("ix_transactions_account_id", "transactions", ["account_id"])
-    op.create_index("ix_transactions_customer_id", "transactions", ["customer_id"])
-    op.create_index("idx_txn_customer_created", "transactions", ["customer_id", "created_at"])
-    op.create_index("idx_txn_account_created", "transactions", ["account_id", "created_at"])
 
     # -- admin_users --
     admin_users = op.create_table(
@@ -206,8 +205,9 @@ def upgrade() -> None:
     op.create_index("ix_admin_users_username", "admin_users", ["username"], unique=True)
     op.create_index("ix_admin_users_email", "admin_users", ["email"], unique=True)
 
-    # Seed demo admin users
-    op.bulk_insert(admin_users, SEED_USERS)
+    # Seed demo admin users — one multi-row INSERT per batch instead of executemany
+    for start in range(0, len(SEED_USERS), SEED_BATCH_SIZE):
+        op.execute(admin_users.insert().values(SEED_USERS[start : start + SEED_BATCH_SIZE]))
 
 
 def downgrade() -> None:
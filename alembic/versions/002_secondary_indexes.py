@@ -0,0 +1,69 @@
+"""secondary_indexes
+
+Revision ID: 002_secondary_indexes
+Revises: 001_initial_schema
+Create Date: 2026-10-14 00:00:00.000000
+
+Builds the non-unique secondary indexes with ``CREATE INDEX CONCURRENTLY`` so
+reads and writes on customers/accounts/transactions keep flowing while the
+indexes are built.  ``CONCURRENTLY`` cannot run inside a transaction, so the
+work happens in an autocommit block.
+
+A failed concurrent build leaves an INVALID index behind; any such leftover
+is dropped and rebuilt, which makes the revision safe to re-run.
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision: str = "002_secondary_indexes"
+down_revision: Union[str, None] = "001_initial_schema"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (index name, table, column list)
+SECONDARY_INDEXES: list[tuple[str, str, str]] = [
+    ("idx_customer_status", "customers", "status"),
+    ("idx_customer_tier", "customers", "tier"),
+    ("idx_account_customer_type", "accounts", "customer_id, account_type"),
+    ("idx_txn_customer_created", "transactions", "customer_id, created_at"),
+    ("idx_txn_account_created", "transactions", "account_id, created_at"),
+]
+
+
+def _drop_if_invalid(name: str) -> None:
+    """Drop *name* if a previous concurrent build left it INVALID."""
+    if op.get_context().as_sql:
+        # Offline (--sql) mode has no connection to inspect pg_index.
+        return
+    invalid = (
+        op.get_bind()
+        .execute(
+            sa.text(
+                "SELECT 1 FROM pg_index i JOIN pg_class c ON c.oid = i.indexrelid "
+                "WHERE c.relname = :name AND NOT i.indisvalid"
+            ),
+            {"name": name},
+        )
+        .scalar()
+    )
+    if invalid:
+        op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
+
+
+def upgrade() -> None:
+    """Create secondary indexes without blocking writes."""
+    with op.get_context().autocommit_block():
+        for name, table, columns in SECONDARY_INDEXES:
+            _drop_if_invalid(name)
+            op.execute(f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} ON {table} ({columns})")
+
+
+def downgrade() -> None:
+    """Drop secondary indexes without blocking writes."""
+    with op.get_context().autocommit_block():
+        for name, _table, _columns in reversed(SECONDARY_INDEXES):
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
@@ -0,0 +1,62 @@
+"""admin_login_covering_index
+
+Revision ID: 003_admin_login_covering_index
+Revises: 002_secondary_indexes
+Create Date: 2026-10-14 00:00:00.000000
+
+Adds a covering index for ``UserRepository.get_by_username`` (login hot
+path) so the lookup can be served by an index-only scan.
+
+The index is deliberately not partial on ``is_active = true``: the login
+query must still find disabled users so it can answer 403 rather than 401.
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision: str = "003_admin_login_covering_index"
+down_revision: Union[str, None] = "002_secondary_indexes"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+INDEX_NAME = "ix_admin_users_username_covering"
+
+
+def _drop_if_invalid(name: str) -> None:
+    """Drop *name* if a previous concurrent build left it INVALID."""
+    if op.get_context().as_sql:
+        # Offline (--sql) mode has no connection to inspect pg_index.
+        return
+    invalid = (
+        op.get_bind()
+        .execute(
+            sa.text(
+                "SELECT 1 FROM pg_index i JOIN pg_class c ON c.oid = i.indexrelid "
+                "WHERE c.relname = :name AND NOT i.indisvalid"
+            ),
+            {"name": name},
+        )
+        .scalar()
+    )
+    if invalid:
+        op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
+
+
+def upgrade() -> None:
+    """Create the covering login index without blocking writes."""
+    with op.get_context().autocommit_block():
+        _drop_if_invalid(INDEX_NAME)
+        op.execute(
+            f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {INDEX_NAME} ON admin_users (username) "
+            "INCLUDE (id, email, hashed_password, full_name, role, is_active, "
+            "created_at, updated_at)"
+        )
+
+
+def downgrade() -> None:
+    """Drop the covering login index."""
+    with op.get_context().autocommit_block():
+        op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {INDEX_NAME}")
@@ -0,0 +1,48 @@
+"""drop_redundant_indexes
+
+Revision ID: 004_drop_redundant_indexes
+Revises: 003_admin_login_covering_index
+Create Date: 2026-10-14 00:00:00.000000
+
+Drops single-column indexes whose column is the leading column of a
+composite index, so every INSERT into transactions/accounts maintains one
+fewer btree:
+
+- ``ix_transactions_account_id``  -> covered by ``idx_txn_account_created``
+- ``ix_transactions_customer_id`` -> covered by ``idx_txn_customer_created``
+- ``ix_accounts_customer_id``     -> covered by ``idx_account_customer_type``
+
+Databases built before ``002_secondary_indexes`` still carry them.
+``DROP INDEX CONCURRENTLY`` accepts a single index per statement, so each
+is dropped separately in an autocommit block.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "004_drop_redundant_indexes"
+down_revision: Union[str, None] = "003_admin_login_covering_index"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (index name, table, column list)
+REDUNDANT_INDEXES: list[tuple[str, str, str]] = [
+    ("ix_transactions_account_id", "transactions", "account_id"),
+    ("ix_transactions_customer_id", "transactions", "customer_id"),
+    ("ix_accounts_customer_id", "accounts", "customer_id"),
+]
+
+
+def upgrade() -> None:
+    """Drop the redundant indexes without blocking writes."""
+    with op.get_context().autocommit_block():
+        for name, _table, _columns in REDUNDANT_INDEXES:
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
+
+
+def downgrade() -> None:
+    """Recreate the single-column indexes without blocking writes."""
+    with op.get_context().autocommit_block():
+        for name, table, columns in REDUNDANT_INDEXES:
+            op.execute(f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} ON {table} ({columns})")
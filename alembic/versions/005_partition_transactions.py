@@ -0,0 +1,217 @@
+"""partition_transactions
+
+Revision ID: 005_partition_transactions
+Revises: 004_drop_redundant_indexes
+Create Date: 2026-10-14 00:00:00.000000
+
+Converts ``transactions`` to ``PARTITION BY RANGE (created_at)`` with
+monthly partitions, so per-partition indexes stay cache-resident and old
+months can be detached instead of DELETEd.
+
+- The primary key becomes ``(id, created_at)``; Postgres requires the
+  partition key in every unique constraint on a partitioned table.
+- For the same reason ``external_id`` can no longer be globally UNIQUE on
+  the table itself.  Uniqueness is kept by ``transaction_external_ids``, a
+  narrow non-partitioned table that a row trigger claims on INSERT (and
+  releases on DELETE); duplicates still raise ``unique_violation`` and
+  surface as HTTP 409.
+- ``create_transactions_partition(date)`` creates the partition for the
+  month containing that date.  It is called here for every month that has
+  data plus the next two; a scheduled job must call it ahead of each new
+  month (``SELECT create_transactions_partition((now() + interval '2 months')::date)``).
+  ``transactions_default`` only catches rows that arrive before their
+  month's partition exists.
+
+The conversion copies every row inside the migration transaction and
+holds an ACCESS EXCLUSIVE lock on ``transactions`` for its duration.
+"""
+
+from typing import Any, Sequence, Union
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+revision: str = "005_partition_transactions"
+down_revision: Union[str, None] = "004_drop_redundant_indexes"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_COLUMNS = (
+    "id, external_id, account_id, customer_id, type, amount, currency, merchant_name, "
+    "merchant_category, channel, country_code, ip_address, device_id, status, description, "
+    "created_at, updated_at"
+)
+
+_INDEXES: list[tuple[str, list[str]]] = [
+    ("ix_transactions_external_id", ["external_id"]),
+    ("idx_txn_customer_created", ["customer_id", "created_at"]),
+    ("idx_txn_account_created", ["account_id", "created_at"]),
+]
+
+
+def _transaction_columns() -> list[sa.Column[Any]]:
+    return [
+        sa.Column("id", sa.UUID(as_uuid=False), nullable=False),
+        sa.Column("external_id", sa.String(100), nullable=False),
+        sa.Column(
+            "account_id",
+            sa.UUID(as_uuid=False),
+            sa.ForeignKey("accounts.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column(
+            "customer_id",
+            sa.UUID(as_uuid=False),
+            sa.ForeignKey("customers.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column("type", sa.String(20), nullable=False),
+        sa.Column("amount", sa.Numeric(15, 2), nullable=False),
+        sa.Column("currency", sa.String(3), nullable=False, server_default="ZAR"),
+        sa.Column("merchant_name", sa.String(255), nullable=True),
+        sa.Column("merchant_category", sa.String(50), nullable=True),
+        sa.Column("channel", sa.String(20), nullable=False),
+        sa.Column("country_code", sa.String(2), nullable=False, server_default="ZA"),
+        sa.Column("ip_address", postgresql.INET, nullable=True),
+        sa.Column("device_id", sa.String(255), nullable=True),
+        sa.Column("status", sa.String(20), nullable=False, server_default="completed"),
+        sa.Column("description", sa.String(500), nullable=True),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+    ]
+
+
+def _set_aside(table: str) -> None:
+    """Rename *table* and its named indexes so the replacement can reuse the names."""
+    op.execute(f"ALTER TABLE transactions RENAME TO {table}")
+    op.execute(f"ALTER TABLE {table} RENAME CONSTRAINT transactions_pkey TO {table}_pkey")
+    for name, _columns in _INDEXES:
+        op.execute(f"ALTER INDEX IF EXISTS {name} RENAME TO {name}_old")
+
+
+def upgrade() -> None:
+    """Replace ``transactions`` with a range-partitioned table and copy the rows over."""
+    _set_aside("transactions_unpartitioned")
+
+    op.create_table(
+        "transactions",
+        *_transaction_columns(),
+        sa.PrimaryKeyConstraint("id", "created_at"),
+        postgresql_partition_by="RANGE (created_at)",
+    )
+
+    # -- external_id uniqueness across partitions --
+    op.create_table(
+        "transaction_external_ids",
+        sa.Column("external_id", sa.String(100), nullable=False),
+        sa.PrimaryKeyConstraint("external_id"),
+    )
+    op.execute(
+        """
+        CREATE FUNCTION claim_transaction_external_id() RETURNS trigger
+        LANGUAGE plpgsql AS $$
+        BEGIN
+            IF TG_OP = 'INSERT' THEN
+                INSERT INTO transaction_external_ids (external_id) VALUES (NEW.external_id);
+                RETURN NEW;
+            END IF;
+            DELETE FROM transaction_external_ids WHERE external_id = OLD.external_id;
+            RETURN OLD;
+        END
+        $$
+        """
+    )
+    op.execute(
+        "CREATE TRIGGER trg_transactions_external_id "
+        "BEFORE INSERT OR DELETE ON transactions "
+        "FOR EACH ROW EXECUTE FUNCTION claim_transaction_external_id()"
+    )
+
+    # -- monthly partitions (bounds are UTC month starts) --
+    op.execute(
+        """
+        CREATE FUNCTION create_transactions_partition(month_start date) RETURNS void
+        LANGUAGE plpgsql AS $$
+        DECLARE
+            lower_bound timestamp := date_trunc('month', month_start::timestamp);
+        BEGIN
+            EXECUTE format(
+                'CREATE TABLE IF NOT EXISTS %I PARTITION OF transactions '
+                'FOR VALUES FROM (%L) TO (%L)',
+                'transactions_' || to_char(lower_bound, 'YYYYMM'),
+                lower_bound AT TIME ZONE 'UTC',
+                (lower_bound + interval '1 month') AT TIME ZONE 'UTC'
+            );
+        END
+        $$
+        """
+    )
+    op.execute(
+        """
+        DO $$
+        DECLARE
+            first_month timestamp;
+            m timestamp;
+        BEGIN
+            SELECT date_trunc('month', coalesce(min(created_at), now()) AT TIME ZONE 'UTC')
+              INTO first_month
+              FROM transactions_unpartitioned;
+            FOR m IN
+                SELECT generate_series(
+                    first_month,
+                    date_trunc('month', now() AT TIME ZONE 'UTC') + interval '2 months',
+                    interval '1 month'
+                )
+            LOOP
+                PERFORM create_transactions_partition(m::date);
+            END LOOP;
+        END
+        $$
+        """
+    )
+    op.execute("CREATE TABLE transactions_default PARTITION OF transactions DEFAULT")
+
+    # -- copy rows (the trigger claims every external_id) and drop the old table --
+    op.execute(
+        f"INSERT INTO transactions ({_COLUMNS}) "
+        f"SELECT {_COLUMNS} FROM transactions_unpartitioned"
+    )
+    op.drop_table("transactions_unpartitioned")
+
+    # Indexes on the parent are created on every partition (local indexes)
+    for name, columns in _INDEXES:
+        op.create_index(name, "transactions", columns)
+
+
+def downgrade() -> None:
+    """Restore a plain ``transactions`` table with a global UNIQUE external_id."""
+    _set_aside("transactions_partitioned")
+
+    op.create_table(
+        "transactions",
+        *_transaction_columns(),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.execute(
+        f"INSERT INTO transactions ({_COLUMNS}) SELECT {_COLUMNS} FROM transactions_partitioned"
+    )
+    op.drop_table("transactions_partitioned")  # drops its partitions and trigger
+    op.drop_table("transaction_external_ids")
+    op.execute("DROP FUNCTION IF EXISTS claim_transaction_external_id()")
+    op.execute("DROP FUNCTION IF EXISTS create_transactions_partition(date)")
+
+    op.create_index("ix_transactions_external_id", "transactions", ["external_id"], unique=True)
+    op.create_index("idx_txn_customer_created", "transactions", ["customer_id", "created_at"])
+    op.create_index("idx_txn_account_created", "transactions", ["account_id", "created_at"])
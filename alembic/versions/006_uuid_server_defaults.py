@@ -0,0 +1,71 @@
+"""uuid_server_defaults
+
+Revision ID: 006_uuid_server_defaults
+Revises: 005_partition_transactions
+Create Date: 2026-10-14 00:00:00.000000
+
+Gives every ``id`` column a server-side default so rows inserted outside
+the ORM (bulk loads, psql) get a key without a Python round-trip:
+
+- customers / accounts / admin_users: ``gen_random_uuid()``
+- transactions: ``uuidv7()`` — time-ordered, so inserts into the
+  append-heavy table hit the rightmost btree page.
+
+The columns are already native 16-byte ``uuid``; only defaults change.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "006_uuid_server_defaults"
+down_revision: Union[str, None] = "005_partition_transactions"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_RANDOM_UUID_TABLES = ("customers", "accounts", "admin_users")
+
+
+def upgrade() -> None:
+    """Add gen_random_uuid()/uuidv7() defaults to the id columns."""
+    # gen_random_uuid() is core from PostgreSQL 13; pgcrypto provides it before that
+    op.execute("CREATE EXTENSION IF NOT EXISTS pgcrypto")
+
+    # UUIDv7: overwrite the first 48 bits of a v4 UUID with Unix epoch
+    # milliseconds and flip the version nibble from 4 to 7.
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION uuidv7() RETURNS uuid
+        LANGUAGE sql VOLATILE AS $$
+            SELECT encode(
+                set_bit(
+                    set_bit(
+                        overlay(
+                            uuid_send(gen_random_uuid())
+                            PLACING substring(
+                                int8send(floor(extract(epoch FROM clock_timestamp()) * 1000)::bigint)
+                                FROM 3
+                            )
+                            FROM 1 FOR 6
+                        ),
+                        52, 1
+                    ),
+                    53, 1
+                ),
+                'hex'
+            )::uuid
+        $$
+        """
+    )
+
+    for table in _RANDOM_UUID_TABLES:
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN id SET DEFAULT gen_random_uuid()")
+    op.execute("ALTER TABLE transactions ALTER COLUMN id SET DEFAULT uuidv7()")
+
+
+def downgrade() -> None:
+    """Remove the id server defaults."""
+    op.execute("ALTER TABLE transactions ALTER COLUMN id DROP DEFAULT")
+    for table in _RANDOM_UUID_TABLES:
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN id DROP DEFAULT")
+    op.execute("DROP FUNCTION IF EXISTS uuidv7()")
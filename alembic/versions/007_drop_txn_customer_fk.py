@@ -0,0 +1,38 @@
+"""drop_txn_customer_fk
+
+Revision ID: 007_drop_txn_customer_fk
+Revises: 006_uuid_server_defaults
+Create Date: 2026-10-14 00:00:00.000000
+
+Drops the ``transactions.customer_id -> customers.id`` foreign key.  The
+column is a denormalised copy of ``accounts.customer_id`` kept for the
+per-customer index; deleting a customer already cascades to its
+transactions through ``accounts``.  Each transaction INSERT now fires one
+FK check (``account_id``) instead of two.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "007_drop_txn_customer_fk"
+down_revision: Union[str, None] = "006_uuid_server_defaults"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Drop the redundant customer foreign key on transactions."""
+    op.execute("ALTER TABLE transactions DROP CONSTRAINT IF EXISTS transactions_customer_id_fkey")
+
+
+def downgrade() -> None:
+    """Restore the customer foreign key on transactions."""
+    op.create_foreign_key(
+        "transactions_customer_id_fkey",
+        "transactions",
+        "customers",
+        ["customer_id"],
+        ["id"],
+        ondelete="CASCADE",
+    )
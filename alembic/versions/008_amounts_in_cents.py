@@ -0,0 +1,50 @@
+"""amounts_in_cents
+
+Revision ID: 008_amounts_in_cents
+Revises: 007_drop_txn_customer_fk
+Create Date: 2026-10-14 00:00:00.000000
+
+Stores ``accounts.balance`` and ``transactions.amount`` as ``bigint`` cents
+(``balance_cents`` / ``amount_cents``) instead of ``numeric(15, 2)``:
+fixed-width int64 arithmetic in Postgres and plain ``int`` decoding in the
+driver, with no ``Decimal`` round-trip per row.  The API still exposes the
+two-decimal ``balance`` / ``amount`` values.
+
+Both ``ALTER ... TYPE`` statements rewrite their table (every partition of
+``transactions``) under an ACCESS EXCLUSIVE lock.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "008_amounts_in_cents"
+down_revision: Union[str, None] = "007_drop_txn_customer_fk"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (table, numeric column, cents column)
+_MONEY_COLUMNS: list[tuple[str, str, str]] = [
+    ("accounts", "balance", "balance_cents"),
+    ("transactions", "amount", "amount_cents"),
+]
+
+
+def upgrade() -> None:
+    """Convert numeric(15, 2) money columns to bigint cents."""
+    for table, column, cents_column in _MONEY_COLUMNS:
+        op.execute(
+            f"ALTER TABLE {table} ALTER COLUMN {column} TYPE bigint "
+            f"USING round({column} * 100)::bigint"
+        )
+        op.alter_column(table, column, new_column_name=cents_column)
+
+
+def downgrade() -> None:
+    """Convert bigint cents back to numeric(15, 2)."""
+    for table, column, cents_column in _MONEY_COLUMNS:
+        op.alter_column(table, cents_column, new_column_name=column)
+        op.execute(
+            f"ALTER TABLE {table} ALTER COLUMN {column} TYPE numeric(15, 2) "
+            f"USING {column} / 100.0"
+        )
@@ -0,0 +1,34 @@
+"""txn_keyset_index
+
+Revision ID: 009_txn_keyset_index
+Revises: 008_amounts_in_cents
+Create Date: 2026-10-14 00:00:00.000000
+
+Adds ``idx_txn_created_id`` on ``transactions (created_at, id)`` so the
+unscoped ``GET /transactions`` listing, now keyset-paginated on
+``(created_at DESC, id DESC)``, reads each page as a backward index range
+scan.  The primary key is ``(id, created_at)``, whose column order cannot
+serve that seek.
+
+Created on the partitioned parent, which builds the index on every
+partition in turn; writes to ``transactions`` block while it runs.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "009_txn_keyset_index"
+down_revision: Union[str, None] = "008_amounts_in_cents"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Index transactions in keyset order."""
+    op.create_index("idx_txn_created_id", "transactions", ["created_at", "id"])
+
+
+def downgrade() -> None:
+    """Drop the keyset index."""
+    op.drop_index("idx_txn_created_id", table_name="transactions")
@@ -0,0 +1,43 @@
+"""txn_customer_covering_index
+
+Revision ID: 010_txn_customer_covering_index
+Revises: 009_txn_keyset_index
+Create Date: 2026-10-14 00:00:00.000000
+
+Rebuilds ``idx_txn_customer_created`` as a covering index carrying
+``amount_cents`` (``INCLUDE``), so the customer summary's 30-day
+``count/sum/avg`` can be answered by an index-only scan instead of fetching
+every matching heap row.  The key columns are unchanged, so the
+per-customer keyset listing keeps using the same index; replacing it rather
+than adding a second one keeps transaction inserts to one index write.
+
+Index-only scans rely on the visibility map, i.e. on autovacuum keeping up
+with the partitions.  Both statements run on the partitioned parent and
+block writes to ``transactions`` while the index is rebuilt.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "010_txn_customer_covering_index"
+down_revision: Union[str, None] = "009_txn_keyset_index"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Recreate the per-customer index with amount_cents included."""
+    op.drop_index("idx_txn_customer_created", table_name="transactions")
+    op.create_index(
+        "idx_txn_customer_created",
+        "transactions",
+        ["customer_id", "created_at"],
+        postgresql_include=["amount_cents"],
+    )
+
+
+def downgrade() -> None:
+    """Restore the plain per-customer index."""
+    op.drop_index("idx_txn_customer_created", table_name="transactions")
+    op.create_index("idx_txn_customer_created", "transactions", ["customer_id", "created_at"])
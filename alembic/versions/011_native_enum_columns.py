@@ -0,0 +1,83 @@
+"""native_enum_columns
+
+Revision ID: 011_native_enum_columns
+Revises: 010_txn_customer_covering_index
+Create Date: 2026-10-14 00:00:00.000000
+
+Stores the status/type columns as native Postgres ``ENUM`` types instead of
+``varchar(20)``.  An enum value is a fixed 4-byte OID per row rather than a
+length header plus the label, so ``transactions`` (three such columns) and
+``customers`` (four) fit more rows per page.  Unknown labels are now rejected
+by the database as well as by the API schemas.
+
+Each ``ALTER ... TYPE`` rewrites its table (every partition of
+``transactions``) and rebuilds the indexes on it under an ACCESS EXCLUSIVE
+lock.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "011_native_enum_columns"
+down_revision: Union[str, None] = "010_txn_customer_covering_index"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Frozen copies of the app enums at this revision: type name -> labels.
+_ENUM_TYPES: dict[str, tuple[str, ...]] = {
+    "account_type": ("cheque", "savings", "credit", "investment", "business"),
+    "account_status": ("active", "frozen", "dormant", "closed"),
+    "transaction_type": ("purchase", "transfer", "withdrawal", "deposit", "payment", "refund"),
+    "transaction_channel": ("online", "pos", "atm", "mobile", "branch"),
+    "transaction_status": ("pending", "completed", "failed", "reversed"),
+    "kyc_status": ("pending", "verified", "rejected", "expired"),
+    "customer_tier": ("standard", "premium", "private"),
+    "risk_rating": ("low", "medium", "high"),
+    "customer_status": ("active", "suspended", "closed"),
+    "user_role": ("admin", "analyst", "viewer"),
+}
+
+# (table, column, enum type, server default)
+_ENUM_COLUMNS: list[tuple[str, str, str, str | None]] = [
+    ("accounts", "account_type", "account_type", None),
+    ("accounts", "status", "account_status", "active"),
+    ("transactions", "type", "transaction_type", None),
+    ("transactions", "channel", "transaction_channel", None),
+    ("transactions", "status", "transaction_status", "completed"),
+    ("customers", "kyc_status", "kyc_status", "pending"),
+    ("customers", "tier", "customer_tier", "standard"),
+    ("customers", "risk_rating", "risk_rating", "low"),
+    ("customers", "status", "customer_status", "active"),
+    ("admin_users", "role", "user_role", "viewer"),
+]
+
+
+def _retype(table: str, column: str, sql_type: str, default: str | None) -> None:
+    # A varchar default cannot be cast implicitly, so it is swapped around
+    # the type change.
+    if default is not None:
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN {column} DROP DEFAULT")
+    op.execute(
+        f"ALTER TABLE {table} ALTER COLUMN {column} TYPE {sql_type} "
+        f"USING {column}::text::{sql_type}"
+    )
+    if default is not None:
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN {column} SET DEFAULT '{default}'")
+
+
+def upgrade() -> None:
+    """Create the enum types and convert the varchar columns to them."""
+    for name, labels in _ENUM_TYPES.items():
+        values = ", ".join(f"'{label}'" for label in labels)
+        op.execute(f"CREATE TYPE {name} AS ENUM ({values})")
+    for table, column, enum_type, default in _ENUM_COLUMNS:
+        _retype(table, column, enum_type, default)
+
+
+def downgrade() -> None:
+    """Convert the enum columns back to varchar(20) and drop the types."""
+    for table, column, _enum_type, default in _ENUM_COLUMNS:
+        _retype(table, column, "varchar(20)", default)
+    for name in _ENUM_TYPES:
+        op.execute(f"DROP TYPE {name}")
@@ -0,0 +1,52 @@
+"""txn_scoped_keyset_indexes
+
+Revision ID: 012_txn_scoped_keyset_indexes
+Revises: 011_native_enum_columns
+Create Date: 2026-10-14 00:00:00.000000
+
+Appends ``id`` to ``idx_txn_customer_created`` and ``idx_txn_account_created``
+so they match the feeds' full keyset order, ``(created_at DESC, id DESC)``.
+With only ``created_at`` in the key, Postgres had to sort rows that share a
+timestamp by ``id`` (an incremental sort on top of the scan) and could not
+seek straight to ``(created_at, id) < cursor``.  Now each page is a plain
+backward index range scan.  Ascending keys serve the ``DESC`` order when
+scanned backwards, so no ``DESC`` index is needed.
+
+Both indexes are rebuilt on the partitioned parent under their existing
+names; writes to ``transactions`` block while they build.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "012_txn_scoped_keyset_indexes"
+down_revision: Union[str, None] = "011_native_enum_columns"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Key the per-customer and per-account indexes on (created_at, id)."""
+    op.drop_index("idx_txn_customer_created", table_name="transactions")
+    op.create_index(
+        "idx_txn_customer_created",
+        "transactions",
+        ["customer_id", "created_at", "id"],
+        postgresql_include=["amount_cents"],
+    )
+    op.drop_index("idx_txn_account_created", table_name="transactions")
+    op.create_index("idx_txn_account_created", "transactions", ["account_id", "created_at", "id"])
+
+
+def downgrade() -> None:
+    """Restore the (…, created_at) keys."""
+    op.drop_index("idx_txn_account_created", table_name="transactions")
+    op.create_index("idx_txn_account_created", "transactions", ["account_id", "created_at"])
+    op.drop_index("idx_txn_customer_created", table_name="transactions")
+    op.create_index(
+        "idx_txn_customer_created",
+        "transactions",
+        ["customer_id", "created_at"],
+        postgresql_include=["amount_cents"],
+    )
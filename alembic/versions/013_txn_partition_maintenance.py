@@ -0,0 +1,132 @@
+"""txn_partition_maintenance
+
+Revision ID: 013_txn_partition_maintenance
+Revises: 012_txn_scoped_keyset_indexes
+Create Date: 2026-10-14 00:00:00.000000
+
+Fixes two gaps left by ``005_partition_transactions``:
+
+- ``create_transactions_partition(date)`` failed for any month that
+  ``transactions_default`` already held rows for: Postgres refuses to add
+  a partition while rows in the DEFAULT partition fall inside its bounds.
+  It now moves those rows out of the default partition (under a lock that
+  blocks concurrent writes to it) before creating the partition, then
+  inserts them back through the parent so they land in the new month.
+  The application also calls it at startup for the current month and the
+  next two (``app.infrastructure.ensure_transaction_partitions``).
+- The external_id claim trigger fired on INSERT and DELETE only, so an
+  UPDATE of ``external_id`` bypassed the cross-partition uniqueness claim.
+  Changing ``external_id`` is now rejected; it is the upstream idempotency
+  key and nothing in the service rewrites it.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "013_txn_partition_maintenance"
+down_revision: Union[str, None] = "012_txn_scoped_keyset_indexes"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# As created by 005, restored on downgrade
+_CREATE_PARTITION_005 = """
+CREATE OR REPLACE FUNCTION create_transactions_partition(month_start date) RETURNS void
+LANGUAGE plpgsql AS $$
+DECLARE
+    lower_bound timestamp := date_trunc('month', month_start::timestamp);
+BEGIN
+    EXECUTE format(
+        'CREATE TABLE IF NOT EXISTS %I PARTITION OF transactions '
+        'FOR VALUES FROM (%L) TO (%L)',
+        'transactions_' || to_char(lower_bound, 'YYYYMM'),
+        lower_bound AT TIME ZONE 'UTC',
+        (lower_bound + interval '1 month') AT TIME ZONE 'UTC'
+    );
+END
+$$
+"""
+
+
+def upgrade() -> None:
+    """Make partition creation drain the default partition; guard external_id updates."""
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION create_transactions_partition(month_start date) RETURNS void
+        LANGUAGE plpgsql AS $$
+        DECLARE
+            lower_bound timestamp := date_trunc('month', month_start::timestamp);
+            partition_name text := 'transactions_' || to_char(lower_bound, 'YYYYMM');
+            from_ts timestamptz := lower_bound AT TIME ZONE 'UTC';
+            to_ts timestamptz := (lower_bound + interval '1 month') AT TIME ZONE 'UTC';
+        BEGIN
+            IF to_regclass(partition_name) IS NOT NULL THEN
+                RETURN;
+            END IF;
+
+            -- Rows for this month that arrived early sit in the default
+            -- partition; set them aside so the new partition can be attached.
+            LOCK TABLE transactions_default IN SHARE ROW EXCLUSIVE MODE;
+            CREATE TEMP TABLE txn_partition_backfill (LIKE transactions) ON COMMIT DROP;
+            WITH moved AS (
+                DELETE FROM transactions_default
+                 WHERE created_at >= from_ts AND created_at < to_ts
+                RETURNING *
+            )
+            INSERT INTO txn_partition_backfill SELECT * FROM moved;
+
+            -- IF NOT EXISTS: a concurrent caller may have created it while
+            -- this one waited on the lock.
+            EXECUTE format(
+                'CREATE TABLE IF NOT EXISTS %I PARTITION OF transactions '
+                'FOR VALUES FROM (%L) TO (%L)',
+                partition_name, from_ts, to_ts
+            );
+
+            -- Through the parent, so rows route to the new partition and the
+            -- claim trigger re-claims the external_ids the DELETE released.
+            INSERT INTO transactions SELECT * FROM txn_partition_backfill;
+            DROP TABLE txn_partition_backfill;
+        END
+        $$
+        """
+    )
+
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION claim_transaction_external_id() RETURNS trigger
+        LANGUAGE plpgsql AS $$
+        BEGIN
+            IF TG_OP = 'INSERT' THEN
+                INSERT INTO transaction_external_ids (external_id) VALUES (NEW.external_id);
+                RETURN NEW;
+            ELSIF TG_OP = 'UPDATE' THEN
+                IF NEW.external_id IS DISTINCT FROM OLD.external_id THEN
+                    RAISE EXCEPTION 'transactions.external_id cannot be changed'
+                        USING ERRCODE = 'integrity_constraint_violation';
+                END IF;
+                RETURN NEW;
+            END IF;
+            DELETE FROM transaction_external_ids WHERE external_id = OLD.external_id;
+            RETURN OLD;
+        END
+        $$
+        """
+    )
+    op.execute("DROP TRIGGER trg_transactions_external_id ON transactions")
+    op.execute(
+        "CREATE TRIGGER trg_transactions_external_id "
+        "BEFORE INSERT OR DELETE OR UPDATE OF external_id ON transactions "
+        "FOR EACH ROW EXECUTE FUNCTION claim_transaction_external_id()"
+    )
+
+
+def downgrade() -> None:
+    """Restore the 005 trigger and partition function."""
+    op.execute("DROP TRIGGER trg_transactions_external_id ON transactions")
+    op.execute(
+        "CREATE TRIGGER trg_transactions_external_id "
+        "BEFORE INSERT OR DELETE ON transactions "
+        "FOR EACH ROW EXECUTE FUNCTION claim_transaction_external_id()"
+    )
+    op.execute(_CREATE_PARTITION_005)
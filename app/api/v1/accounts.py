@@ -1,13 +1,16 @@
 """Account API endpoints."""
 
+from functools import partial
+
 from fastapi import APIRouter, Depends, HTTPException, status
-from fastapi_pagination import Page
 from fastapi_pagination.ext.sqlalchemy import paginate as sqlalchemy_paginate
 
 from app.auth.dependencies import require_role
-from app.dependencies import AccountRepo, TransactionRepo
+from app.dependencies import AccountRepo, AfterCommit, RedisClient, TransactionRepo
 from app.schemas.account import AccountCreate, AccountResponse, AccountUpdate
-from app.schemas.transaction import TransactionResponse
+from app.schemas.common import from_trusted_row
+from app.schemas.transaction import TransactionCursorPage
+from app.services.summary_cache import invalidate_summary
 from app.utils.audit import audit_logged
 
 router = APIRouter()
@@ -29,29 +32,36 @@ async def get_account(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Account not found",
         )
-    return AccountResponse.model_validate(account)
+    return from_trusted_row(AccountResponse, account)
 
 
 @router.get(
     "/{account_id}/transactions",
-    response_model=Page[TransactionResponse],
+    response_model=TransactionCursorPage,
     dependencies=[Depends(require_role("admin", "analyst"))],
 )
 async def get_account_transactions(
     account_id: str,
     account_repo: AccountRepo,
     txn_repo: TransactionRepo,
-) -> Page[TransactionResponse]:
-    """Get transactions for a specific account."""
-    account = await account_repo.get_by_id(account_id)
-    if not account:
+) -> TransactionCursorPage:
+    """Get transactions for a specific account.
+
+    Keyset-paginated on ``(created_at, id)``, newest first: pass the
+    response's ``next_page`` back as ``?cursor=`` for the following page.
+    No COUNT is issued, so the page carries no ``total``.
+
+    A non-empty page proves the account exists, so the existence check
+    only runs when there are no transactions.
+    """
+    query = txn_repo.get_by_account_query(account_id)
+    page: TransactionCursorPage = await sqlalchemy_paginate(txn_repo.session, query)
+    if not page.items and not await account_repo.exists(account_id):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Account not found",
         )
-
-    query = txn_repo.get_by_account_query(account_id)
-    return await sqlalchemy_paginate(txn_repo.session, query)  # type: ignore[no-any-return]
+    return page
 
 
 @router.post(
@@ -63,10 +73,13 @@ async def get_account_transactions(
 async def create_account(
     data: AccountCreate,
     repo: AccountRepo,
+    redis: RedisClient,
+    after_commit: AfterCommit,
 ) -> AccountResponse:
     """Create a new account."""
     account = await repo.create(data)
-    return AccountResponse.model_validate(account)
+    after_commit.append(partial(invalidate_summary, redis, data.customer_id))
+    return from_trusted_row(AccountResponse, account)
 
 
 @router.put(
@@ -86,4 +99,4 @@ async def update_account(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Account not found",
         )
-    return AccountResponse.model_validate(account)
+    return from_trusted_row(AccountResponse, account)
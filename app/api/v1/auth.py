@@ -2,7 +2,7 @@
 
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordRequestForm
-from jose import JWTError
+from jwt import InvalidTokenError
 
 from app.auth.dependencies import CurrentUser
 from app.auth.security import (
@@ -14,9 +14,18 @@ from app.auth.security import (
 from app.config import get_settings
 from app.dependencies import UserRepo
 from app.schemas.auth import RefreshRequest, TokenResponse, UserResponse
+from app.utils.cache import TTLCache
 
 router = APIRouter()
 
+# Short-lived user snapshots for /refresh, keyed by user id (token ``sub``).
+# Bursty clients refreshing repeatedly skip the DB lookup; a deactivation
+# takes effect on refresh within REFRESH_USER_CACHE_TTL_SECONDS.
+REFRESH_USER_CACHE_TTL_SECONDS = 30.0
+_refresh_user_cache: TTLCache[str, UserResponse] = TTLCache(
+    maxsize=1024, ttl=REFRESH_USER_CACHE_TTL_SECONDS
+)
+
 
 @router.post("/login", response_model=TokenResponse)
 async def login(
@@ -39,7 +48,6 @@ async def login(
             detail="Account is disabled",
         )
 
-    settings = get_settings()
     return TokenResponse(
         access_token=create_access_token(
             user.id, user.role, username=user.username, email=user.email
@@ -47,7 +55,7 @@ async def login(
         refresh_token=create_refresh_token(
             user.id, user.role, username=user.username, email=user.email
         ),
-        expires_in=settings.jwt_access_token_expire_minutes * 60,
+        expires_in=get_settings().jwt_access_token_expire_seconds,
     )
 
 
@@ -59,7 +67,7 @@ async def refresh_token(
     """Exchange a refresh token for a new access token."""
     try:
         payload = decode_token(body.refresh_token)
-    except JWTError as err:
+    except InvalidTokenError as err:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid or expired refresh token",
@@ -77,7 +85,12 @@ async def refresh_token(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid token: missing subject",
         )
-    user = await repo.get_by_id(user_id)
+    user = _refresh_user_cache.get(user_id)
+    if user is None:
+        db_user = await repo.get_by_id(user_id)
+        if db_user is not None:
+            user = UserResponse.model_validate(db_user)
+            _refresh_user_cache.set(user_id, user)
 
     if not user or not user.is_active:
         raise HTTPException(
@@ -85,7 +98,6 @@ async def refresh_token(
             detail="User not found or inactive",
         )
 
-    settings = get_settings()
     return TokenResponse(
         access_token=create_access_token(
             user.id, user.role, username=user.username, email=user.email
@@ -93,7 +105,7 @@ async def refresh_token(
         refresh_token=create_refresh_token(
             user.id, user.role, username=user.username, email=user.email
         ),
-        expires_in=settings.jwt_access_token_expire_minutes * 60,
+        expires_in=get_settings().jwt_access_token_expire_seconds,
     )
 
 
@@ -1,25 +1,41 @@
 """Customer API endpoints."""
 
+from functools import partial
+
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi_filter import FilterDepends
 from fastapi_pagination import Page
 from fastapi_pagination.ext.sqlalchemy import paginate as sqlalchemy_paginate
+from pydantic import TypeAdapter
+from sqlalchemy import func
 
 from app.auth.dependencies import require_role
-from app.dependencies import AccountRepo, CustomerRepo, TransactionRepo
+from app.dependencies import (
+    AccountRepo,
+    AfterCommit,
+    CustomerRepo,
+    RedisClient,
+    TransactionRepo,
+)
 from app.filters.customer import CustomerFilter
 from app.schemas.account import AccountResponse
+from app.schemas.common import from_trusted_row
 from app.schemas.customer import (
     CustomerCreate,
     CustomerResponse,
     CustomerSummary,
     CustomerUpdate,
 )
-from app.schemas.transaction import TransactionResponse
+from app.schemas.transaction import TransactionCursorPage
+from app.services.summary_cache import cache_summary, get_cached_summary, invalidate_summary
 from app.utils.audit import audit_logged
 
 router = APIRouter()
 
+# Validates a whole result list in one pydantic-core call instead of one
+# model_validate() per row.
+_ACCOUNT_LIST_ADAPTER = TypeAdapter(list[AccountResponse])
+
 
 @router.get(
     "",
@@ -32,7 +48,10 @@ async def list_customers(
 ) -> Page[CustomerResponse]:
     """List customers with optional filtering and pagination."""
     query = repo.get_list_query(filters)
-    return await sqlalchemy_paginate(repo.session, query)  # type: ignore[no-any-return]
+    # COUNT(*) OVER () returns the total with the page rows, in one round-trip.
+    return await sqlalchemy_paginate(  # type: ignore[no-any-return]
+        repo.session, query, inline_count=func.count().over()
+    )
 
 
 @router.get(
@@ -51,7 +70,7 @@ async def get_customer(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Customer not found",
         )
-    return CustomerResponse.model_validate(customer)
+    return from_trusted_row(CustomerResponse, customer)
 
 
 @router.get(
@@ -64,38 +83,47 @@ async def get_customer_accounts(
     customer_repo: CustomerRepo,
     account_repo: AccountRepo,
 ) -> list[AccountResponse]:
-    """Get all accounts for a customer."""
-    customer = await customer_repo.get_by_id(customer_id)
-    if not customer:
+    """Get all accounts for a customer.
+
+    Any returned account proves the customer exists, so the existence check
+    only runs when the customer has no accounts.
+    """
+    accounts = await account_repo.get_by_customer(customer_id)
+    if not accounts and not await customer_repo.exists(customer_id):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Customer not found",
         )
-
-    accounts = await account_repo.get_by_customer(customer_id)
-    return [AccountResponse.model_validate(a) for a in accounts]
+    return _ACCOUNT_LIST_ADAPTER.validate_python(accounts, from_attributes=True)
 
 
 @router.get(
     "/{customer_id}/transactions",
-    response_model=Page[TransactionResponse],
+    response_model=TransactionCursorPage,
     dependencies=[Depends(require_role("admin", "analyst"))],
 )
 async def get_customer_transactions(
     customer_id: str,
     customer_repo: CustomerRepo,
     txn_repo: TransactionRepo,
-) -> Page[TransactionResponse]:
-    """Get transaction history for a customer."""
-    customer = await customer_repo.get_by_id(customer_id)
-    if not customer:
+) -> TransactionCursorPage:
+    """Get transaction history for a customer.
+
+    Keyset-paginated on ``(created_at, id)``, newest first: pass the
+    response's ``next_page`` back as ``?cursor=`` for the following page.
+    No COUNT is issued, so the page carries no ``total``.
+
+    A non-empty page proves the customer exists, so the existence check
+    only runs when there are no transactions.
+    """
+    query = txn_repo.get_by_customer_query(customer_id)
+    page: TransactionCursorPage = await sqlalchemy_paginate(txn_repo.session, query)
+    if not page.items and not await customer_repo.exists(customer_id):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Customer not found",
         )
-
-    query = txn_repo.get_by_customer_query(customer_id)
-    return await sqlalchemy_paginate(txn_repo.session, query)  # type: ignore[no-any-return]
+    return page
 
 
 @router.get(
@@ -106,14 +134,24 @@ async def get_customer_transactions(
 async def get_customer_summary(
     customer_id: str,
     repo: CustomerRepo,
+    redis: RedisClient,
 ) -> CustomerSummary:
-    """Get aggregated customer stats for the portal alert detail page."""
+    """Get aggregated customer stats for the portal alert detail page.
+
+    Analysts working an alert reload the same summary repeatedly, so it is
+    served from Redis for up to ``SUMMARY_CACHE_TTL_SECONDS``.
+    """
+    cached = await get_cached_summary(redis, customer_id)
+    if cached is not None:
+        return cached
+
     summary = await repo.get_summary(customer_id)
     if not summary:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Customer not found",
         )
+    await cache_summary(redis, summary)
     return summary
 
 
@@ -129,7 +167,7 @@ async def create_customer(
 ) -> CustomerResponse:
     """Create a new customer record."""
     customer = await repo.create(data)
-    return CustomerResponse.model_validate(customer)
+    return from_trusted_row(CustomerResponse, customer)
 
 
 @router.put(
@@ -141,6 +179,8 @@ async def update_customer(
     customer_id: str,
     data: CustomerUpdate,
     repo: CustomerRepo,
+    redis: RedisClient,
+    after_commit: AfterCommit,
 ) -> CustomerResponse:
     """Update a customer's details."""
     customer = await repo.update(customer_id, data)
@@ -149,4 +189,5 @@ async def update_customer(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Customer not found",
         )
-    return CustomerResponse.model_validate(customer)
+    after_commit.append(partial(invalidate_summary, redis, customer_id))
+    return from_trusted_row(CustomerResponse, customer)
@@ -1,23 +1,41 @@
 """Transaction API endpoints."""
 
-from fastapi import APIRouter, Depends, HTTPException, Request, status
+from functools import partial
+
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
 from fastapi_filter import FilterDepends
-from fastapi_pagination import Page
 from fastapi_pagination.ext.sqlalchemy import paginate as sqlalchemy_paginate
 
 from app.auth.dependencies import require_role
-from app.dependencies import AppSettings, DBSession, TransactionRepo
+from app.dependencies import AfterCommit, AppSettings, DBSession, RedisClient, TransactionRepo
 from app.filters.transaction import TransactionFilter
+from app.schemas.common import from_trusted_row
 from app.schemas.transaction import (
     TransactionCreate,
     TransactionCreateResponse,
+    TransactionCursorPage,
     TransactionResponse,
 )
+from app.services.summary_cache import invalidate_summary
 from app.services.transaction_service import TransactionService
 from app.utils.audit import audit_logged
+from app.utils.cache import TTLCache
 
 router = APIRouter()
 
+# Transactions are not edited through the API, so analysts re-opening the
+# same one are served from memory for a short while.
+TRANSACTION_CACHE_TTL_SECONDS = 30.0
+TRANSACTION_CACHE_MAX_ENTRIES = 10_000
+
+_transaction_cache: TTLCache[str, TransactionResponse] = TTLCache(
+    maxsize=TRANSACTION_CACHE_MAX_ENTRIES, ttl=TRANSACTION_CACHE_TTL_SECONDS
+)
+
+
+def _etag(txn: TransactionResponse) -> str:
+    return f'W/"{txn.updated_at.timestamp()}"'
+
 
 @router.post(
     "",
@@ -30,15 +48,19 @@ async def create_transaction(
     request: Request,
     db: DBSession,
     settings: AppSettings,
+    redis: RedisClient,
+    after_commit: AfterCommit,
 ) -> TransactionCreateResponse:
     """Create a transaction, persist it, evaluate via gRPC, and publish to Kafka."""
     service = TransactionService(
         db,
         settings,
         fraud_client=request.app.state.fraud_client,
-        kafka_producer=getattr(request.app.state, "kafka_producer", None),
+        kafka_publisher=getattr(request.app.state, "kafka_publisher", None),
     )
-    return await service.create_and_evaluate(data)
+    response = await service.create_and_evaluate(data, after_commit)
+    after_commit.append(partial(invalidate_summary, redis, data.customer_id))
+    return response
 
 
 @router.get(
@@ -48,27 +70,54 @@ async def create_transaction(
 )
 async def get_transaction(
     txn_id: str,
+    request: Request,
+    response: Response,
     repo: TransactionRepo,
-) -> TransactionResponse:
-    """Get a transaction by ID."""
-    txn = await repo.get_by_id(txn_id)
-    if not txn:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Transaction not found",
-        )
-    return TransactionResponse.model_validate(txn)
+) -> TransactionResponse | Response:
+    """Get a transaction by ID.
+
+    Responses carry a weak ``ETag`` derived from ``updated_at``; a matching
+    ``If-None-Match`` gets an empty ``304``.
+    """
+    txn = _transaction_cache.get(txn_id)
+    if txn is None:
+        row = await repo.get_by_id(txn_id)
+        if not row:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Transaction not found",
+            )
+        txn = from_trusted_row(TransactionResponse, row)
+        _transaction_cache.set(txn_id, txn)
+
+    headers = {
+        "ETag": _etag(txn),
+        "Cache-Control": f"private, max-age={int(TRANSACTION_CACHE_TTL_SECONDS)}",
+    }
+    if_none_match = request.headers.get("if-none-match", "")
+    if headers["ETag"] in (tag.strip() for tag in if_none_match.split(",")):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    response.headers.update(headers)
+    return txn
 
 
 @router.get(
     "",
-    response_model=Page[TransactionResponse],
+    response_model=TransactionCursorPage,
     dependencies=[Depends(require_role("admin", "analyst"))],
 )
 async def list_transactions(
     repo: TransactionRepo,
     filters: TransactionFilter = FilterDepends(TransactionFilter),
-) -> Page[TransactionResponse]:
-    """List transactions with optional filtering and pagination."""
+) -> TransactionCursorPage:
+    """List transactions with optional filtering.
+
+    Keyset-paginated, newest first: pass the response's ``next_page`` back
+    as ``?cursor=`` for the following page.  With the default ordering each
+    page is an index range scan however deep the client pages, and no COUNT
+    is issued, so the page carries no ``total``.  An ``?order_by=`` (NOT NULL
+    columns only) sorts ahead of the keyset; no index matches that order, so
+    Postgres sorts the filtered rows for every page.
+    """
     query = repo.get_list_query(filters)
     return await sqlalchemy_paginate(repo.session, query)  # type: ignore[no-any-return]
@@ -1,10 +1,11 @@
 """FastAPI dependencies for authentication and RBAC."""
 
+from functools import cache
 from typing import Annotated, Any
 
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
-from jose import JWTError
+from jwt import InvalidTokenError
 
 from app.auth.security import decode_token
 from app.schemas.auth import TokenUser
@@ -27,7 +28,7 @@ async def get_current_user(
         token_type: str | None = payload.get("type")
         if user_id is None or token_type != "access":
             raise credentials_exception
-    except JWTError as exc:
+    except InvalidTokenError as exc:
         raise credentials_exception from exc
 
     return TokenUser(
@@ -47,8 +48,15 @@ def require_role(*allowed_roles: str) -> Any:
 
     Usage:
         @router.post("/customers", dependencies=[Depends(require_role("admin"))])
+
+    The same role set (in any order) always returns the same checker, so
+    endpoints guarded alike share one dependency callable.
     """
+    return _role_checker(frozenset(allowed_roles))
+
 
+@cache
+def _role_checker(allowed_roles: frozenset[str]) -> Any:
     async def _check_role(current_user: CurrentUser) -> TokenUser:
         if current_user.role not in allowed_roles:
             raise HTTPException(
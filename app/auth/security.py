@@ -1,28 +1,69 @@
 """JWT token and password hashing utilities."""
 
-from datetime import UTC, datetime, timedelta
+import hashlib
+import hmac
+import secrets
+import time
 from typing import Any
 
 import bcrypt
-from jose import jwt
+import jwt
 
 from app.config import get_settings
+from app.utils.cache import TTLCache
 
 
 def hash_password(password: str) -> str:
-    """Hash a plain-text password with bcrypt."""
-    return bcrypt.hashpw(password.encode(), bcrypt.gensalt()).decode()
+    """Hash a plain-text password with bcrypt at ``settings.bcrypt_rounds``."""
+    salt = bcrypt.gensalt(rounds=get_settings().bcrypt_rounds)
+    return bcrypt.hashpw(password.encode(), salt).decode()
+
+
+# ---------------------------------------------------------------------------
+# Verified-credential cache — skips bcrypt for repeat logins
+# ---------------------------------------------------------------------------
+
+VERIFY_CACHE_TTL_SECONDS = 60.0
+VERIFY_CACHE_MAX_ENTRIES = 512
+
+# Per-process key so cached digests are useless outside this process
+_VERIFY_CACHE_KEY = secrets.token_bytes(32)
+
+# stored bcrypt hash -> keyed digest of the matching plain password
+_verified_cache: TTLCache[str, bytes] = TTLCache(
+    maxsize=VERIFY_CACHE_MAX_ENTRIES, ttl=VERIFY_CACHE_TTL_SECONDS
+)
+
+
+def _password_digest(plain_password: str) -> bytes:
+    return hashlib.blake2b(plain_password.encode(), key=_VERIFY_CACHE_KEY, digest_size=16).digest()
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
-    """Verify a plain-text password against a bcrypt hash."""
-    return bcrypt.checkpw(plain_password.encode(), hashed_password.encode())
+    """Verify a plain-text password against a bcrypt hash.
+
+    Successful verifications are cached for ``VERIFY_CACHE_TTL_SECONDS``,
+    keyed by the stored hash, so a password change invalidates the entry.
+    Failures are never cached and always pay the full bcrypt cost.
+    """
+    digest = _password_digest(plain_password)
+
+    cached_digest = _verified_cache.get(hashed_password)
+    if cached_digest is not None and hmac.compare_digest(cached_digest, digest):
+        return True
+
+    if not bcrypt.checkpw(plain_password.encode(), hashed_password.encode()):
+        return False
+
+    _verified_cache.set(hashed_password, digest)
+    return True
 
 
 def create_access_token(user_id: str, role: str, username: str = "", email: str = "") -> str:
     """Create a short-lived JWT access token."""
     settings = get_settings()
-    expire = datetime.now(UTC) + timedelta(minutes=settings.jwt_access_token_expire_minutes)
+    # PyJWT accepts a numeric ``exp``; skip building tz-aware datetimes.
+    expire = int(time.time()) + settings.jwt_access_token_expire_seconds
     payload = {
         "sub": user_id,
         "role": role,
@@ -31,13 +72,13 @@ def create_access_token(user_id: str, role: str, username: str = "", email: str
         "type": "access",
         "exp": expire,
     }
-    return str(jwt.encode(payload, settings.jwt_secret_key, algorithm=settings.jwt_algorithm))
+    return jwt.encode(payload, settings.jwt_secret_key, algorithm=settings.jwt_algorithm)
 
 
 def create_refresh_token(user_id: str, role: str, username: str = "", email: str = "") -> str:
     """Create a long-lived JWT refresh token."""
     settings = get_settings()
-    expire = datetime.now(UTC) + timedelta(minutes=settings.jwt_refresh_token_expire_minutes)
+    expire = int(time.time()) + settings.jwt_refresh_token_expire_seconds
     payload = {
         "sub": user_id,
         "role": role,
@@ -46,10 +87,34 @@ def create_refresh_token(user_id: str, role: str, username: str = "", email: str
         "type": "refresh",
         "exp": expire,
     }
-    return str(jwt.encode(payload, settings.jwt_secret_key, algorithm=settings.jwt_algorithm))
+    return jwt.encode(payload, settings.jwt_secret_key, algorithm=settings.jwt_algorithm)
+
+
+# ---------------------------------------------------------------------------
+# Decoded-token cache — skips signature verification for repeat requests
+# ---------------------------------------------------------------------------
+
+DECODE_CACHE_MAX_ENTRIES = 4096
+
+# raw token -> verified claims; each entry lives until the token's own ``exp``
+_decoded_cache: TTLCache[str, dict[str, Any]] = TTLCache(maxsize=DECODE_CACHE_MAX_ENTRIES, ttl=0.0)
 
 
 def decode_token(token: str) -> dict[str, Any]:
-    """Decode and validate a JWT token. Raises JWTError on failure."""
+    """Decode and validate a JWT token. Raises InvalidTokenError on failure.
+
+    Successfully verified claims are cached until the token expires, so a
+    client reusing its token skips the signature check.  Invalid tokens are
+    never cached.
+    """
+    cached = _decoded_cache.get(token)
+    if cached is not None:
+        return dict(cached)
+
     settings = get_settings()
-    return dict(jwt.decode(token, settings.jwt_secret_key, algorithms=[settings.jwt_algorithm]))
+    payload = jwt.decode(token, settings.jwt_secret_key, algorithms=[settings.jwt_algorithm])
+
+    exp = payload.get("exp")
+    if isinstance(exp, int | float):
+        _decoded_cache.set(token, payload, ttl=exp - time.time())
+    return dict(payload)
@@ -1,18 +1,27 @@
 """Dependency injection for FastAPI."""
 
-from collections.abc import AsyncGenerator
-from typing import TYPE_CHECKING, Annotated
+from collections.abc import AsyncGenerator, Awaitable, Callable
+from typing import Annotated
 
 from fastapi import Depends, Request
 from redis.asyncio import Redis
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from app.config import Settings, get_settings
+from app.repositories.account_repository import AccountRepository
+from app.repositories.customer_repository import CustomerRepository
+from app.repositories.transaction_repository import TransactionRepository
+from app.repositories.user_repository import UserRepository
 
 # ---------------------------------------------------------------------------
 # FastAPI dependencies — pull resources from app.state (set in lifespan)
 # ---------------------------------------------------------------------------
 
+AfterCommitHook = Callable[[], Awaitable[None]]
+
+# Key in ``AsyncSession.info`` holding the hooks queued for this request
+_AFTER_COMMIT_KEY = "after_commit_hooks"
+
 
 async def get_db_session(request: Request) -> AsyncGenerator[AsyncSession, None]:
     """Dependency that provides a database session from app.state.
@@ -21,6 +30,11 @@ async def get_db_session(request: Request) -> AsyncGenerator[AsyncSession, None]
     exception.  Repositories should call ``session.flush()`` (not
     ``session.commit()``) so that all writes within a single request
     are committed atomically.
+
+    Hooks queued through ``AfterCommit`` run only once the commit has
+    succeeded and are dropped on rollback, so side effects such as cache
+    invalidation never see uncommitted data.  Hooks must be best-effort:
+    the transaction is already committed when they run.
     """
     session_factory: async_sessionmaker[AsyncSession] = request.app.state.session_factory
     async with session_factory() as session:
@@ -28,8 +42,11 @@ async def get_db_session(request: Request) -> AsyncGenerator[AsyncSession, None]
             yield session
             await session.commit()
         except Exception:
+            session.info.pop(_AFTER_COMMIT_KEY, None)
             await session.rollback()
             raise
+        for hook in session.info.pop(_AFTER_COMMIT_KEY, []):
+            await hook()
 
 
 def get_redis(request: Request) -> "Redis":
@@ -45,42 +62,43 @@ RedisClient = Annotated[Redis, Depends(get_redis)]
 AppSettings = Annotated[Settings, Depends(get_settings)]
 
 
+def get_after_commit(db: DBSession) -> list[AfterCommitHook]:
+    """Dependency returning the request's after-commit hook queue.
+
+    Append a no-argument coroutine function; ``get_db_session`` awaits it
+    after committing the shared session.
+    """
+    hooks: list[AfterCommitHook] = db.info.setdefault(_AFTER_COMMIT_KEY, [])
+    return hooks
+
+
+AfterCommit = Annotated[list[AfterCommitHook], Depends(get_after_commit)]
+
+
 # ---------------------------------------------------------------------------
 # Repository dependencies (ARCH-001)
 # ---------------------------------------------------------------------------
 
 
-def get_customer_repo(db: DBSession) -> "CustomerRepository":
-    from app.repositories.customer_repository import CustomerRepository
-
+def get_customer_repo(db: DBSession) -> CustomerRepository:
     return CustomerRepository(db)
 
 
-def get_account_repo(db: DBSession) -> "AccountRepository":
-    from app.repositories.account_repository import AccountRepository
-
+def get_account_repo(db: DBSession) -> AccountRepository:
     return AccountRepository(db)
 
 
-def get_transaction_repo(db: DBSession) -> "TransactionRepository":
-    from app.repositories.transaction_repository import TransactionRepository
-
+def get_transaction_repo(db: DBSession) -> TransactionRepository:
     return TransactionRepository(db)
 
 
-def get_user_repo(db: DBSession) -> "UserRepository":
-    from app.repositories.user_repository import UserRepository
-
+def get_user_repo(db: DBSession) -> UserRepository:
     return UserRepository(db)
 
 
-if TYPE_CHECKING:
-    from app.repositories.account_repository import AccountRepository
-    from app.repositories.customer_repository import CustomerRepository
-    from app.repositories.transaction_repository import TransactionRepository
-    from app.repositories.user_repository import UserRepository
-
-CustomerRepo = Annotated["CustomerRepository", Depends(get_customer_repo)]
-AccountRepo = Annotated["AccountRepository", Depends(get_account_repo)]
-TransactionRepo = Annotated["TransactionRepository", Depends(get_transaction_repo)]
-UserRepo = Annotated["UserRepository", Depends(get_user_repo)]
+# FastAPI caches each dependency per request, so every handler parameter
+# annotated with one of these shares a single repository (and session).
+CustomerRepo = Annotated[CustomerRepository, Depends(get_customer_repo)]
+AccountRepo = Annotated[AccountRepository, Depends(get_account_repo)]
+TransactionRepo = Annotated[TransactionRepository, Depends(get_transaction_repo)]
+UserRepo = Annotated[UserRepository, Depends(get_user_repo)]
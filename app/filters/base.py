@@ -5,19 +5,100 @@ and omit a return-type annotation, so type checkers infer ``Query | Select``.
 Since we always use the modern ``select()`` API, the runtime return is always
 ``Select``.  This subclass adds the missing annotations in one place so
 repositories and pagination calls stay clean.
+
+It also resolves each filter field to its model column and operator once,
+when the subclass is defined, instead of fastapi-filter re-parsing field
+names and looking up columns on every request.
+
+``Constants.ordering_aliases`` maps public ``order_by`` names onto model
+attributes, so a renamed column keeps its old sort key (``-amount`` keeps
+sorting transactions by ``amount_cents``).  ``Constants.ordering_fields``,
+when set, is the closed set of attributes ``order_by`` may name.
 """
 
-from typing import Any
+import operator
+from collections.abc import Callable, Mapping
+from functools import partial
+from typing import Any, ClassVar
 
 from fastapi_filter.contrib.sqlalchemy import Filter as _UntypedFilter
-from sqlalchemy import Select
+from pydantic import ValidationInfo, field_validator
+from sqlalchemy import ColumnElement, Select
+
+# Field-name suffixes (``created_at__gte``) and the column operator they map to.
+_OPERATORS: dict[str, Callable[[Any, Any], ColumnElement[bool]]] = {
+    "eq": operator.eq,
+    "neq": operator.ne,
+    "gt": operator.gt,
+    "gte": operator.ge,
+    "lt": operator.lt,
+    "lte": operator.le,
+    "in": lambda column, value: column.in_(value),
+}
 
 
 class Filter(_UntypedFilter):
     """Typed shim over fastapi-filter's ``Filter``."""
 
+    class Constants(_UntypedFilter.Constants):
+        # Public order_by name -> model attribute it sorts on.
+        ordering_aliases: ClassVar[Mapping[str, str]] = {}
+        # Attributes order_by may sort on; None allows any model attribute.
+        ordering_fields: ClassVar[frozenset[str] | None] = None
+
+    _clauses: ClassVar[dict[str, Callable[[Any], ColumnElement[bool]]]] = {}
+
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs: Any) -> None:
+        super().__pydantic_init_subclass__(**kwargs)
+        model = getattr(cls.Constants, "model", None)
+        if model is None:
+            return
+        clauses: dict[str, Callable[[Any], ColumnElement[bool]]] = {}
+        for name in cls.model_fields:
+            if name == cls.Constants.ordering_field_name:
+                continue
+            column_name, _, suffix = name.partition("__")
+            column = getattr(model, column_name)
+            clauses[name] = partial(_OPERATORS[suffix or "eq"], column)
+        cls._clauses = clauses
+
+    # Same name as fastapi-filter's validator, so it replaces it.  It runs
+    # after the inherited split/strip validators, on the parsed list.
+    @field_validator("*", mode="after", check_fields=False)
+    @classmethod
+    def validate_order_by(cls, value: Any, field: ValidationInfo) -> Any:
+        """Resolve ``order_by`` aliases, then reject unknown or repeated fields."""
+        if field.field_name != cls.Constants.ordering_field_name:
+            return value
+        if not value:
+            return None
+        resolved: list[str] = []
+        seen: set[str] = set()
+        for entry in value:
+            direction = "-" if entry.startswith("-") else ""
+            name = entry.lstrip("+-")
+            name = cls.Constants.ordering_aliases.get(name, name)
+            allowed = cls.Constants.ordering_fields
+            if not hasattr(cls.Constants.model, name) or (
+                allowed is not None and name not in allowed
+            ):
+                raise ValueError(f"{name} is not a valid ordering field.")
+            if name in seen:
+                raise ValueError(
+                    f"Field names can appear at most once for "
+                    f"{cls.Constants.ordering_field_name}. The following was ambiguous: {name}."
+                )
+            seen.add(name)
+            resolved.append(direction + name)
+        return resolved
+
     def filter(self, query: Select[Any]) -> Select[Any]:  # type: ignore[override]
-        return super().filter(query)  # type: ignore[no-any-return]
+        for name, clause in self._clauses.items():
+            value = getattr(self, name)
+            if value is not None:
+                query = query.where(clause(value))
+        return query
 
     def sort(self, query: Select[Any]) -> Select[Any]:  # type: ignore[override]
         return super().sort(query)  # type: ignore[no-any-return]
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from app.filters.base import Filter
-from app.models.customer import Customer
+from app.models.customer import Customer, CustomerStatus, CustomerTier
 
 
 class CustomerFilter(Filter):
@@ -16,8 +16,8 @@ class CustomerFilter(Filter):
         ?order_by=created_at
     """
 
-    status: str | None = None
-    tier: str | None = None
+    status: CustomerStatus | None = None
+    tier: CustomerTier | None = None
     order_by: list[str] | None = None
 
     class Constants(Filter.Constants):
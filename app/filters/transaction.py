@@ -5,7 +5,7 @@ from __future__ import annotations
 from datetime import datetime
 
 from app.filters.base import Filter
-from app.models.transaction import Transaction
+from app.models.transaction import Channel, Transaction, TransactionType
 
 
 class TransactionFilter(Filter):
@@ -20,15 +20,24 @@ class TransactionFilter(Filter):
         ?created_at__gte=2024-01-01T00:00:00
         ?created_at__lte=2024-12-31T23:59:59
         ?order_by=-created_at
+        ?order_by=-amount
     """
 
     customer_id: str | None = None
     account_id: str | None = None
-    type: str | None = None
-    channel: str | None = None
+    type: TransactionType | None = None
+    channel: Channel | None = None
     created_at__gte: datetime | None = None
     created_at__lte: datetime | None = None
     order_by: list[str] | None = None
 
     class Constants(Filter.Constants):
         model = Transaction
+        # amount became amount_cents; ?order_by=amount keeps working.
+        ordering_aliases = {"amount": "amount_cents"}
+        # The listing is cursor-paginated and a NULL in the leading sort
+        # column breaks the cursor's row comparison (rows are skipped or
+        # repeated across pages), so only NOT NULL columns are sortable.
+        ordering_fields = frozenset(
+            column.key for column in Transaction.__table__.columns if not column.nullable
+        )
@@ -1,5 +1,9 @@
 """Async gRPC client for calling the Fraud Evaluation service."""
 
+import asyncio
+import itertools
+import json
+
 import grpc.aio
 
 from app.grpc.generated import fraud_evaluation_pb2, fraud_evaluation_pb2_grpc
@@ -7,20 +11,86 @@ from app.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Fraud checks sit on the synchronous transaction request path, so fail fast
+# rather than holding the request open.
+EVALUATE_TIMEOUT_SECONDS = 0.5
+
+# Retry connection-level failures inside the channel, within the call's
+# deadline. DEADLINE_EXCEEDED is not retryable: once the deadline has passed
+# gRPC has no budget left for another attempt.
+SERVICE_CONFIG = {
+    "methodConfig": [
+        {
+            "name": [{"service": "sentinel.fraud.FraudEvaluationService"}],
+            "timeout": f"{EVALUATE_TIMEOUT_SECONDS}s",
+            "retryPolicy": {
+                "maxAttempts": 3,
+                "initialBackoff": "0.05s",
+                "maxBackoff": "0.5s",
+                "backoffMultiplier": 2,
+                "retryableStatusCodes": ["UNAVAILABLE"],
+            },
+        }
+    ]
+}
+
+# Keepalive pings detect a dead connection without waiting for the RPC
+# timeout; a local subchannel pool stops the pooled channels to the same
+# target from sharing one TCP connection.
+CHANNEL_OPTIONS: list[tuple[str, int | str]] = [
+    ("grpc.keepalive_time_ms", 20_000),
+    ("grpc.keepalive_timeout_ms", 10_000),
+    ("grpc.http2.max_pings_without_data", 0),
+    ("grpc.http2.min_time_between_pings_ms", 10_000),
+    ("grpc.max_send_message_length", 16 * 1024 * 1024),
+    ("grpc.max_receive_message_length", 16 * 1024 * 1024),
+    ("grpc.use_local_subchannel_pool", 1),
+    ("grpc.enable_retries", 1),
+    ("grpc.service_config", json.dumps(SERVICE_CONFIG)),
+]
+
 
 class FraudEvaluationClient:
-    """Async wrapper around the gRPC FraudEvaluationService stub."""
+    """Async wrapper around the gRPC FraudEvaluationService stub.
 
-    def __init__(self, target: str):
+    Holds ``pool_size`` channels, each with its own connection, and spreads
+    RPCs across them round-robin so concurrent evaluations do not queue on
+    a single HTTP/2 connection.
+    """
+
+    def __init__(self, target: str, pool_size: int = 4):
         self._target = target
-        self._channel: grpc.aio.Channel | None = None
-        self._stub: fraud_evaluation_pb2_grpc.FraudEvaluationServiceStub | None = None
+        self._pool_size = max(1, pool_size)
+        self._channels: list[grpc.aio.Channel] = []
+        self._stubs: list[fraud_evaluation_pb2_grpc.FraudEvaluationServiceStub] = []
+        self._next = itertools.count()
+
+    def _open_channels(self) -> None:
+        if not self._stubs:
+            self._channels = [
+                grpc.aio.insecure_channel(self._target, options=CHANNEL_OPTIONS)
+                for _ in range(self._pool_size)
+            ]
+            self._stubs = [
+                fraud_evaluation_pb2_grpc.FraudEvaluationServiceStub(channel)
+                for channel in self._channels
+            ]
 
     def _get_stub(self) -> fraud_evaluation_pb2_grpc.FraudEvaluationServiceStub:
-        if self._stub is None:
-            self._channel = grpc.aio.insecure_channel(self._target)
-            self._stub = fraud_evaluation_pb2_grpc.FraudEvaluationServiceStub(self._channel)
-        return self._stub
+        self._open_channels()
+        return self._stubs[next(self._next) % len(self._stubs)]
+
+    async def connect(self, timeout: float) -> None:
+        """Open the channel pool and wait until every channel is connected.
+
+        Called at startup so the first evaluation does not pay connection
+        setup.  Raises ``TimeoutError`` if the service is not reachable
+        within *timeout* seconds; the channels keep retrying in the
+        background either way.
+        """
+        self._open_channels()
+        async with asyncio.timeout(timeout):
+            await asyncio.gather(*(channel.channel_ready() for channel in self._channels))
 
     async def evaluate(
         self,
@@ -36,9 +106,18 @@ class FraudEvaluationClient:
         location_country: str | None = None,
         ip_address: str | None = None,
         device_fingerprint: str | None = None,
-        timeout: float = 10.0,
+        timeout: float = EVALUATE_TIMEOUT_SECONDS,
     ) -> fraud_evaluation_pb2.EvaluateResponse:  # pyright: ignore[reportAttributeAccessIssue]
         """Call the fraud evaluation gRPC service and return the response."""
+        # Unset proto3 strings already read as "", so only pass the optional
+        # fields that carry a value instead of coercing each one.
+        optional = {
+            "merchant_name": merchant_name,
+            "merchant_category": merchant_category,
+            "location_country": location_country,
+            "ip_address": ip_address,
+            "device_fingerprint": device_fingerprint,
+        }
         request = fraud_evaluation_pb2.EvaluateRequest(  # pyright: ignore[reportAttributeAccessIssue]
             external_id=external_id,
             customer_id=customer_id,
@@ -46,11 +125,7 @@ class FraudEvaluationClient:
             currency=currency,
             transaction_type=transaction_type,
             channel=channel,
-            merchant_name=merchant_name or "",
-            merchant_category=merchant_category or "",
-            location_country=location_country or "",
-            ip_address=ip_address or "",
-            device_fingerprint=device_fingerprint or "",
+            **{name: value for name, value in optional.items() if value},
         )
 
         stub = self._get_stub()
@@ -58,7 +133,5 @@ class FraudEvaluationClient:
         return response
 
     async def close(self) -> None:
-        if self._channel is not None:
-            await self._channel.close()
-            self._channel = None
-            self._stub = None
+        channels, self._channels, self._stubs = self._channels, [], []
+        await asyncio.gather(*(channel.close() for channel in channels))
@@ -2,7 +2,8 @@
 
 from dataclasses import dataclass
 
-from redis.asyncio import Redis
+from redis.asyncio import BlockingConnectionPool, Redis
+from sqlalchemy import text
 from sqlalchemy.ext.asyncio import (
     AsyncEngine,
     AsyncSession,
@@ -18,24 +19,95 @@ from app.config import Settings
 
 
 def create_engine(settings: Settings) -> AsyncEngine:
-    """Create the async database engine."""
+    """Create the async database engine.
+
+    No pre-ping: checking a connection out costs no extra ``SELECT 1``
+    round-trip.  Connections are instead recycled after
+    ``db_pool_recycle_seconds``, so they never get old enough for a server
+    or proxy idle timeout to close them.  The pool is LIFO, so the most
+    recently used connections are handed out first and stay warm, with
+    their prepared-statement caches populated.
+
+    ``inet`` columns travel as text (``native_inet_types=False``), matching
+    the ``str`` the models declare, with no ``ipaddress`` object built per
+    row.
+    """
     return create_async_engine(
         str(settings.database_url),
         pool_size=settings.db_pool_size,
         max_overflow=settings.db_max_overflow,
-        pool_pre_ping=True,
+        pool_pre_ping=False,
+        pool_recycle=settings.db_pool_recycle_seconds,
+        pool_use_lifo=True,
+        native_inet_types=False,
         echo=settings.debug,
+        connect_args={
+            "prepared_statement_cache_size": settings.db_prepared_statement_cache_size,
+        },
     )
 
 
+async def warm_up_pool(engine: AsyncEngine, connections: int) -> None:
+    """Open *connections* pooled connections so early requests skip connect + auth.
+
+    The connections are held open together (otherwise the pool would hand
+    the same one back each time) and returned to the pool on exit.
+    """
+    opened = []
+    try:
+        for _ in range(connections):
+            conn = await engine.connect()
+            opened.append(conn)
+            await conn.execute(text("SELECT 1"))
+    finally:
+        for conn in opened:
+            await conn.close()
+
+
+async def ensure_transaction_partitions(engine: AsyncEngine, months_ahead: int) -> None:
+    """Create the ``transactions`` partitions for this month and the next *months_ahead*.
+
+    Idempotent; rows that already fell into ``transactions_default`` for
+    one of those months are moved into the new partition (migration 013).
+    """
+    async with engine.begin() as conn:
+        await conn.execute(
+            text(
+                "SELECT create_transactions_partition("
+                "(date_trunc('month', now() AT TIME ZONE 'UTC') + make_interval(months => m))::date"
+                ") FROM generate_series(0, :months_ahead) AS m"
+            ),
+            {"months_ahead": months_ahead},
+        )
+
+
 def create_session_factory(engine: AsyncEngine) -> async_sessionmaker[AsyncSession]:
     """Create session factory bound to *engine*."""
     return async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
 
 
+# Seconds an idle pooled connection may sit before it is PINGed on checkout
+REDIS_HEALTH_CHECK_INTERVAL_SECONDS = 30
+# Seconds a caller waits for a free pooled connection before erroring
+REDIS_POOL_TIMEOUT_SECONDS = 2.0
+
+
 def create_redis(settings: Settings) -> "Redis":
-    """Create the async Redis client."""
-    return Redis.from_url(str(settings.redis_url), decode_responses=True)  # type: ignore[no-any-return]
+    """Create the async Redis client.
+
+    Backed by a bounded blocking pool of ``settings.redis_pool_size``
+    connections, shared by everything holding this client (request
+    handlers, the rate limiter, the readiness probe).  When every
+    connection is busy, callers briefly wait for one instead of failing.
+    """
+    pool = BlockingConnectionPool.from_url(
+        str(settings.redis_url),
+        decode_responses=True,
+        max_connections=settings.redis_pool_size,
+        timeout=REDIS_POOL_TIMEOUT_SECONDS,
+        health_check_interval=REDIS_HEALTH_CHECK_INTERVAL_SECONDS,
+    )
+    return Redis(connection_pool=pool)
 
 
 # ---------------------------------------------------------------------------
@@ -1,34 +1,44 @@
 """FastAPI application entry point."""
 
+import asyncio
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI, Request, status
+from fastapi import Depends, FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 from fastapi_pagination import add_pagination
-from slowapi import Limiter, _rate_limit_exceeded_handler
-from slowapi.errors import RateLimitExceeded
-from slowapi.middleware import SlowAPIMiddleware
-from slowapi.util import get_remote_address
 from sqlalchemy.exc import IntegrityError
 
 from app.api.health import router as health_router
 from app.api.v1.router import api_router
 from app.config import get_settings
 from app.grpc.fraud_client import FraudEvaluationClient
-from app.infrastructure import create_engine, create_redis, create_session_factory
-from app.middleware import RequestIDMiddleware, SecurityHeadersMiddleware
-from app.services.kafka_producer import create_kafka_producer
+from app.infrastructure import (
+    create_engine,
+    create_redis,
+    create_session_factory,
+    ensure_transaction_partitions,
+    warm_up_pool,
+)
+from app.middleware import RequestContextMiddleware
+from app.services.kafka_producer import TransactionPublisher, create_kafka_producer
+from app.services.rate_limiter import enforce_rate_limit
 from app.utils.logging import get_logger, setup_logging
 
 settings = get_settings()
 logger = get_logger(__name__)
 
-# ---------------------------------------------------------------------------
-# Rate limiter (shared instance used by routers via app.state.limiter)
-# ---------------------------------------------------------------------------
-limiter = Limiter(key_func=get_remote_address, default_limits=["120/minute"])
+# Startup gives up pre-opening DB / gRPC connections after this long
+DB_WARM_UP_TIMEOUT_SECONDS = 5.0
+FRAUD_CLIENT_CONNECT_TIMEOUT_SECONDS = 5.0
+
+# Transaction partitions are kept this many months ahead of the current one
+TRANSACTION_PARTITION_MONTHS_AHEAD = 2
+
+# Browsers cache a preflight answer this long (Chromium caps it at 2 hours),
+# so the admin portal is not sending an OPTIONS ahead of every API call
+CORS_PREFLIGHT_MAX_AGE_SECONDS = 7200
 
 
 @asynccontextmanager
@@ -56,27 +66,52 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
 
     # gRPC fraud client (owned by app, not a module-level singleton)
     try:
-        app.state.fraud_client = FraudEvaluationClient(target=settings.fraud_grpc_target)
+        app.state.fraud_client = FraudEvaluationClient(
+            target=settings.fraud_grpc_target,
+            pool_size=settings.fraud_grpc_channel_pool_size,
+        )
     except Exception:
         logger.exception("Failed to initialise gRPC fraud client")
         await app.state.redis.aclose()
         await engine.dispose()
         raise
 
+    # Pre-open the DB pool (best-effort — connections are otherwise made lazily)
+    try:
+        async with asyncio.timeout(DB_WARM_UP_TIMEOUT_SECONDS):
+            await warm_up_pool(engine, settings.db_pool_size)
+    except Exception:
+        logger.warning("Database pool warm-up failed — connections will be opened on demand")
+
+    # Keep monthly transaction partitions ahead of time (best-effort — until
+    # they exist, new rows land in transactions_default)
+    try:
+        async with asyncio.timeout(DB_WARM_UP_TIMEOUT_SECONDS):
+            await ensure_transaction_partitions(engine, TRANSACTION_PARTITION_MONTHS_AHEAD)
+    except Exception:
+        logger.warning("Could not ensure transaction partitions", exc_info=True)
+
+    # Connect the fraud channels now (best-effort — they also connect on first use)
+    try:
+        await app.state.fraud_client.connect(timeout=FRAUD_CLIENT_CONNECT_TIMEOUT_SECONDS)
+    except Exception:
+        logger.warning("Fraud service not reachable at startup — channels will keep retrying")
+
     # Kafka producer (best-effort — service works without Kafka)
     try:
-        app.state.kafka_producer = await create_kafka_producer(settings)
+        app.state.kafka_publisher = TransactionPublisher(await create_kafka_producer(settings))
+        app.state.kafka_publisher.start()
     except Exception:
         logger.warning("Kafka producer failed to start — transactions won't be published")
-        app.state.kafka_producer = None
+        app.state.kafka_publisher = None
 
     yield
 
     # Shutdown — dispose every resource; ensure all run even if one fails
     logger.info("Shutting down Core Banking Service...")
     try:
-        if app.state.kafka_producer is not None:
-            await app.state.kafka_producer.stop()
+        if app.state.kafka_publisher is not None:
+            await app.state.kafka_publisher.stop()
     except Exception:
         logger.exception("Error closing Kafka producer")
     try:
@@ -145,16 +180,12 @@ def create_application() -> FastAPI:
         redoc_url="/redoc",
         openapi_url="/openapi.json",
         lifespan=lifespan,
+        # Redis token bucket per client IP, shared across workers
+        dependencies=[Depends(enforce_rate_limit)],
     )
 
-    # Rate limiter
-    app.state.limiter = limiter
-    app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)  # type: ignore[arg-type]  # slowapi typing mismatch
-    app.add_middleware(SlowAPIMiddleware)
-
     # Request ID and security headers (outermost = runs first)
-    app.add_middleware(RequestIDMiddleware)
-    app.add_middleware(SecurityHeadersMiddleware)
+    app.add_middleware(RequestContextMiddleware)
 
     # Configure CORS
     app.add_middleware(
@@ -165,6 +196,7 @@ def create_application() -> FastAPI:
         allow_credentials=True,
         allow_methods=["GET", "POST", "PUT", "DELETE", "OPTIONS"],
         allow_headers=["Authorization", "Content-Type", "X-Request-ID"],
+        max_age=CORS_PREFLIGHT_MAX_AGE_SECONDS,
     )
 
     # Exception handlers
@@ -1,77 +1,62 @@
 """ASGI middleware — pure ASGI implementations (no BaseHTTPMiddleware overhead)."""
 
-import uuid as _uuid
+import os
 
 from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from app.config import get_settings
 
-# ---------------------------------------------------------------------------
-# Request ID middleware
-# ---------------------------------------------------------------------------
-
-
-class RequestIDMiddleware:
-    """Inject a unique request ID into every request/response cycle."""
-
-    def __init__(self, app: ASGIApp) -> None:
-        self.app = app
-
-    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
-        if scope["type"] != "http":
-            await self.app(scope, receive, send)
-            return
+_SECURITY_HEADERS: tuple[tuple[bytes, bytes], ...] = (
+    (b"x-content-type-options", b"nosniff"),
+    (b"x-frame-options", b"DENY"),
+    (b"x-xss-protection", b"1; mode=block"),
+    (b"referrer-policy", b"strict-origin-when-cross-origin"),
+    (b"permissions-policy", b"geolocation=(), camera=(), microphone=()"),
+)
 
-        headers = dict(scope.get("headers", []))
-        request_id = headers.get(b"x-request-id", b"").decode() or str(_uuid.uuid4())
-        scope.setdefault("state", {})["request_id"] = request_id
+_HSTS_HEADER = (b"strict-transport-security", b"max-age=63072000; includeSubDomains; preload")
 
-        async def send_with_request_id(message: Message) -> None:
-            if message["type"] == "http.response.start":
-                response_headers = list(message.get("headers", []))
-                response_headers.append((b"x-request-id", request_id.encode()))
-                message["headers"] = response_headers
-            await send(message)
 
-        await self.app(scope, receive, send_with_request_id)
+def security_headers(*, production: bool) -> tuple[tuple[bytes, bytes], ...]:
+    """Return the encoded security headers, with HSTS only in production."""
+    return (*_SECURITY_HEADERS, _HSTS_HEADER) if production else _SECURITY_HEADERS
 
 
-# ---------------------------------------------------------------------------
-# Security headers middleware
-# ---------------------------------------------------------------------------
+def _find_header(scope: Scope, name: bytes) -> bytes | None:
+    """Return the first raw value of header *name* (lower-case), without building a dict."""
+    for key, value in scope.get("headers", ()):
+        if key == name:
+            return bytes(value)
+    return None
 
-_SECURITY_HEADERS: list[tuple[bytes, bytes]] = [
-    (b"x-content-type-options", b"nosniff"),
-    (b"x-frame-options", b"DENY"),
-    (b"x-xss-protection", b"1; mode=block"),
-    (b"referrer-policy", b"strict-origin-when-cross-origin"),
-    (b"permissions-policy", b"geolocation=(), camera=(), microphone=()"),
-]
 
+class RequestContextMiddleware:
+    """Tag every request with an ID and add security headers to the response.
 
-class SecurityHeadersMiddleware:
-    """Add standard security headers to every response."""
+    Accepts the caller's ``X-Request-ID`` or generates one, exposes it as
+    ``request.state.request_id``, and echoes it back alongside the standard
+    security headers.  One middleware means one ``send`` wrapper and one
+    header rewrite per response.  The security header set is fixed when
+    the middleware stack is built.
+    """
 
     def __init__(self, app: ASGIApp) -> None:
         self.app = app
+        self.security_headers = security_headers(production=get_settings().is_production)
 
     async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         if scope["type"] != "http":
             await self.app(scope, receive, send)
             return
 
-        async def send_with_security_headers(message: Message) -> None:
+        # 128 random bits as 32 hex chars; skips building and formatting a UUID
+        raw_request_id = _find_header(scope, b"x-request-id") or os.urandom(16).hex().encode()
+        scope.setdefault("state", {})["request_id"] = raw_request_id.decode("latin-1")
+        extra_headers = ((b"x-request-id", raw_request_id), *self.security_headers)
+
+        async def send_with_headers(message: Message) -> None:
             if message["type"] == "http.response.start":
-                response_headers = list(message.get("headers", []))
-                response_headers.extend(_SECURITY_HEADERS)
-                if get_settings().is_production:
-                    response_headers.append(
-                        (
-                            b"strict-transport-security",
-                            b"max-age=63072000; includeSubDomains; preload",
-                        )
-                    )
-                message["headers"] = response_headers
+                message["headers"] = [*message.get("headers", ()), *extra_headers]
             await send(message)
 
-        await self.app(scope, receive, send_with_security_headers)
+        await self.app(scope, receive, send_with_headers)
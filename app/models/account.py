@@ -2,13 +2,12 @@
 
 import enum
 from datetime import datetime
-from decimal import Decimal
 
-from sqlalchemy import DateTime, ForeignKey, Index, Numeric, String
+from sqlalchemy import BigInteger, DateTime, ForeignKey, Index, String
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from app.models.base import Base, TimestampMixin, UUIDMixin
+from app.models.base import Base, TimestampMixin, UUIDMixin, pg_enum
 
 
 class AccountType(enum.StrEnum):
@@ -35,14 +34,15 @@ class Account(UUIDMixin, TimestampMixin, Base):
         UUID(as_uuid=False),
         ForeignKey("customers.id", ondelete="CASCADE"),
         nullable=False,
-        index=True,
     )
     account_number: Mapped[str] = mapped_column(String(20), unique=True, index=True, nullable=False)
-    account_type: Mapped[str] = mapped_column(String(20), nullable=False)
+    account_type: Mapped[AccountType] = mapped_column(
+        pg_enum(AccountType, "account_type"), nullable=False
+    )
     currency: Mapped[str] = mapped_column(String(3), default="ZAR", nullable=False)
-    balance: Mapped[Decimal] = mapped_column(Numeric(15, 2), default=0, nullable=False)
-    status: Mapped[str] = mapped_column(
-        String(20), nullable=False, default=AccountStatus.active.value
+    balance_cents: Mapped[int] = mapped_column(BigInteger, default=0, nullable=False)
+    status: Mapped[AccountStatus] = mapped_column(
+        pg_enum(AccountStatus, "account_status"), nullable=False, default=AccountStatus.active
     )
     opened_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
     closed_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
@@ -2,10 +2,10 @@
 
 import enum
 
-from sqlalchemy import Boolean, String
+from sqlalchemy import Boolean, Index, String
 from sqlalchemy.orm import Mapped, mapped_column
 
-from app.models.base import Base, TimestampMixin, UUIDMixin
+from app.models.base import Base, TimestampMixin, UUIDMixin, pg_enum
 
 
 class UserRole(enum.StrEnum):
@@ -23,5 +23,25 @@ class AdminUser(UUIDMixin, TimestampMixin, Base):
     email: Mapped[str] = mapped_column(String(255), unique=True, nullable=False)
     hashed_password: Mapped[str] = mapped_column(String(255), nullable=False)
     full_name: Mapped[str] = mapped_column(String(255), nullable=False)
-    role: Mapped[str] = mapped_column(String(20), nullable=False, default=UserRole.viewer.value)
+    role: Mapped[UserRole] = mapped_column(
+        pg_enum(UserRole, "user_role"), nullable=False, default=UserRole.viewer
+    )
     is_active: Mapped[bool] = mapped_column(Boolean, nullable=False, default=True)
+
+    __table_args__ = (
+        # Covering index so the login lookup by username is index-only
+        Index(
+            "ix_admin_users_username_covering",
+            "username",
+            postgresql_include=[
+                "id",
+                "email",
+                "hashed_password",
+                "full_name",
+                "role",
+                "is_active",
+                "created_at",
+                "updated_at",
+            ],
+        ),
+    )
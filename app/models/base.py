@@ -1,10 +1,13 @@
 """SQLAlchemy base classes and mixins."""
 
+import enum
+import os
+import time
 from datetime import datetime
 from typing import Any
-from uuid import uuid4
+from uuid import UUID as PyUUID
 
-from sqlalchemy import DateTime, func
+from sqlalchemy import DateTime, Enum, func, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 
@@ -12,11 +15,23 @@ from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 class Base(DeclarativeBase):
     """Base for all models."""
 
+    # Fetch server-generated values (timestamps, ids) with INSERT/UPDATE ...
+    # RETURNING during flush, so writes never need a follow-up SELECT.
+    __mapper_args__ = {"eager_defaults": True}
+
     type_annotation_map = {
         dict[str, Any]: "JSONB",
     }
 
 
+def pg_enum(enum_cls: type[enum.StrEnum], name: str) -> Enum:
+    """Native Postgres ENUM column type: 4 bytes per row instead of a varchar.
+
+    Stores each member's *value* (SQLAlchemy defaults to the member name).
+    """
+    return Enum(enum_cls, name=name, values_callable=lambda members: [m.value for m in members])
+
+
 class TimestampMixin:
     """Adds created_at and updated_at columns with server defaults."""
 
@@ -33,11 +48,38 @@ class TimestampMixin:
     )
 
 
+def uuid7() -> PyUUID:
+    """Return a time-ordered UUIDv7 (RFC 9562): 48-bit Unix ms + 74 random bits."""
+    value = (time.time_ns() // 1_000_000) << 80 | int.from_bytes(os.urandom(10))
+    value = (value & ~(0xF << 76)) | (0x7 << 76)  # version 7
+    value = (value & ~(0x3 << 62)) | (0x2 << 62)  # RFC 4122 variant
+    return PyUUID(int=value)
+
+
 class UUIDMixin:
-    """Adds UUID primary key."""
+    """Adds a UUID primary key generated by Postgres (``gen_random_uuid()``).
+
+    No Python-side default: the flush leaves ``id`` out of the INSERT and
+    reads the generated value back through RETURNING.
+    """
+
+    id: Mapped[str] = mapped_column(
+        UUID(as_uuid=False),
+        primary_key=True,
+        server_default=text("gen_random_uuid()"),
+    )
+
+
+class UUIDv7Mixin:
+    """Adds a time-ordered UUIDv7 primary key.
+
+    For append-heavy tables: new keys land on the rightmost btree page
+    instead of random ones.
+    """
 
     id: Mapped[str] = mapped_column(
         UUID(as_uuid=False),
         primary_key=True,
-        default=lambda: str(uuid4()),
+        default=lambda: str(uuid7()),
+        server_default=text("uuidv7()"),
     )
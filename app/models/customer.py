@@ -6,7 +6,7 @@ from datetime import date, datetime
 from sqlalchemy import Date, DateTime, Index, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from app.models.base import Base, TimestampMixin, UUIDMixin
+from app.models.base import Base, TimestampMixin, UUIDMixin, pg_enum
 
 
 class KYCStatus(enum.StrEnum):
@@ -46,18 +46,18 @@ class Customer(UUIDMixin, TimestampMixin, Base):
     phone: Mapped[str] = mapped_column(String(20), nullable=False)
     id_number: Mapped[str] = mapped_column(String(20), unique=True, nullable=False)
     date_of_birth: Mapped[date] = mapped_column(Date, nullable=False)
-    kyc_status: Mapped[str] = mapped_column(
-        String(20), nullable=False, default=KYCStatus.pending.value
+    kyc_status: Mapped[KYCStatus] = mapped_column(
+        pg_enum(KYCStatus, "kyc_status"), nullable=False, default=KYCStatus.pending
     )
-    tier: Mapped[str] = mapped_column(
-        String(20), nullable=False, default=CustomerTier.standard.value
+    tier: Mapped[CustomerTier] = mapped_column(
+        pg_enum(CustomerTier, "customer_tier"), nullable=False, default=CustomerTier.standard
     )
     segment: Mapped[str | None] = mapped_column(String(100), nullable=True)
-    risk_rating: Mapped[str] = mapped_column(
-        String(20), nullable=False, default=RiskRating.low.value
+    risk_rating: Mapped[RiskRating] = mapped_column(
+        pg_enum(RiskRating, "risk_rating"), nullable=False, default=RiskRating.low
     )
-    status: Mapped[str] = mapped_column(
-        String(20), nullable=False, default=CustomerStatus.active.value
+    status: Mapped[CustomerStatus] = mapped_column(
+        pg_enum(CustomerStatus, "customer_status"), nullable=False, default=CustomerStatus.active
     )
     onboarded_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
 
@@ -1,13 +1,13 @@
 """Transaction model."""
 
 import enum
-from decimal import Decimal
+from datetime import datetime
 
-from sqlalchemy import ForeignKey, Index, Numeric, String
+from sqlalchemy import BigInteger, DateTime, ForeignKey, Index, PrimaryKeyConstraint, String, func
 from sqlalchemy.dialects.postgresql import INET, UUID
 from sqlalchemy.orm import Mapped, mapped_column
 
-from app.models.base import Base, TimestampMixin, UUIDMixin
+from app.models.base import Base, TimestampMixin, UUIDv7Mixin, pg_enum
 
 
 class TransactionType(enum.StrEnum):
@@ -34,39 +34,65 @@ class TransactionStatus(enum.StrEnum):
     reversed = "reversed"
 
 
-class Transaction(UUIDMixin, TimestampMixin, Base):
-    """Financial transaction."""
+class Transaction(UUIDv7Mixin, TimestampMixin, Base):
+    """Financial transaction.
+
+    The table is range-partitioned by ``created_at`` (monthly), so
+    ``created_at`` is part of the primary key.  ``external_id`` uniqueness is
+    enforced across partitions by the ``transaction_external_ids`` claim
+    table (see migration ``005_partition_transactions``).
+    """
 
     __tablename__ = "transactions"
 
-    external_id: Mapped[str] = mapped_column(String(100), unique=True, index=True, nullable=False)
+    external_id: Mapped[str] = mapped_column(String(100), index=True, nullable=False)
     account_id: Mapped[str] = mapped_column(
         UUID(as_uuid=False),
         ForeignKey("accounts.id", ondelete="CASCADE"),
         nullable=False,
-        index=True,
     )
-    customer_id: Mapped[str] = mapped_column(
-        UUID(as_uuid=False),
-        ForeignKey("customers.id", ondelete="CASCADE"),
-        nullable=False,
-        index=True,
+    # Denormalised from accounts.customer_id for per-customer queries; no FK,
+    # deleting a customer reaches its transactions through accounts.
+    customer_id: Mapped[str] = mapped_column(UUID(as_uuid=False), nullable=False)
+    type: Mapped[TransactionType] = mapped_column(
+        pg_enum(TransactionType, "transaction_type"), nullable=False
     )
-    type: Mapped[str] = mapped_column(String(20), nullable=False)
-    amount: Mapped[Decimal] = mapped_column(Numeric(15, 2), nullable=False)
+    amount_cents: Mapped[int] = mapped_column(BigInteger, nullable=False)
     currency: Mapped[str] = mapped_column(String(3), default="ZAR", nullable=False)
     merchant_name: Mapped[str | None] = mapped_column(String(255), nullable=True)
     merchant_category: Mapped[str | None] = mapped_column(String(50), nullable=True)
-    channel: Mapped[str] = mapped_column(String(20), nullable=False)
+    channel: Mapped[Channel] = mapped_column(
+        pg_enum(Channel, "transaction_channel"), nullable=False
+    )
     country_code: Mapped[str] = mapped_column(String(2), default="ZA", nullable=False)
     ip_address: Mapped[str | None] = mapped_column(INET, nullable=True)
     device_id: Mapped[str | None] = mapped_column(String(255), nullable=True)
-    status: Mapped[str] = mapped_column(
-        String(20), nullable=False, default=TransactionStatus.completed.value
+    status: Mapped[TransactionStatus] = mapped_column(
+        pg_enum(TransactionStatus, "transaction_status"),
+        nullable=False,
+        default=TransactionStatus.completed,
     )
     description: Mapped[str | None] = mapped_column(String(500), nullable=True)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        primary_key=True,
+        server_default=func.now(),
+        nullable=False,
+    )
 
     __table_args__ = (
-        Index("idx_txn_customer_created", "customer_id", "created_at"),
-        Index("idx_txn_account_created", "account_id", "created_at"),
+        PrimaryKeyConstraint("id", "created_at"),
+        # Per-customer/per-account feeds: keyed in full keyset order, so a
+        # page is a backward range scan with no sort.  amount_cents is carried
+        # so the customer summary's 30-day aggregate is an index-only scan.
+        Index(
+            "idx_txn_customer_created",
+            "customer_id",
+            "created_at",
+            "id",
+            postgresql_include=["amount_cents"],
+        ),
+        Index("idx_txn_account_created", "account_id", "created_at", "id"),
+        Index("idx_txn_created_id", "created_at", "id"),
+        {"postgresql_partition_by": "RANGE (created_at)"},
     )
@@ -1,10 +1,22 @@
 """Repository for account data access."""
 
-from sqlalchemy import select
+from sqlalchemy import bindparam, exists, lambda_stmt, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.account import Account
 from app.schemas.account import AccountCreate, AccountUpdate
+from app.utils.money import to_cents
+
+# Hot lookups built once as lambda statements: each call reuses the cached
+# statement and compiled SQL instead of constructing a new ``Select``.
+_GET_BY_ID = lambda_stmt(lambda: select(Account).where(Account.id == bindparam("id")))
+_GET_BY_CUSTOMER = lambda_stmt(
+    lambda: (
+        select(Account)
+        .where(Account.customer_id == bindparam("customer_id"))
+        .order_by(Account.opened_at.desc())
+    )
+)
 
 
 class AccountRepository:
@@ -14,22 +26,26 @@ class AccountRepository:
         self.session = session
 
     async def get_by_id(self, account_id: str) -> Account | None:
-        result = await self.session.execute(select(Account).where(Account.id == account_id))
+        result = await self.session.execute(_GET_BY_ID, {"id": account_id})
         return result.scalar_one_or_none()
 
+    async def exists(self, account_id: str) -> bool:
+        """Cheap existence check — no row is loaded."""
+        result = await self.session.execute(select(exists().where(Account.id == account_id)))
+        return bool(result.scalar())
+
     async def get_by_customer(self, customer_id: str) -> list[Account]:
-        result = await self.session.execute(
-            select(Account)
-            .where(Account.customer_id == customer_id)
-            .order_by(Account.opened_at.desc())
-        )
+        result = await self.session.execute(_GET_BY_CUSTOMER, {"customer_id": customer_id})
         return list(result.scalars().all())
 
     async def create(self, data: AccountCreate) -> Account:
-        account = Account(**data.model_dump())
+        # The write schemas are flat, so the validated field values are used
+        # as-is; model_dump() would walk the serialisation schema to copy them.
+        values = dict(data)
+        balance = values.pop("balance")
+        account = Account(**values, balance_cents=to_cents(balance))
         self.session.add(account)
         await self.session.flush()
-        await self.session.refresh(account)
         return account
 
     async def update(self, account_id: str, data: AccountUpdate) -> Account | None:
@@ -37,9 +53,8 @@ class AccountRepository:
         if not account:
             return None
 
-        for field, value in data.model_dump(exclude_unset=True).items():
-            setattr(account, field, value)
+        for field in data.model_fields_set:
+            setattr(account, field, getattr(data, field))
 
         await self.session.flush()
-        await self.session.refresh(account)
         return account
@@ -1,10 +1,10 @@
 """Repository for customer data access."""
 
-import asyncio
 from datetime import UTC, datetime, timedelta
+from decimal import Decimal
 from typing import Any
 
-from sqlalchemy import Select, func, select
+from sqlalchemy import Select, bindparam, exists, func, lambda_stmt, select, true
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.filters.customer import CustomerFilter
@@ -12,6 +12,10 @@ from app.models.account import Account
 from app.models.customer import Customer
 from app.models.transaction import Transaction
 from app.schemas.customer import CustomerCreate, CustomerSummary, CustomerUpdate
+from app.utils.money import from_cents
+
+# Built once; see the note on the account repository's lambda statements.
+_GET_BY_ID = lambda_stmt(lambda: select(Customer).where(Customer.id == bindparam("id")))
 
 
 class CustomerRepository:
@@ -27,14 +31,18 @@ class CustomerRepository:
         return query
 
     async def get_by_id(self, customer_id: str) -> Customer | None:
-        result = await self.session.execute(select(Customer).where(Customer.id == customer_id))
+        result = await self.session.execute(_GET_BY_ID, {"id": customer_id})
         return result.scalar_one_or_none()
 
+    async def exists(self, customer_id: str) -> bool:
+        """Cheap existence check — no row is loaded."""
+        result = await self.session.execute(select(exists().where(Customer.id == customer_id)))
+        return bool(result.scalar())
+
     async def create(self, data: CustomerCreate) -> Customer:
-        customer = Customer(**data.model_dump())
+        customer = Customer(**dict(data))
         self.session.add(customer)
         await self.session.flush()
-        await self.session.refresh(customer)
         return customer
 
     async def update(self, customer_id: str, data: CustomerUpdate) -> Customer | None:
@@ -42,47 +50,67 @@ class CustomerRepository:
         if not customer:
             return None
 
-        for field, value in data.model_dump(exclude_unset=True).items():
-            setattr(customer, field, value)
+        for field in data.model_fields_set:
+            setattr(customer, field, getattr(data, field))
 
         await self.session.flush()
-        await self.session.refresh(customer)
         return customer
 
     async def get_summary(self, customer_id: str) -> CustomerSummary | None:
-        customer = await self.get_by_id(customer_id)
-        if not customer:
-            return None
-
-        thirty_days_ago = datetime.now(UTC) - timedelta(days=30)
-
-        # Run account lookup and transaction stats concurrently (2 queries, not 3)
-        accounts_result, txn_result = await asyncio.gather(
-            self.session.execute(
-                select(Account.account_number, Account.account_type)
-                .where(Account.customer_id == customer_id)
-                .order_by(Account.opened_at.asc())
-            ),
-            self.session.execute(
-                select(
-                    func.count().label("count"),
-                    func.coalesce(func.sum(Transaction.amount), 0).label("total"),
-                    func.coalesce(func.avg(Transaction.amount), 0).label("avg"),
-                )
-                .where(Transaction.customer_id == customer_id)
-                .where(Transaction.created_at >= thirty_days_ago)
-            ),
+        """Build the customer summary in a single round-trip.
+
+        The customer row, account count, primary (oldest) account and
+        30-day transaction stats come back as one row: the primary account
+        is a LIMIT 1 derived table left-joined on true, and the stats are
+        an aggregate derived table, which always yields exactly one row.
+        """
+        now = datetime.now(UTC)
+        thirty_days_ago = now - timedelta(days=30)
+
+        account_count = (
+            select(func.count())
+            .where(Account.customer_id == customer_id)
+            .scalar_subquery()
+            .label("account_count")
         )
-
-        accounts = accounts_result.all()
-        account_count = len(accounts)
-        primary_account_number = accounts[0].account_number if accounts else None
-        primary_account_type = accounts[0].account_type if accounts else None
-        txn_stats = txn_result.one()
-
-        account_age_days = (
-            (datetime.now(UTC) - customer.onboarded_at).days if customer.onboarded_at else 0
+        primary_account = (
+            select(Account.account_number, Account.account_type)
+            .where(Account.customer_id == customer_id)
+            .order_by(Account.opened_at.asc())
+            .limit(1)
+            .subquery("primary_account")
+        )
+        txn_stats = (
+            select(
+                func.count().label("txn_count"),
+                func.coalesce(func.sum(Transaction.amount_cents), 0).label("txn_total"),
+                func.coalesce(func.avg(Transaction.amount_cents), 0).label("txn_avg"),
+            )
+            .where(Transaction.customer_id == customer_id)
+            .where(Transaction.created_at >= thirty_days_ago)
+            .subquery("txn_stats")
         )
+        result = await self.session.execute(
+            select(
+                Customer,
+                account_count,
+                primary_account.c.account_number,
+                primary_account.c.account_type,
+                txn_stats.c.txn_count,
+                txn_stats.c.txn_total,
+                txn_stats.c.txn_avg,
+            )
+            .select_from(Customer)
+            .outerjoin(primary_account, true())
+            .join(txn_stats, true())
+            .where(Customer.id == customer_id)
+        )
+        row = result.one_or_none()
+        if row is None:
+            return None
+        customer = row.Customer
+
+        account_age_days = (now - customer.onboarded_at).days if customer.onboarded_at else 0
 
         return CustomerSummary(
             customer_id=customer.id,
@@ -90,11 +118,11 @@ class CustomerRepository:
             tier=customer.tier,
             kyc_status=customer.kyc_status,
             account_age_days=account_age_days,
-            total_accounts=account_count,
-            total_transactions_30d=int(txn_stats[0]),
-            total_spend_30d=f"{txn_stats[1]:.2f}",
-            avg_transaction_amount=f"{txn_stats[2]:.2f}",
+            total_accounts=row.account_count,
+            total_transactions_30d=int(row.txn_count),
+            total_spend_30d=str(from_cents(row.txn_total)),
+            avg_transaction_amount=f"{Decimal(row.txn_avg).scaleb(-2):.2f}",
             risk_rating=customer.risk_rating,
-            primary_account_number=primary_account_number,
-            primary_account_type=primary_account_type,
+            primary_account_number=row.account_number,
+            primary_account_type=row.account_type,
         )
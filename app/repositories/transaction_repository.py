@@ -2,12 +2,25 @@
 
 from typing import Any
 
-from sqlalchemy import Select, select
+from sqlalchemy import Select, bindparam, lambda_stmt, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.filters.transaction import TransactionFilter
 from app.models.transaction import Transaction
 from app.schemas.transaction import TransactionCreate
+from app.utils.money import to_cents
+
+# Newest first, with ``id`` as the tie-breaker so the ordering is total; the
+# cursor then seeks on ``(created_at, id)`` using idx_txn_created_id, or the
+# per-customer/per-account idx_txn_*_created when scoped.
+KEYSET_ORDER = (Transaction.created_at.desc(), Transaction.id.desc())
+
+# The listings serialise columns only, so they select plain rows: no ORM
+# instance, identity-map entry or attribute instrumentation per row.
+_LIST_COLUMNS = tuple(Transaction.__table__.columns)
+
+# Built once; see the note on the account repository's lambda statements.
+_GET_BY_ID = lambda_stmt(lambda: select(Transaction).where(Transaction.id == bindparam("id")))
 
 
 class TransactionRepository:
@@ -17,28 +30,33 @@ class TransactionRepository:
         self.session = session
 
     async def get_by_id(self, txn_id: str) -> Transaction | None:
-        result = await self.session.execute(select(Transaction).where(Transaction.id == txn_id))
+        result = await self.session.execute(_GET_BY_ID, {"id": txn_id})
         return result.scalar_one_or_none()
 
     def get_list_query(self, filters: TransactionFilter) -> Select[Any]:
-        """Return a filtered + sorted query — pagination handled by the library."""
-        query = filters.filter(select(Transaction))
+        """Return a filtered, keyset-ordered query — pagination handled by the library.
+
+        Yields column rows rather than ``Transaction`` entities.  Any
+        ``order_by`` from the filter (NOT NULL columns only, see
+        ``TransactionFilter``) sorts first; ``KEYSET_ORDER`` is always
+        appended so the ordering stays total for the cursor.
+        """
+        query = filters.filter(select(*_LIST_COLUMNS))
         query = filters.sort(query)
-        return query
+        return query.order_by(*KEYSET_ORDER)
 
     def get_by_customer_query(self, customer_id: str) -> Select[Any]:
-        """Return a query for transactions belonging to a customer."""
-        filters = TransactionFilter(customer_id=customer_id)
-        return self.get_list_query(filters)
+        """Return a keyset-ordered query for transactions belonging to a customer."""
+        return self.get_list_query(TransactionFilter(customer_id=customer_id))
 
     def get_by_account_query(self, account_id: str) -> Select[Any]:
-        """Return a query for transactions belonging to an account."""
-        filters = TransactionFilter(account_id=account_id)
-        return self.get_list_query(filters)
+        """Return a keyset-ordered query for transactions belonging to an account."""
+        return self.get_list_query(TransactionFilter(account_id=account_id))
 
     async def create(self, data: TransactionCreate) -> Transaction:
-        txn = Transaction(**data.model_dump())
+        values = dict(data)
+        amount = values.pop("amount")
+        txn = Transaction(**values, amount_cents=to_cents(amount))
         self.session.add(txn)
         await self.session.flush()
-        await self.session.refresh(txn)
         return txn
@@ -1,10 +1,16 @@
 """Repository for admin user data access."""
 
-from sqlalchemy import select
+from sqlalchemy import bindparam, lambda_stmt, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.admin_user import AdminUser
 
+# Built once; see the note on the account repository's lambda statements.
+_GET_BY_USERNAME = lambda_stmt(
+    lambda: select(AdminUser).where(AdminUser.username == bindparam("username"))
+)
+_GET_BY_ID = lambda_stmt(lambda: select(AdminUser).where(AdminUser.id == bindparam("id")))
+
 
 class UserRepository:
     """Data access layer for admin users."""
@@ -13,15 +19,14 @@ class UserRepository:
         self.session = session
 
     async def get_by_username(self, username: str) -> AdminUser | None:
-        result = await self.session.execute(select(AdminUser).where(AdminUser.username == username))
+        result = await self.session.execute(_GET_BY_USERNAME, {"username": username})
         return result.scalar_one_or_none()
 
     async def get_by_id(self, user_id: str) -> AdminUser | None:
-        result = await self.session.execute(select(AdminUser).where(AdminUser.id == user_id))
+        result = await self.session.execute(_GET_BY_ID, {"id": user_id})
         return result.scalar_one_or_none()
 
     async def create(self, user: AdminUser) -> AdminUser:
         self.session.add(user)
         await self.session.flush()
-        await self.session.refresh(user)
         return user
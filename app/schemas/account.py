@@ -3,9 +3,10 @@
 from datetime import datetime
 from decimal import Decimal
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, computed_field
 
 from app.models.account import AccountStatus, AccountType
+from app.utils.money import from_cents
 
 
 class AccountCreate(BaseModel):
@@ -34,7 +35,7 @@ class AccountResponse(BaseModel):
     account_number: str
     account_type: str
     currency: str
-    balance: Decimal
+    balance_cents: int
     status: str
     opened_at: datetime
     closed_at: datetime | None
@@ -42,3 +43,8 @@ class AccountResponse(BaseModel):
     updated_at: datetime
 
     model_config = {"from_attributes": True}
+
+    @computed_field  # type: ignore[prop-decorator]
+    @property
+    def balance(self) -> Decimal:
+        return from_cents(self.balance_cents)
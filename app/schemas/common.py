@@ -1 +1,31 @@
 """Common schemas shared across the API."""
+
+from collections.abc import Callable
+from functools import cache
+from operator import attrgetter
+from typing import Any
+
+from pydantic import BaseModel
+
+
+@cache
+def _row_reader(
+    model_cls: type[BaseModel], skip: tuple[str, ...]
+) -> tuple[tuple[str, ...], Callable[[Any], tuple[Any, ...]]]:
+    """Field names of *model_cls* (minus *skip*) and one getter reading them all."""
+    names = tuple(name for name in model_cls.model_fields if name not in skip)
+    if len(names) == 1:
+        return names, lambda row: (getattr(row, names[0]),)
+    return names, attrgetter(*names)
+
+
+def from_trusted_row[M: BaseModel](model_cls: type[M], row: Any, **values: Any) -> M:
+    """Build *model_cls* from an ORM row without re-running validation.
+
+    Only for rows read from, or just flushed to, the database, whose column
+    types already satisfy the response schema.  Fields not on the row are
+    passed as *values*.  Request payloads and anything built in Python must
+    keep going through ``model_validate``.
+    """
+    names, read = _row_reader(model_cls, tuple(values))
+    return model_cls.model_construct(**dict(zip(names, read(row), strict=True)), **values)
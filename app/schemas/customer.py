@@ -6,6 +6,9 @@ from pydantic import BaseModel, EmailStr, Field
 
 from app.models.customer import CustomerStatus, CustomerTier, KYCStatus, RiskRating
 
+# South African mobile number in E.164 form.
+PHONE_PATTERN = r"^\+27\d{9}$"
+
 
 class CustomerCreate(BaseModel):
     """Request schema for creating a customer."""
@@ -14,7 +17,7 @@ class CustomerCreate(BaseModel):
     first_name: str = Field(min_length=1, max_length=100)
     last_name: str = Field(min_length=1, max_length=100)
     email: EmailStr
-    phone: str = Field(pattern=r"^\+27\d{9}$")
+    phone: str = Field(pattern=PHONE_PATTERN)
     id_number: str = Field(min_length=13, max_length=13, pattern=r"^\d{13}$")
     date_of_birth: date
     kyc_status: KYCStatus = KYCStatus.pending
@@ -31,7 +34,7 @@ class CustomerUpdate(BaseModel):
     first_name: str | None = None
     last_name: str | None = None
     email: EmailStr | None = None
-    phone: str | None = Field(default=None, pattern=r"^\+27\d{9}$")
+    phone: str | None = Field(default=None, pattern=PHONE_PATTERN)
     kyc_status: KYCStatus | None = None
     tier: CustomerTier | None = None
     segment: str | None = None
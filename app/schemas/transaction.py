@@ -2,11 +2,18 @@
 
 from datetime import datetime
 from decimal import Decimal
-from ipaddress import IPv4Address, IPv6Address
 
-from pydantic import BaseModel, Field, field_serializer
+from fastapi_pagination.cursor import CursorPage
+from fastapi_pagination.customization import (
+    CustomizedPage,
+    UseExcludedFields,
+    UseIncludeTotal,
+    UseName,
+)
+from pydantic import BaseModel, Field, computed_field
 
 from app.models.transaction import Channel, TransactionType
+from app.utils.money import from_cents
 
 
 class TransactionCreate(BaseModel):
@@ -35,13 +42,15 @@ class TransactionResponse(BaseModel):
     account_id: str
     customer_id: str
     type: str
-    amount: Decimal
+    amount_cents: int
     currency: str
     merchant_name: str | None
     merchant_category: str | None
     channel: str
     country_code: str
-    ip_address: str | IPv4Address | IPv6Address | None
+    # inet arrives from the driver as text (native_inet_types=False), so
+    # this serializes natively with no per-row Python conversion.
+    ip_address: str | None
     device_id: str | None
     status: str
     description: str | None
@@ -50,10 +59,19 @@ class TransactionResponse(BaseModel):
 
     model_config = {"from_attributes": True}
 
-    @field_serializer("ip_address")
-    @classmethod
-    def serialize_ip(cls, v: str | IPv4Address | IPv6Address | None) -> str | None:
-        return str(v) if v is not None else None
+    @computed_field  # type: ignore[prop-decorator]
+    @property
+    def amount(self) -> Decimal:
+        return from_cents(self.amount_cents)
+
+
+# Keyset page for per-customer/per-account history: no COUNT(*), so no total.
+TransactionCursorPage = CustomizedPage[
+    CursorPage[TransactionResponse],
+    UseIncludeTotal(False),
+    UseExcludedFields("total"),
+    UseName("TransactionCursorPage"),
+]
 
 
 class FraudEvaluationResult(BaseModel):
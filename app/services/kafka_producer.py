@@ -1,6 +1,9 @@
 """Async Kafka producer for publishing transaction events."""
 
+import asyncio
+import contextlib
 import json
+from functools import partial
 
 from aiokafka import AIOKafkaProducer
 
@@ -11,13 +14,36 @@ logger = get_logger(__name__)
 
 TOPIC_TRANSACTIONS_RAW = "transactions.raw"
 
+# Wait up to 20 ms for more records so concurrent requests share a batch
+KAFKA_LINGER_MS = 20
+KAFKA_MAX_BATCH_BYTES = 128 * 1024
+# Compress whole batches of JSON events.  gzip needs no extra codec package
+# (lz4/zstd would), and compression runs on the background publisher task.
+KAFKA_COMPRESSION_TYPE = "gzip"
+
+# Events waiting for the producer; once full, new events are dropped (and
+# logged) rather than holding up the request that raised them.
+PUBLISH_QUEUE_MAX_EVENTS = 10_000
+# On shutdown, how long queued events get to reach the producer.
+PUBLISH_QUEUE_DRAIN_TIMEOUT_SECONDS = 5.0
+
+# Built once: json.dumps(..., default=str) constructs a new encoder per call.
+_JSON_ENCODER = json.JSONEncoder(default=str, separators=(",", ":"))
+
+
+def _serialize_value(value: object) -> bytes:
+    return _JSON_ENCODER.encode(value).encode("utf-8")
+
 
 async def create_kafka_producer(settings: Settings) -> AIOKafkaProducer:
     """Create and start a Kafka producer. Caller owns the lifecycle."""
     producer = AIOKafkaProducer(
         bootstrap_servers=settings.kafka_bootstrap_servers,
-        value_serializer=lambda v: json.dumps(v, default=str).encode("utf-8"),
+        value_serializer=_serialize_value,
         key_serializer=lambda k: k.encode("utf-8") if k else None,
+        linger_ms=KAFKA_LINGER_MS,
+        max_batch_size=KAFKA_MAX_BATCH_BYTES,
+        compression_type=KAFKA_COMPRESSION_TYPE,
     )
     await producer.start()
     logger.info("Kafka producer started")
@@ -27,11 +53,86 @@ async def create_kafka_producer(settings: Settings) -> AIOKafkaProducer:
 async def publish_transaction(
     producer: AIOKafkaProducer, transaction_data: dict[str, object]
 ) -> None:
-    """Publish a transaction event to the transactions.raw topic."""
+    """Queue a transaction event for the transactions.raw topic.
+
+    Only waits for the record to join the producer's batch buffer; the
+    broker round-trip happens in the background and its outcome is logged.
+    ``producer.stop()`` flushes anything still buffered.
+    """
     key = transaction_data.get("external_id", "")
-    await producer.send_and_wait(
+    delivery = await producer.send(
         topic=TOPIC_TRANSACTIONS_RAW,
         key=key,
         value=transaction_data,
     )
+    delivery.add_done_callback(partial(_log_delivery, key))
+
+
+def _log_delivery(key: object, delivery: "asyncio.Future[object]") -> None:
+    if delivery.cancelled():
+        return
+    exc = delivery.exception()
+    if exc is not None:
+        logger.warning(
+            "Failed to deliver transaction %s to %s", key, TOPIC_TRANSACTIONS_RAW, exc_info=exc
+        )
+        return
     logger.info("Published transaction %s to %s", key, TOPIC_TRANSACTIONS_RAW)
+
+
+class TransactionPublisher:
+    """Feeds transaction events to the producer from one background task.
+
+    ``producer.send()`` can block — while topic metadata is fetched from an
+    unreachable broker, or when the batch buffer is full — so requests only
+    put the event on a bounded queue and return.  Delivery stays
+    best-effort, as before: failures are logged, never raised.
+    """
+
+    def __init__(self, producer: AIOKafkaProducer, maxsize: int = PUBLISH_QUEUE_MAX_EVENTS) -> None:
+        self.producer = producer
+        self._queue: asyncio.Queue[dict[str, object]] = asyncio.Queue(maxsize)
+        self._worker: asyncio.Task[None] | None = None
+
+    def start(self) -> None:
+        """Start the worker task; call from within the running event loop."""
+        self._worker = asyncio.create_task(self._drain(), name="kafka-publisher")
+
+    def publish(self, transaction_data: dict[str, object]) -> bool:
+        """Queue an event without waiting; ``False`` if it was dropped."""
+        try:
+            self._queue.put_nowait(transaction_data)
+        except asyncio.QueueFull:
+            logger.warning(
+                "Kafka publish queue full — dropping transaction %s",
+                transaction_data.get("external_id"),
+            )
+            return False
+        return True
+
+    async def _drain(self) -> None:
+        while True:
+            transaction_data = await self._queue.get()
+            try:
+                await publish_transaction(self.producer, transaction_data)
+            except Exception:
+                logger.warning(
+                    "Failed to publish transaction %s to Kafka",
+                    transaction_data.get("external_id"),
+                    exc_info=True,
+                )
+            finally:
+                self._queue.task_done()
+
+    async def stop(self) -> None:
+        """Hand queued events to the producer (bounded wait), then stop it."""
+        try:
+            async with asyncio.timeout(PUBLISH_QUEUE_DRAIN_TIMEOUT_SECONDS):
+                await self._queue.join()
+        except TimeoutError:
+            logger.warning("Dropping %d queued transaction events on shutdown", self._queue.qsize())
+        if self._worker is not None:
+            self._worker.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._worker
+        await self.producer.stop()
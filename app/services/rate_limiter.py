@@ -0,0 +1,89 @@
+"""Redis token-bucket rate limiter shared by every API worker.
+
+Each client IP owns a bucket of ``rate_limit_burst`` tokens that refills at
+``rate_limit_per_second``; a request spends one token.  Refill and spend
+happen in one Lua script, so a check is a single Redis round-trip and the
+limit holds across processes and pods.  Unused tokens accumulate up to the
+burst capacity, so there is no fixed-window edge that admits double the
+rate.
+"""
+
+import hashlib
+import math
+
+from fastapi import HTTPException, Request, status
+from redis.asyncio import Redis
+from redis.exceptions import ConnectionError as RedisConnectionError
+from redis.exceptions import NoScriptError
+from redis.exceptions import TimeoutError as RedisTimeoutError
+
+from app.config import get_settings
+from app.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+# KEYS[1] bucket key; ARGV[1] capacity; ARGV[2] refill rate (tokens/second).
+# Uses the Redis server clock so pods with skewed clocks share one view.
+TOKEN_BUCKET_SCRIPT = """
+local capacity = tonumber(ARGV[1])
+local rate = tonumber(ARGV[2])
+local clock = redis.call('TIME')
+local now = tonumber(clock[1]) + tonumber(clock[2]) / 1000000
+local bucket = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(bucket[1]) or capacity
+local ts = tonumber(bucket[2]) or now
+tokens = math.min(capacity, tokens + math.max(0, now - ts) * rate)
+local allowed = 0
+if tokens >= 1 then
+    tokens = tokens - 1
+    allowed = 1
+end
+redis.call('HSET', KEYS[1], 'tokens', tokens, 'ts', now)
+redis.call('EXPIRE', KEYS[1], math.ceil(capacity / rate))
+return allowed
+"""
+
+_SCRIPT_SHA = hashlib.sha1(TOKEN_BUCKET_SCRIPT.encode()).hexdigest()
+
+
+def rate_limit_key(client_id: str) -> str:
+    return f"rate_limit:{client_id}"
+
+
+async def take_token(redis: Redis, client_id: str, capacity: int, per_second: float) -> bool:
+    """Spend one token from *client_id*'s bucket; ``False`` when it is empty.
+
+    Fails open only when Redis is unreachable (connection error or
+    timeout): the request is allowed and the failure logged, so a Redis
+    outage does not take the API down with it.  Any other Redis error, such
+    as a broken script or a WRONGTYPE key, is a bug and propagates rather
+    than silently switching rate limiting off.
+    """
+    args = (rate_limit_key(client_id), capacity, per_second)
+    try:
+        try:
+            allowed = await redis.evalsha(_SCRIPT_SHA, 1, *args)
+        except NoScriptError:
+            allowed = await redis.eval(TOKEN_BUCKET_SCRIPT, 1, *args)
+    except (RedisConnectionError, RedisTimeoutError):
+        logger.warning("Rate limit check failed for %s", client_id, exc_info=True)
+        return True
+    return bool(allowed)
+
+
+async def enforce_rate_limit(request: Request) -> None:
+    """App-wide dependency: reject the request with 429 once the client's bucket is empty."""
+    settings = get_settings()
+    client_id = request.client.host if request.client else "unknown"
+    allowed = await take_token(
+        request.app.state.redis,
+        client_id,
+        settings.rate_limit_burst,
+        settings.rate_limit_per_second,
+    )
+    if not allowed:
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="Rate limit exceeded",
+            headers={"Retry-After": str(math.ceil(1 / settings.rate_limit_per_second))},
+        )
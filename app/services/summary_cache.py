@@ -0,0 +1,60 @@
+"""Redis cache for customer summaries shown on the portal alert detail page."""
+
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from app.schemas.customer import CustomerSummary
+from app.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+SUMMARY_CACHE_TTL_SECONDS = 60
+
+
+def summary_cache_key(customer_id: str) -> str:
+    return f"cust_summary:{customer_id}"
+
+
+async def get_cached_summary(redis: Redis, customer_id: str) -> CustomerSummary | None:
+    """Return the cached summary, or ``None`` on a miss or Redis failure.
+
+    An entry that no longer parses (corrupt, or written by a deploy with a
+    different schema) also counts as a miss and is dropped, so the next
+    read re-caches it instead of every read failing until the TTL expires.
+    """
+    try:
+        raw = await redis.get(summary_cache_key(customer_id))
+    except RedisError:
+        logger.warning("Summary cache read failed for %s", customer_id, exc_info=True)
+        return None
+    if not raw:
+        return None
+    try:
+        return CustomerSummary.model_validate_json(raw)
+    except ValueError:  # includes pydantic's ValidationError
+        logger.warning("Discarding unreadable cached summary for %s", customer_id, exc_info=True)
+        await invalidate_summary(redis, customer_id)
+        return None
+
+
+async def cache_summary(redis: Redis, summary: CustomerSummary) -> None:
+    """Store *summary* for ``SUMMARY_CACHE_TTL_SECONDS``. Best-effort."""
+    try:
+        await redis.set(
+            summary_cache_key(summary.customer_id),
+            summary.model_dump_json(),
+            ex=SUMMARY_CACHE_TTL_SECONDS,
+        )
+    except RedisError:
+        logger.warning("Summary cache write failed for %s", summary.customer_id, exc_info=True)
+
+
+async def invalidate_summary(redis: Redis, customer_id: str) -> None:
+    """Drop the cached summary after a write that changes it. Best-effort.
+
+    A failed delete leaves the stale entry to age out with its TTL.
+    """
+    try:
+        await redis.delete(summary_cache_key(customer_id))
+    except RedisError:
+        logger.warning("Summary cache invalidation failed for %s", customer_id, exc_info=True)
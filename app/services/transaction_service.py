@@ -2,30 +2,46 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import asyncio
+from functools import partial
+from typing import TYPE_CHECKING, Any
 
-from sqlalchemy import select
+from sqlalchemy import bindparam, lambda_stmt, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.config import Settings
 from app.models.account import Account
 from app.models.transaction import Transaction
 from app.repositories.transaction_repository import TransactionRepository
+from app.schemas.common import from_trusted_row
 from app.schemas.transaction import (
     FraudEvaluationResult,
     TransactionCreate,
     TransactionCreateResponse,
 )
-from app.services.kafka_producer import publish_transaction
+from app.utils.cache import TTLCache
 from app.utils.logging import get_logger
+from app.utils.money import from_cents
 
 if TYPE_CHECKING:
-    from aiokafka import AIOKafkaProducer
-
+    from app.dependencies import AfterCommitHook
     from app.grpc.fraud_client import FraudEvaluationClient
+    from app.services.kafka_producer import TransactionPublisher
 
 logger = get_logger(__name__)
 
+# account_id -> account_number for the Kafka event.  Account numbers are
+# never updated, so the TTL only bounds how long a hot account stays cached.
+ACCOUNT_NUMBER_CACHE_TTL_SECONDS = 300.0
+ACCOUNT_NUMBER_CACHE_MAX_ENTRIES = 10_000
+_account_number_cache: TTLCache[str, str] = TTLCache(
+    maxsize=ACCOUNT_NUMBER_CACHE_MAX_ENTRIES, ttl=ACCOUNT_NUMBER_CACHE_TTL_SECONDS
+)
+
+_ACCOUNT_NUMBER_BY_ID = lambda_stmt(
+    lambda: select(Account.account_number).where(Account.id == bindparam("id"))
+)
+
 
 class TransactionService:
     """Orchestrates transaction persistence, fraud evaluation, and event publishing."""
@@ -36,27 +52,37 @@ class TransactionService:
         settings: Settings,
         *,
         fraud_client: FraudEvaluationClient | None = None,
-        kafka_producer: AIOKafkaProducer | None = None,
+        kafka_publisher: TransactionPublisher | None = None,
     ) -> None:
         self._session = session
         self.repo = TransactionRepository(session)
         self.settings = settings
         self._fraud_client = fraud_client
-        self._kafka_producer = kafka_producer
+        self._kafka_publisher = kafka_publisher
 
-    async def create_and_evaluate(self, data: TransactionCreate) -> TransactionCreateResponse:
-        """Persist transaction, evaluate fraud via gRPC, publish to Kafka."""
-        txn = await self.repo.create(data)
+    async def create_and_evaluate(
+        self, data: TransactionCreate, after_commit: list[AfterCommitHook]
+    ) -> TransactionCreateResponse:
+        """Persist transaction, evaluate fraud via gRPC, publish to Kafka.
 
-        # 1. Real-time fraud evaluation via gRPC (best-effort)
-        fraud_result = await self._evaluate_fraud(txn)
+        The Kafka event is queued on *after_commit* (the request's
+        ``AfterCommit`` hooks), so consumers never see a transaction whose
+        commit failed.
+        """
+        txn = await self.repo.create(data)
 
-        # 2. Publish to Kafka (best-effort)
-        await self._publish_to_kafka(txn)
+        # Fraud evaluation via gRPC and building the Kafka event (which needs
+        # an account number lookup) are independent and both best-effort
+        # (they never raise), so overlap their round-trips.  Only the Kafka
+        # path touches the session.
+        fraud_result, event = await asyncio.gather(
+            self._evaluate_fraud(txn),
+            self._build_kafka_event(txn),
+        )
+        if event is not None:
+            after_commit.append(partial(self._publish_to_kafka, event))
 
-        response = TransactionCreateResponse.model_validate(txn)
-        response.fraud_evaluation = fraud_result
-        return response
+        return from_trusted_row(TransactionCreateResponse, txn, fraud_evaluation=fraud_result)
 
     async def _evaluate_fraud(self, txn: Transaction) -> FraudEvaluationResult | None:
         """Call gRPC fraud service. Returns None on failure."""
@@ -66,14 +92,14 @@ class TransactionService:
             grpc_resp = await self._fraud_client.evaluate(
                 external_id=txn.external_id,
                 customer_id=txn.customer_id,
-                amount=float(txn.amount),
+                amount=float(from_cents(txn.amount_cents)),
                 currency=txn.currency,
                 transaction_type=txn.type,
                 channel=txn.channel,
                 merchant_name=txn.merchant_name,
                 merchant_category=txn.merchant_category,
                 location_country=txn.country_code,
-                ip_address=str(txn.ip_address) if txn.ip_address else None,
+                ip_address=txn.ip_address,
                 device_fingerprint=txn.device_id,
             )
             logger.info(
@@ -108,37 +134,49 @@ class TransactionService:
 
     async def _resolve_account_number(self, account_id: str) -> str | None:
         """Look up the account number for a given account ID."""
-        result = await self._session.execute(
-            select(Account.account_number).where(Account.id == account_id)
-        )
-        return result.scalar_one_or_none()
-
-    async def _publish_to_kafka(self, txn: Transaction) -> None:
-        """Publish transaction event. Logs warning on failure."""
-        if self._kafka_producer is None:
-            return
+        account_number = _account_number_cache.get(account_id)
+        if account_number is None:
+            result = await self._session.execute(_ACCOUNT_NUMBER_BY_ID, {"id": account_id})
+            account_number = result.scalar_one_or_none()
+            if account_number is not None:
+                _account_number_cache.set(account_id, account_number)
+        return account_number
+
+    async def _build_kafka_event(self, txn: Transaction) -> dict[str, Any] | None:
+        """Build the Kafka event for *txn*; ``None`` without a publisher or on failure."""
+        if self._kafka_publisher is None:
+            return None
         try:
             account_number = await self._resolve_account_number(txn.account_id)
-            await publish_transaction(
-                self._kafka_producer,
-                {
-                    "external_id": txn.external_id,
-                    "customer_id": txn.customer_id,
-                    "account_id": txn.account_id,
-                    "account_number": account_number,
-                    "amount": str(txn.amount),
-                    "currency": txn.currency,
-                    "transaction_type": txn.type,
-                    "merchant_name": txn.merchant_name,
-                    "merchant_category": txn.merchant_category,
-                    "channel": txn.channel,
-                    "location_country": txn.country_code,
-                    "ip_address": str(txn.ip_address) if txn.ip_address else None,
-                    "device_fingerprint": txn.device_id,
-                    "transaction_time": txn.created_at.isoformat(),
-                },
+            return {
+                "external_id": txn.external_id,
+                "customer_id": txn.customer_id,
+                "account_id": txn.account_id,
+                "account_number": account_number,
+                "amount": str(from_cents(txn.amount_cents)),
+                "currency": txn.currency,
+                "transaction_type": txn.type,
+                "merchant_name": txn.merchant_name,
+                "merchant_category": txn.merchant_category,
+                "channel": txn.channel,
+                "location_country": txn.country_code,
+                "ip_address": txn.ip_address,
+                "device_fingerprint": txn.device_id,
+                "transaction_time": txn.created_at.isoformat(),
+            }
+        except Exception:
+            logger.warning(
+                "Failed to build Kafka event for transaction %s", txn.external_id, exc_info=True
             )
+            return None
+
+    async def _publish_to_kafka(self, event: dict[str, Any]) -> None:
+        """Queue *event* for Kafka. Logs warning on failure."""
+        if self._kafka_publisher is None:
+            return
+        try:
+            self._kafka_publisher.publish(event)
         except Exception:
             logger.warning(
-                "Failed to publish transaction %s to Kafka", txn.external_id, exc_info=True
+                "Failed to queue transaction %s for Kafka", event["external_id"], exc_info=True
             )
@@ -1,5 +1,6 @@
 """Audit logging for privileged actions."""
 
+import logging
 from typing import Any
 
 from fastapi import Request
@@ -19,6 +20,9 @@ def audit_logged(action: str) -> Any:
     """
 
     async def _log(request: Request, current_user: CurrentUser) -> None:
+        # structlog drops the record below INFO anyway; skip gathering its fields.
+        if not logger.is_enabled_for(logging.INFO):
+            return
         try:
             client_ip = request.client.host if request.client else "unknown"
             request_id = getattr(request.state, "request_id", "n/a")
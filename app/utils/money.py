@@ -0,0 +1,19 @@
+"""Conversions between API currency amounts and stored minor units (cents)."""
+
+from decimal import ROUND_HALF_UP, Decimal
+
+_CENT = Decimal("0.01")
+
+
+def to_cents(amount: Decimal) -> int:
+    """Convert *amount* to integer cents, rounding half away from zero.
+
+    Matches how the previous ``Numeric(15, 2)`` columns rounded extra
+    decimal places on insert.
+    """
+    return int(amount.quantize(_CENT, rounding=ROUND_HALF_UP).scaleb(2))
+
+
+def from_cents(cents: int) -> Decimal:
+    """Convert integer cents back to a two-decimal-place amount."""
+    return Decimal(cents).scaleb(-2)
@@ -11,7 +11,7 @@ import uuid
 from datetime import date, datetime, timedelta, timezone
 from decimal import Decimal
 
-from sqlalchemy import select
+from sqlalchemy import insert, select
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
 from app.auth.security import hash_password
@@ -20,6 +20,7 @@ from app.models.account import Account
 from app.models.admin_user import AdminUser
 from app.models.customer import Customer
 from app.models.transaction import Transaction
+from app.utils.money import to_cents
 
 logger = logging.getLogger(__name__)
 
@@ -129,6 +130,9 @@ DEMO_CUSTOMERS = [
     },
 ]
 
+# Random bytes drawn per seeded transaction: id, external id, device id, IP.
+_TXN_RANDOM_BYTES = 16 + 4 + 3 + 3
+
 ACCOUNT_TYPES = ["cheque", "savings", "credit", "investment"]
 CHANNELS = ["online", "pos", "atm", "mobile", "branch"]
 TXN_TYPES = ["purchase", "transfer", "withdrawal", "deposit", "payment"]
@@ -148,56 +152,61 @@ MERCHANTS = [
 
 async def seed_admin_users(session: AsyncSession) -> None:
     """Seed admin users if they don't exist."""
-    for user_data in ADMIN_USERS:
-        existing = await session.execute(
-            select(AdminUser).where(AdminUser.username == user_data["username"])
-        )
-        if existing.scalar_one_or_none():
-            logger.info("Admin user '%s' already exists, skipping", user_data["username"])
-            continue
-
+    usernames = [u["username"] for u in ADMIN_USERS]
+    existing = set(
+        (await session.execute(select(AdminUser.username).where(AdminUser.username.in_(usernames))))
+        .scalars()
+        .all()
+    )
+    for username in existing:
+        logger.info("Admin user '%s' already exists, skipping", username)
+
+    # bcrypt releases the GIL, so the hashes run in parallel on worker threads.
+    to_create = [u for u in ADMIN_USERS if u["username"] not in existing]
+    hashes = await asyncio.gather(
+        *(asyncio.to_thread(hash_password, u["password"]) for u in to_create)
+    )
+    for user_data, hashed_password in zip(to_create, hashes, strict=True):
         user = AdminUser(
             id=str(uuid.uuid4()),
             username=user_data["username"],
             email=user_data["email"],
             full_name=user_data["full_name"],
             role=user_data["role"],
-            hashed_password=hash_password(user_data["password"]),
+            hashed_password=hashed_password,
             is_active=True,
         )
         session.add(user)
         logger.info("Created admin user: %s", user_data["username"])
 
-    await session.commit()
-
 
 async def seed_customers_and_accounts(session: AsyncSession) -> list[tuple[str, list[str]]]:
     """Seed demo customers and accounts. Returns list of (customer_id, [account_ids])."""
     customer_accounts: list[tuple[str, list[str]]] = []
+    customer_rows: list[dict[str, object]] = []
+    account_rows: list[dict[str, object]] = []
+
+    # One query for every already-seeded customer and its account IDs,
+    # which are still needed to seed transactions.
+    existing: dict[str, tuple[str, list[str]]] = {}
+    rows = await session.execute(
+        select(Customer.external_id, Customer.id, Account.id)
+        .outerjoin(Account, Account.customer_id == Customer.id)
+        .where(Customer.external_id.in_([c["external_id"] for c in DEMO_CUSTOMERS]))
+    )
+    for external_id, customer_id, account_id in rows:
+        _, account_ids = existing.setdefault(external_id, (customer_id, []))
+        if account_id is not None:
+            account_ids.append(account_id)
 
     for cust_data in DEMO_CUSTOMERS:
-        existing = await session.execute(
-            select(Customer).where(Customer.external_id == cust_data["external_id"])
-        )
-        if existing.scalar_one_or_none():
+        if cust_data["external_id"] in existing:
             logger.info("Customer '%s' already exists, skipping", cust_data["external_id"])
-            # Still need to fetch IDs for transactions
-            customer = (
-                await session.execute(
-                    select(Customer).where(Customer.external_id == cust_data["external_id"])
-                )
-            ).scalar_one()
-            accounts = (
-                (await session.execute(select(Account).where(Account.customer_id == customer.id)))
-                .scalars()
-                .all()
-            )
-            customer_accounts.append((customer.id, [a.id for a in accounts]))
+            customer_accounts.append(existing[cust_data["external_id"]])
             continue
 
         customer_id = str(uuid.uuid4())
-        customer = Customer(id=customer_id, **cust_data)
-        session.add(customer)
+        customer_rows.append({"id": customer_id, **cust_data})
 
         # Create 1-3 accounts per customer
         account_ids = []
@@ -205,17 +214,18 @@ async def seed_customers_and_accounts(session: AsyncSession) -> list[tuple[str,
         for i in range(num_accounts):
             account_id = str(uuid.uuid4())
             acct_type = ACCOUNT_TYPES[i % len(ACCOUNT_TYPES)]
-            account = Account(
-                id=account_id,
-                customer_id=customer_id,
-                account_number=f"100{random.randint(1000000, 9999999)}",
-                account_type=acct_type,
-                currency="ZAR",
-                balance=Decimal(str(round(random.uniform(1000, 500000), 2))),
-                status="active",
-                opened_at=cust_data["onboarded_at"],
+            account_rows.append(
+                {
+                    "id": account_id,
+                    "customer_id": customer_id,
+                    "account_number": f"100{random.randint(1000000, 9999999)}",
+                    "account_type": acct_type,
+                    "currency": "ZAR",
+                    "balance_cents": to_cents(Decimal(str(round(random.uniform(1000, 500000), 2)))),
+                    "status": "active",
+                    "opened_at": cust_data["onboarded_at"],
+                }
             )
-            session.add(account)
             account_ids.append(account_id)
 
         customer_accounts.append((customer_id, account_ids))
@@ -223,7 +233,10 @@ async def seed_customers_and_accounts(session: AsyncSession) -> list[tuple[str,
             "Created customer %s with %d account(s)", cust_data["external_id"], num_accounts
         )
 
-    await session.commit()
+    # One multi-row INSERT per table; customers first for the accounts' FK.
+    if customer_rows:
+        await session.execute(insert(Customer), customer_rows)
+        await session.execute(insert(Account), account_rows)
     return customer_accounts
 
 
@@ -231,47 +244,56 @@ async def seed_transactions(
     session: AsyncSession, customer_accounts: list[tuple[str, list[str]]]
 ) -> None:
     """Seed demo transactions across all customers."""
-    txn_count = 0
+    rows: list[dict[str, object]] = []
     now = datetime.now(timezone.utc)
 
     for customer_id, account_ids in customer_accounts:
         if not account_ids:
             continue
 
-        # 10-30 transactions per customer over last 60 days
+        # 10-30 transactions per customer over last 60 days.  Categorical
+        # columns and random bytes are drawn once per customer, not per row.
         num_txns = random.randint(10, 30)
-        for _ in range(num_txns):
-            account_id = random.choice(account_ids)
-            merchant_name, merchant_category = random.choice(MERCHANTS)
-            days_ago = random.randint(0, 60)
+        accounts = random.choices(account_ids, k=num_txns)
+        merchants = random.choices(MERCHANTS, k=num_txns)
+        types = random.choices(TXN_TYPES, k=num_txns)
+        channels = random.choices(CHANNELS, k=num_txns)
+        raw = random.randbytes(_TXN_RANDOM_BYTES * num_txns)
+        for i in range(num_txns):
+            chunk = raw[i * _TXN_RANDOM_BYTES : (i + 1) * _TXN_RANDOM_BYTES]
+            merchant_name, merchant_category = merchants[i]
             txn_time = now - timedelta(
-                days=days_ago, hours=random.randint(0, 23), minutes=random.randint(0, 59)
+                days=random.randint(0, 60),
+                hours=random.randint(0, 23),
+                minutes=random.randint(0, 59),
             )
 
-            txn = Transaction(
-                id=str(uuid.uuid4()),
-                external_id=f"TXN-{uuid.uuid4().hex[:8].upper()}",
-                account_id=account_id,
-                customer_id=customer_id,
-                type=random.choice(TXN_TYPES),
-                amount=Decimal(str(round(random.uniform(10, 25000), 2))),
-                currency="ZAR",
-                merchant_name=merchant_name,
-                merchant_category=merchant_category,
-                channel=random.choice(CHANNELS),
-                country_code="ZA",
-                ip_address=f"41.{random.randint(0, 255)}.{random.randint(0, 255)}.{random.randint(0, 255)}",
-                device_id=f"device-{uuid.uuid4().hex[:6]}",
-                status="completed",
-                description=f"Payment to {merchant_name}",
-                created_at=txn_time,
-                updated_at=txn_time,
+            rows.append(
+                {
+                    "id": str(uuid.UUID(bytes=chunk[:16], version=4)),
+                    "external_id": f"TXN-{chunk[16:20].hex().upper()}",
+                    "account_id": accounts[i],
+                    "customer_id": customer_id,
+                    "type": types[i],
+                    "amount_cents": to_cents(Decimal(str(round(random.uniform(10, 25000), 2)))),
+                    "currency": "ZAR",
+                    "merchant_name": merchant_name,
+                    "merchant_category": merchant_category,
+                    "channel": channels[i],
+                    "country_code": "ZA",
+                    "ip_address": f"41.{chunk[23]}.{chunk[24]}.{chunk[25]}",
+                    "device_id": f"device-{chunk[20:23].hex()}",
+                    "status": "completed",
+                    "description": f"Payment to {merchant_name}",
+                    "created_at": txn_time,
+                    "updated_at": txn_time,
+                }
             )
-            session.add(txn)
-            txn_count += 1
 
-    await session.commit()
-    logger.info("Created %d transactions", txn_count)
+    # Bulk INSERT: rows go out as multi-row VALUES batches, not one per row.
+    if rows:
+        await session.execute(insert(Transaction), rows)
+    logger.info("Created %d transactions", len(rows))
 
 
 async def main() -> None:
@@ -280,10 +302,13 @@ async def main() -> None:
     random.seed(42)  # Reproducible demo data
 
     settings = get_settings()
-    engine = create_async_engine(str(settings.database_url))
+    # The seed runs on one session, so one pooled connection is all it needs.
+    engine = create_async_engine(str(settings.database_url), pool_size=1, max_overflow=0)
     session_factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
 
-    async with session_factory() as session:
+    # One transaction for the whole run: a single COMMIT, and a failed run
+    # leaves nothing half-seeded behind.
+    async with session_factory() as session, session.begin():
         logger.info("Seeding admin users...")
         await seed_admin_users(session)
 
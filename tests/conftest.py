@@ -10,27 +10,44 @@ os.environ.setdefault("REDIS_URL", "redis://localhost:6379/15")
 os.environ.setdefault("ENVIRONMENT", "development")
 os.environ.setdefault("JWT_SECRET_KEY", "test-secret-key-not-for-production")
 os.environ.setdefault("KAFKA_BOOTSTRAP_SERVERS", "localhost:9092")
+# Minimum bcrypt cost; hashes are only ever checked within the test run
+os.environ.setdefault("BCRYPT_ROUNDS", "4")
 
+import secrets
 import uuid
 from collections.abc import AsyncGenerator
 from datetime import UTC, datetime
-from decimal import Decimal
+from functools import cache
 from types import SimpleNamespace
-from unittest.mock import AsyncMock, MagicMock
+from typing import TYPE_CHECKING
+from unittest.mock import MagicMock
 
-import fakeredis.aioredis
 import pytest
 import pytest_asyncio
-from httpx import ASGITransport, AsyncClient
 
 from app.auth.security import create_access_token
 from app.config import get_settings
-from app.main import app
 
+# fakeredis, httpx and the app graph are imported inside the fixtures that
+# use them, so collecting tests that don't need an HTTP client stays cheap.
+if TYPE_CHECKING:
+    import fakeredis.aioredis
+    from httpx import AsyncClient
 
-@pytest.fixture(autouse=True)
-def _clear_settings_cache():
-    """Clear the lru_cache on settings between tests."""
+
+def pytest_sessionstart():
+    """Parse settings from the test environment above, once per run."""
+    get_settings.cache_clear()
+
+
+@pytest.fixture()
+def fresh_settings():
+    """Opt-in: re-read settings for a test that changes the environment.
+
+    Apply env changes (e.g. ``monkeypatch.setenv``) before calling
+    ``get_settings()``; the cache is cleared again afterwards so later
+    tests see the suite defaults.
+    """
     get_settings.cache_clear()
     yield
     get_settings.cache_clear()
@@ -43,6 +60,8 @@ def _clear_settings_cache():
 
 def _make_fake_redis():
     """Create a fakeredis instance that behaves like redis.asyncio.Redis."""
+    import fakeredis.aioredis
+
     return fakeredis.aioredis.FakeRedis(decode_responses=True)
 
 
@@ -51,64 +70,121 @@ def _make_fake_redis():
 # ---------------------------------------------------------------------------
 
 
+class _FakeResult:
+    """Result of every ``_FakeSession.execute``: ``SELECT 1`` and empty rows."""
+
+    def scalar(self):
+        return 1
+
+    def scalar_one_or_none(self):
+        return None
+
+    def scalars(self):
+        return self
+
+    def all(self):
+        return []
+
+
+class _FakeSession:
+    """Plain stand-in for an async DB session.
+
+    Covers what requests touch when repositories are overridden — the
+    readiness probe (``SELECT 1``) and the unit-of-work commit — without
+    ``AsyncMock`` recording every attribute access and call.  It is also
+    its own session factory: ``async with factory() as session``.
+    """
+
+    def __init__(self):
+        self.info = {}
+
+    async def execute(self, *_args, **_kwargs):
+        return _FakeResult()
+
+    def add(self, instance):
+        pass
+
+    async def flush(self):
+        pass
+
+    async def commit(self):
+        pass
+
+    async def rollback(self):
+        pass
+
+    async def close(self):
+        pass
+
+    def __call__(self):
+        return self
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        pass
+
+
 def _make_mock_session():
-    """Create a mock async DB session.
+    """Create a fake async DB session.
 
     Supports ``async with factory() as session`` and readiness probe
     (``SELECT 1``).
     """
-    session = AsyncMock()
-    result_mock = MagicMock()
-    result_mock.scalar.return_value = 1
-    session.execute.return_value = result_mock
-    session.close = AsyncMock()
-    return session
+    return _FakeSession()
 
 
 def _make_mock_session_factory():
     """Return a callable that mimics ``async_sessionmaker().__call__()``."""
-    mock_session = _make_mock_session()
-
-    class _Factory:
-        """Mimic async context manager returned by sessionmaker()."""
+    session = _make_mock_session()
+    return session, session
 
-        def __call__(self):
-            return self
 
-        async def __aenter__(self):
-            return mock_session
+# ---------------------------------------------------------------------------
+# HTTP client fixture (FastAPI app with mocked infra)
+# ---------------------------------------------------------------------------
 
-        async def __aexit__(self, *args):
-            pass
 
-    return _Factory(), mock_session
+@pytest_asyncio.fixture(scope="session")
+async def _shared_client() -> AsyncGenerator[
+    tuple["AsyncClient", "fakeredis.aioredis.FakeRedis"], None
+]:
+    """One HTTP client and fake Redis for the whole run; see ``client``."""
+    from httpx import ASGITransport, AsyncClient
 
+    from app.main import app
 
-# ---------------------------------------------------------------------------
-# HTTP client fixture (FastAPI app with mocked infra)
-# ---------------------------------------------------------------------------
+    fake_redis = _make_fake_redis()
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        yield ac, fake_redis
+    await fake_redis.aclose()
 
 
 @pytest_asyncio.fixture()
-async def client() -> AsyncGenerator[AsyncClient, None]:
+async def client(_shared_client) -> AsyncGenerator["AsyncClient", None]:
     """Async HTTP client wired to the FastAPI app.
 
     Infrastructure (DB, Redis) is mocked so tests run without devstack.
+    The client and Redis are shared across tests; each test gets flushed
+    Redis and fresh mocks on ``app.state``.
     """
+    from app.main import app
+
+    ac, fake_redis = _shared_client
+    await fake_redis.flushdb()
     session_factory, _ = _make_mock_session_factory()
-    fake_redis = _make_fake_redis()
 
     app.state.engine = MagicMock()
     app.state.session_factory = session_factory
     app.state.redis = fake_redis
     app.state.fraud_client = MagicMock()
-    app.state.kafka_producer = None
+    app.state.kafka_publisher = None
 
-    transport = ASGITransport(app=app)
-    async with AsyncClient(transport=transport, base_url="http://test") as ac:
-        yield ac
-
-    await fake_redis.aclose()
+    yield ac
+    ac.headers.pop("Authorization", None)
+    ac.cookies.clear()
 
 
 # ---------------------------------------------------------------------------
@@ -140,8 +216,13 @@ async def redis_client():
 # ---------------------------------------------------------------------------
 
 
+@cache
 def _make_token(role: str, username: str) -> str:
-    """Create a valid JWT access token for testing."""
+    """Create a valid JWT access token for testing.
+
+    Signed once per (role, username) per test run; no test depends on
+    tokens being unique.
+    """
     return create_access_token(
         user_id=str(uuid.uuid4()),
         role=role,
@@ -157,7 +238,7 @@ def _auth_headers(role: str, username: str) -> dict[str, str]:
 
 
 @pytest_asyncio.fixture()
-async def admin_client(client) -> AsyncGenerator[AsyncClient, None]:
+async def admin_client(client) -> AsyncGenerator["AsyncClient", None]:
     """HTTP client pre-authenticated as admin user."""
     client.headers.update(_auth_headers("admin", "admin"))
     yield client
@@ -165,7 +246,7 @@ async def admin_client(client) -> AsyncGenerator[AsyncClient, None]:
 
 
 @pytest_asyncio.fixture()
-async def analyst_client(client) -> AsyncGenerator[AsyncClient, None]:
+async def analyst_client(client) -> AsyncGenerator["AsyncClient", None]:
     """HTTP client pre-authenticated as analyst user."""
     client.headers.update(_auth_headers("analyst", "analyst"))
     yield client
@@ -173,7 +254,7 @@ async def analyst_client(client) -> AsyncGenerator[AsyncClient, None]:
 
 
 @pytest_asyncio.fixture()
-async def viewer_client(client) -> AsyncGenerator[AsyncClient, None]:
+async def viewer_client(client) -> AsyncGenerator["AsyncClient", None]:
     """HTTP client pre-authenticated as viewer user."""
     client.headers.update(_auth_headers("viewer", "viewer"))
     yield client
@@ -191,7 +272,7 @@ def make_customer_model(**overrides):
     """Return a SimpleNamespace that looks like a Customer ORM instance."""
     data = {
         "id": str(uuid.uuid4()),
-        "external_id": f"CUST-{uuid.uuid4().hex[:8]}",
+        "external_id": f"CUST-{secrets.token_hex(4)}",
         "first_name": "Test",
         "last_name": "Customer",
         "id_number": "9001015026082",
@@ -216,10 +297,10 @@ def make_account_model(**overrides):
     data = {
         "id": str(uuid.uuid4()),
         "customer_id": str(uuid.uuid4()),
-        "account_number": f"10{uuid.uuid4().int % 10**8:08d}",
+        "account_number": f"10{secrets.randbelow(10**8):08d}",
         "account_type": "cheque",
         "status": "active",
-        "balance": Decimal("5000.00"),
+        "balance_cents": 500000,
         "currency": "ZAR",
         "opened_at": _NOW,
         "closed_at": None,
@@ -234,11 +315,11 @@ def make_transaction_model(**overrides):
     """Return a SimpleNamespace that looks like a Transaction ORM instance."""
     data = {
         "id": str(uuid.uuid4()),
-        "external_id": f"TXN-{uuid.uuid4().hex[:12]}",
+        "external_id": f"TXN-{secrets.token_hex(6)}",
         "account_id": str(uuid.uuid4()),
         "customer_id": str(uuid.uuid4()),
         "type": "purchase",
-        "amount": Decimal("150.00"),
+        "amount_cents": 15000,
         "currency": "ZAR",
         "merchant_name": "Test Store",
         "merchant_category": "retail",
@@ -279,7 +360,7 @@ def make_admin_user_model(**overrides):
 def make_customer_payload(**overrides) -> dict:
     """Build a valid customer creation payload."""
     data = {
-        "external_id": f"CUST-{uuid.uuid4().hex[:8]}",
+        "external_id": f"CUST-{secrets.token_hex(4)}",
         "first_name": "Test",
         "last_name": "Customer",
         "id_number": "9001015026082",
@@ -296,7 +377,7 @@ def make_account_payload(**overrides) -> dict:
     """Build a valid account creation payload."""
     data = {
         "customer_id": str(uuid.uuid4()),
-        "account_number": f"10{uuid.uuid4().int % 10**8:08d}",
+        "account_number": f"10{secrets.randbelow(10**8):08d}",
         "account_type": "cheque",
         "currency": "ZAR",
         "opened_at": _NOW.isoformat(),
@@ -308,7 +389,7 @@ def make_account_payload(**overrides) -> dict:
 def make_transaction_payload(**overrides) -> dict:
     """Build a valid transaction creation payload."""
     data = {
-        "external_id": f"TXN-{uuid.uuid4().hex[:12]}",
+        "external_id": f"TXN-{secrets.token_hex(6)}",
         "account_id": str(uuid.uuid4()),
         "customer_id": str(uuid.uuid4()),
         "type": "purchase",
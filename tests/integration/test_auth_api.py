@@ -4,17 +4,23 @@ from unittest.mock import AsyncMock
 
 import pytest
 
+from app.api.v1.auth import _refresh_user_cache
 from app.auth.security import create_access_token, create_refresh_token, hash_password
+from app.config import get_settings
 from app.dependencies import get_user_repo
 from app.main import app
 from tests.conftest import make_admin_user_model
 
+# Hashed once at import; bcrypt is deliberately slow.
+_HASHED = {pw: hash_password(pw) for pw in ("admin123", "correct_password")}
+
 
 @pytest.fixture(autouse=True)
 def _clear_overrides():
     """Clear dependency overrides after each test."""
     yield
     app.dependency_overrides.clear()
+    _refresh_user_cache.clear()
 
 
 def _mock_user_repo(user=None):
@@ -25,7 +31,6 @@ def _mock_user_repo(user=None):
     return mock
 
 
-@pytest.mark.asyncio
 class TestMeEndpoint:
     async def test_admin_me_returns_fresh_db_data(self, client):
         """The /me endpoint should return current data from the DB, not JWT claims."""
@@ -98,11 +103,10 @@ class TestMeEndpoint:
         assert resp.status_code == 401
 
 
-@pytest.mark.asyncio
 class TestLoginEndpoint:
     async def test_login_success(self, client):
         user = make_admin_user_model(
-            hashed_password=hash_password("admin123"),
+            hashed_password=_HASHED["admin123"],
         )
         mock = AsyncMock()
         mock.get_by_username = AsyncMock(return_value=user)
@@ -116,10 +120,11 @@ class TestLoginEndpoint:
         assert "access_token" in body
         assert "refresh_token" in body
         assert body["token_type"] == "bearer"
+        assert body["expires_in"] == get_settings().jwt_access_token_expire_minutes * 60
 
     async def test_login_wrong_password(self, client):
         user = make_admin_user_model(
-            hashed_password=hash_password("correct_password"),
+            hashed_password=_HASHED["correct_password"],
         )
         mock = AsyncMock()
         mock.get_by_username = AsyncMock(return_value=user)
@@ -142,7 +147,7 @@ class TestLoginEndpoint:
 
     async def test_login_disabled_user(self, client):
         user = make_admin_user_model(
-            hashed_password=hash_password("admin123"),
+            hashed_password=_HASHED["admin123"],
             is_active=False,
         )
         mock = AsyncMock()
@@ -155,7 +160,40 @@ class TestLoginEndpoint:
         assert resp.status_code == 403
 
 
-@pytest.mark.asyncio
+class TestRefreshEndpoint:
+    async def test_refresh_success(self, client):
+        user = make_admin_user_model(id="user-r1")
+        _mock_user_repo(user)
+        refresh = create_refresh_token("user-r1", "admin", username="admin")
+        resp = await client.post("/api/v1/auth/admin/refresh", json={"refresh_token": refresh})
+        assert resp.status_code == 200
+        assert "access_token" in resp.json()
+
+    async def test_repeat_refresh_reuses_cached_user(self, client):
+        user = make_admin_user_model(id="user-r2")
+        mock = _mock_user_repo(user)
+        refresh = create_refresh_token("user-r2", "admin", username="admin")
+        for _ in range(2):
+            resp = await client.post(
+                "/api/v1/auth/admin/refresh", json={"refresh_token": refresh}
+            )
+            assert resp.status_code == 200
+        mock.get_by_id.assert_awaited_once_with("user-r2")
+
+    async def test_refresh_inactive_user_rejected(self, client):
+        user = make_admin_user_model(id="user-r3", is_active=False)
+        _mock_user_repo(user)
+        refresh = create_refresh_token("user-r3", "admin", username="admin")
+        resp = await client.post("/api/v1/auth/admin/refresh", json={"refresh_token": refresh})
+        assert resp.status_code == 401
+
+    async def test_access_token_rejected_for_refresh(self, client):
+        _mock_user_repo(make_admin_user_model(id="user-r4"))
+        access = create_access_token("user-r4", "admin", username="admin")
+        resp = await client.post("/api/v1/auth/admin/refresh", json={"refresh_token": access})
+        assert resp.status_code == 401
+
+
 class TestRBACEnforcement:
     async def test_viewer_cannot_create_customer(self, viewer_client):
         resp = await viewer_client.post("/api/v1/customers", json={})
@@ -1,9 +1,21 @@
 """Integration tests for health and readiness endpoints."""
 
+import asyncio
+from unittest.mock import patch
+
 import pytest
 
+from app.api.health import _readiness_cache
+from app.main import app
+
+
+@pytest.fixture(autouse=True)
+def _clear_readiness_cache():
+    _readiness_cache.clear()
+    yield
+    _readiness_cache.clear()
+
 
-@pytest.mark.asyncio
 class TestHealthEndpoints:
     async def test_health_returns_200(self, client):
         resp = await client.get("/health")
@@ -20,6 +32,28 @@ class TestHealthEndpoints:
         assert body["checks"]["database"] == "ok"
         assert body["checks"]["redis"] == "ok"
 
+    async def test_ready_degraded_when_redis_hangs(self, client):
+        async def hang():
+            await asyncio.sleep(10)
+
+        with (
+            patch.object(app.state.redis, "ping", side_effect=hang),
+            patch("app.api.health.REDIS_CHECK_TIMEOUT_SECONDS", 0.01),
+        ):
+            resp = await client.get("/ready")
+        assert resp.status_code == 503
+        assert resp.json()["checks"] == {"database": "ok", "redis": "unavailable"}
+
+    async def test_ready_result_is_cached_only_when_ready(self, client):
+        with patch.object(app.state.redis, "ping", side_effect=ConnectionError("down")):
+            assert (await client.get("/ready")).status_code == 503
+        assert (await client.get("/ready")).status_code == 200
+
+        with patch.object(app.state.redis, "ping", side_effect=ConnectionError("down")) as ping:
+            resp = await client.get("/ready")
+        assert resp.status_code == 200
+        ping.assert_not_called()
+
     async def test_security_headers_present(self, client):
         resp = await client.get("/health")
         assert resp.headers.get("X-Content-Type-Options") == "nosniff"
@@ -29,3 +63,29 @@ class TestHealthEndpoints:
     async def test_request_id_header(self, client):
         resp = await client.get("/health")
         assert "X-Request-ID" in resp.headers
+
+    async def test_generated_request_id_is_128_bit_hex(self, client):
+        first = (await client.get("/health")).headers["X-Request-ID"]
+        second = (await client.get("/health")).headers["X-Request-ID"]
+        assert len(first) == 32
+        int(first, 16)
+        assert first != second
+
+    async def test_request_id_echoed_with_security_headers(self, client):
+        resp = await client.get("/health", headers={"X-Request-ID": "req-123"})
+        assert resp.headers["X-Request-ID"] == "req-123"
+        assert resp.headers.get("Referrer-Policy") == "strict-origin-when-cross-origin"
+        assert "Strict-Transport-Security" not in resp.headers
+
+    async def test_cors_preflight_answered_and_cacheable(self, client):
+        resp = await client.options(
+            "/api/v1/customers",
+            headers={
+                "Origin": "http://localhost:3000",
+                "Access-Control-Request-Method": "GET",
+                "Access-Control-Request-Headers": "Authorization",
+            },
+        )
+        assert resp.status_code == 200
+        assert resp.headers["Access-Control-Allow-Origin"] == "http://localhost:3000"
+        assert resp.headers["Access-Control-Max-Age"] == "7200"
@@ -8,6 +8,10 @@ from sqlalchemy.exc import IntegrityError
 
 from app.dependencies import get_account_repo, get_customer_repo, get_transaction_repo
 from app.main import app
+from app.schemas.account import AccountCreate
+from app.schemas.customer import CustomerCreate, CustomerSummary
+from app.schemas.transaction import TransactionCreateResponse, TransactionCursorPage
+from app.services.summary_cache import summary_cache_key
 from tests.conftest import (
     make_account_model,
     make_account_payload,
@@ -19,7 +23,11 @@ from tests.conftest import (
 
 
 def _override_repo(dep_fn, mock_repo):
-    """Register a dependency override and return a cleanup function."""
+    """Register a dependency override for this test and return the mock.
+
+    The autouse ``_clear_overrides`` fixture resets ``app.dependency_overrides``
+    after each test, so no snapshot or restore is needed.
+    """
     app.dependency_overrides[dep_fn] = lambda: mock_repo
     return mock_repo
 
@@ -32,6 +40,26 @@ def _make_page(items, total=None, page=1, size=50):
     return Page(items=items, total=total, page=page, size=size, pages=pages)
 
 
+def _make_cursor_page(items, next_page=None):
+    """Build a CursorPage object matching fastapi-pagination's keyset output."""
+    return TransactionCursorPage(items=items, next_page=next_page)
+
+
+def _make_summary(customer_id):
+    return CustomerSummary(
+        customer_id=customer_id,
+        full_name="Jane Doe",
+        tier="standard",
+        kyc_status="verified",
+        account_age_days=30,
+        total_accounts=1,
+        total_transactions_30d=3,
+        total_spend_30d="150.00",
+        avg_transaction_amount="50.00",
+        risk_rating="low",
+    )
+
+
 @pytest.fixture(autouse=True)
 def _clear_overrides():
     """Clear dependency overrides after each test."""
@@ -44,7 +72,6 @@ def _clear_overrides():
 # ---------------------------------------------------------------------------
 
 
-@pytest.mark.asyncio
 class TestCustomersAPI:
     @patch("app.api.v1.customers.sqlalchemy_paginate", new_callable=AsyncMock)
     async def test_list_customers(self, mock_paginate, admin_client):
@@ -100,7 +127,7 @@ class TestCustomersAPI:
 
     async def test_create_customer(self, admin_client):
         payload = make_customer_payload()
-        customer = make_customer_model(**payload)
+        customer = make_customer_model(**dict(CustomerCreate(**payload)))
         mock = AsyncMock()
         mock.create = AsyncMock(return_value=customer)
         _override_repo(get_customer_repo, mock)
@@ -135,7 +162,6 @@ class TestCustomersAPI:
         accounts = [make_account_model(customer_id=customer.id)]
 
         cust_mock = AsyncMock()
-        cust_mock.get_by_id = AsyncMock(return_value=customer)
         _override_repo(get_customer_repo, cust_mock)
 
         acc_mock = AsyncMock()
@@ -145,15 +171,41 @@ class TestCustomersAPI:
         resp = await admin_client.get(f"/api/v1/customers/{customer.id}/accounts")
         assert resp.status_code == 200
         assert len(resp.json()) == 1
+        cust_mock.exists.assert_not_awaited()
+
+    async def test_get_customer_accounts_empty(self, admin_client):
+        cust_mock = AsyncMock()
+        cust_mock.exists = AsyncMock(return_value=True)
+        _override_repo(get_customer_repo, cust_mock)
+
+        acc_mock = AsyncMock()
+        acc_mock.get_by_customer = AsyncMock(return_value=[])
+        _override_repo(get_account_repo, acc_mock)
+
+        resp = await admin_client.get("/api/v1/customers/cust-1/accounts")
+        assert resp.status_code == 200
+        assert resp.json() == []
+        cust_mock.exists.assert_awaited_once_with("cust-1")
+
+    async def test_get_customer_accounts_not_found(self, admin_client):
+        cust_mock = AsyncMock()
+        cust_mock.exists = AsyncMock(return_value=False)
+        _override_repo(get_customer_repo, cust_mock)
+
+        acc_mock = AsyncMock()
+        acc_mock.get_by_customer = AsyncMock(return_value=[])
+        _override_repo(get_account_repo, acc_mock)
+
+        resp = await admin_client.get("/api/v1/customers/nonexistent/accounts")
+        assert resp.status_code == 404
 
     @patch("app.api.v1.customers.sqlalchemy_paginate", new_callable=AsyncMock)
     async def test_get_customer_transactions(self, mock_paginate, admin_client):
         customer = make_customer_model()
         txns = [make_transaction_model(customer_id=customer.id)]
-        mock_paginate.return_value = _make_page(txns, total=1)
+        mock_paginate.return_value = _make_cursor_page(txns, next_page="next")
 
         cust_mock = AsyncMock()
-        cust_mock.get_by_id = AsyncMock(return_value=customer)
         _override_repo(get_customer_repo, cust_mock)
 
         txn_mock = MagicMock()
@@ -164,7 +216,93 @@ class TestCustomersAPI:
         resp = await admin_client.get(f"/api/v1/customers/{customer.id}/transactions")
         assert resp.status_code == 200
         body = resp.json()
-        assert body["total"] == 1
+        assert len(body["items"]) == 1
+        assert body["next_page"] == "next"
+        assert "total" not in body
+        cust_mock.exists.assert_not_awaited()
+
+    @patch("app.api.v1.customers.sqlalchemy_paginate", new_callable=AsyncMock)
+    async def test_get_customer_transactions_empty(self, mock_paginate, admin_client):
+        mock_paginate.return_value = _make_cursor_page([])
+
+        cust_mock = AsyncMock()
+        cust_mock.exists = AsyncMock(return_value=True)
+        _override_repo(get_customer_repo, cust_mock)
+
+        txn_mock = MagicMock()
+        txn_mock.get_by_customer_query = MagicMock(return_value=MagicMock())
+        txn_mock.session = MagicMock()
+        _override_repo(get_transaction_repo, txn_mock)
+
+        resp = await admin_client.get("/api/v1/customers/cust-1/transactions")
+        assert resp.status_code == 200
+        assert resp.json()["items"] == []
+        cust_mock.exists.assert_awaited_once_with("cust-1")
+
+    @patch("app.api.v1.customers.sqlalchemy_paginate", new_callable=AsyncMock)
+    async def test_get_customer_transactions_not_found(self, mock_paginate, admin_client):
+        mock_paginate.return_value = _make_cursor_page([])
+
+        cust_mock = AsyncMock()
+        cust_mock.exists = AsyncMock(return_value=False)
+        _override_repo(get_customer_repo, cust_mock)
+
+        txn_mock = MagicMock()
+        txn_mock.get_by_customer_query = MagicMock(return_value=MagicMock())
+        txn_mock.session = MagicMock()
+        _override_repo(get_transaction_repo, txn_mock)
+
+        resp = await admin_client.get("/api/v1/customers/nonexistent/transactions")
+        assert resp.status_code == 404
+
+    async def test_get_customer_summary_is_cached(self, admin_client):
+        summary = _make_summary("cust-1")
+        mock = AsyncMock()
+        mock.get_summary = AsyncMock(return_value=summary)
+        _override_repo(get_customer_repo, mock)
+
+        first = await admin_client.get("/api/v1/customers/cust-1/summary")
+        second = await admin_client.get("/api/v1/customers/cust-1/summary")
+        assert first.status_code == second.status_code == 200
+        assert second.json() == first.json()
+        mock.get_summary.assert_awaited_once_with("cust-1")
+
+    async def test_get_customer_summary_not_found(self, admin_client):
+        mock = AsyncMock()
+        mock.get_summary = AsyncMock(return_value=None)
+        _override_repo(get_customer_repo, mock)
+        resp = await admin_client.get("/api/v1/customers/nonexistent/summary")
+        assert resp.status_code == 404
+        assert await app.state.redis.get(summary_cache_key("nonexistent")) is None
+
+    async def test_update_customer_invalidates_summary(self, admin_client):
+        customer = make_customer_model()
+        await app.state.redis.set(summary_cache_key(customer.id), "stale")
+        mock = AsyncMock()
+        mock.update = AsyncMock(return_value=customer)
+        _override_repo(get_customer_repo, mock)
+        resp = await admin_client.put(f"/api/v1/customers/{customer.id}", json={"tier": "premium"})
+        assert resp.status_code == 200
+        assert await app.state.redis.get(summary_cache_key(customer.id)) is None
+
+    async def test_summary_invalidated_only_after_commit(self, admin_client, monkeypatch):
+        customer = make_customer_model()
+        key = summary_cache_key(customer.id)
+        await app.state.redis.set(key, "stale")
+        cached_at_commit = []
+
+        async def commit():
+            cached_at_commit.append(await app.state.redis.get(key))
+
+        monkeypatch.setattr(app.state.session_factory(), "commit", commit)
+        mock = AsyncMock()
+        mock.update = AsyncMock(return_value=customer)
+        _override_repo(get_customer_repo, mock)
+        resp = await admin_client.put(f"/api/v1/customers/{customer.id}", json={"tier": "premium"})
+        assert resp.status_code == 200
+        # Deleting before the commit would let a concurrent read re-cache stale data
+        assert cached_at_commit == ["stale"]
+        assert await app.state.redis.get(key) is None
 
     async def test_create_customer_duplicate_returns_409(self, admin_client):
         payload = make_customer_payload()
@@ -197,7 +335,6 @@ class TestCustomersAPI:
 # ---------------------------------------------------------------------------
 
 
-@pytest.mark.asyncio
 class TestAccountsAPI:
     async def test_get_account(self, admin_client):
         account = make_account_model()
@@ -217,7 +354,7 @@ class TestAccountsAPI:
 
     async def test_create_account(self, admin_client):
         payload = make_account_payload()
-        account = make_account_model(**payload)
+        account = make_account_model(**dict(AccountCreate(**payload)))
         mock = AsyncMock()
         mock.create = AsyncMock(return_value=account)
         _override_repo(get_account_repo, mock)
@@ -240,10 +377,9 @@ class TestAccountsAPI:
     async def test_get_account_transactions(self, mock_paginate, admin_client):
         account = make_account_model()
         txns = [make_transaction_model(account_id=account.id)]
-        mock_paginate.return_value = _make_page(txns, total=1)
+        mock_paginate.return_value = _make_cursor_page(txns)
 
         acc_mock = AsyncMock()
-        acc_mock.get_by_id = AsyncMock(return_value=account)
         _override_repo(get_account_repo, acc_mock)
 
         txn_mock = MagicMock()
@@ -253,7 +389,25 @@ class TestAccountsAPI:
 
         resp = await admin_client.get(f"/api/v1/accounts/{account.id}/transactions")
         assert resp.status_code == 200
-        assert resp.json()["total"] == 1
+        assert len(resp.json()["items"]) == 1
+        assert resp.json()["next_page"] is None
+        acc_mock.exists.assert_not_awaited()
+
+    @patch("app.api.v1.accounts.sqlalchemy_paginate", new_callable=AsyncMock)
+    async def test_get_account_transactions_not_found(self, mock_paginate, admin_client):
+        mock_paginate.return_value = _make_cursor_page([])
+
+        acc_mock = AsyncMock()
+        acc_mock.exists = AsyncMock(return_value=False)
+        _override_repo(get_account_repo, acc_mock)
+
+        txn_mock = MagicMock()
+        txn_mock.get_by_account_query = MagicMock(return_value=MagicMock())
+        txn_mock.session = MagicMock()
+        _override_repo(get_transaction_repo, txn_mock)
+
+        resp = await admin_client.get("/api/v1/accounts/nonexistent/transactions")
+        assert resp.status_code == 404
 
 
 # ---------------------------------------------------------------------------
@@ -261,12 +415,11 @@ class TestAccountsAPI:
 # ---------------------------------------------------------------------------
 
 
-@pytest.mark.asyncio
 class TestTransactionsAPI:
     @patch("app.api.v1.transactions.sqlalchemy_paginate", new_callable=AsyncMock)
     async def test_list_transactions(self, mock_paginate, admin_client):
         txns = [make_transaction_model(), make_transaction_model()]
-        mock_paginate.return_value = _make_page(txns, total=2)
+        mock_paginate.return_value = _make_cursor_page(txns, next_page="next")
         mock = MagicMock()
         mock.get_list_query = MagicMock(return_value=MagicMock())
         mock.session = MagicMock()
@@ -274,12 +427,14 @@ class TestTransactionsAPI:
         resp = await admin_client.get("/api/v1/transactions")
         assert resp.status_code == 200
         body = resp.json()
-        assert body["total"] == 2
+        assert len(body["items"]) == 2
+        assert body["next_page"] == "next"
+        assert "total" not in body
 
     @patch("app.api.v1.transactions.sqlalchemy_paginate", new_callable=AsyncMock)
     async def test_list_transactions_with_filters(self, mock_paginate, admin_client):
         txns = [make_transaction_model(type="purchase")]
-        mock_paginate.return_value = _make_page(txns, total=1)
+        mock_paginate.return_value = _make_cursor_page(txns)
         mock = MagicMock()
         mock.get_list_query = MagicMock(return_value=MagicMock())
         mock.session = MagicMock()
@@ -294,7 +449,36 @@ class TestTransactionsAPI:
         _override_repo(get_transaction_repo, mock)
         resp = await admin_client.get(f"/api/v1/transactions/{txn.id}")
         assert resp.status_code == 200
-        assert resp.json()["id"] == txn.id
+        body = resp.json()
+        assert body["id"] == txn.id
+        assert body["amount_cents"] == 15000
+        assert body["amount"] == "150.00"
+
+    async def test_get_transaction_served_from_cache_with_etag(self, admin_client):
+        txn = make_transaction_model()
+        mock = AsyncMock()
+        mock.get_by_id = AsyncMock(return_value=txn)
+        _override_repo(get_transaction_repo, mock)
+        first = await admin_client.get(f"/api/v1/transactions/{txn.id}")
+        second = await admin_client.get(f"/api/v1/transactions/{txn.id}")
+        assert first.status_code == second.status_code == 200
+        assert second.json() == first.json()
+        assert first.headers["etag"] == f'W/"{txn.updated_at.timestamp()}"'
+        assert first.headers["cache-control"] == "private, max-age=30"
+        mock.get_by_id.assert_awaited_once()
+
+    async def test_get_transaction_not_modified(self, admin_client):
+        txn = make_transaction_model()
+        mock = AsyncMock()
+        mock.get_by_id = AsyncMock(return_value=txn)
+        _override_repo(get_transaction_repo, mock)
+        etag = (await admin_client.get(f"/api/v1/transactions/{txn.id}")).headers["etag"]
+        resp = await admin_client.get(
+            f"/api/v1/transactions/{txn.id}", headers={"If-None-Match": etag}
+        )
+        assert resp.status_code == 304
+        assert resp.content == b""
+        assert resp.headers["etag"] == etag
 
     async def test_get_transaction_not_found(self, admin_client):
         mock = AsyncMock()
@@ -307,8 +491,6 @@ class TestTransactionsAPI:
         payload = make_transaction_payload()
         txn = make_transaction_model(**payload)
         with patch("app.api.v1.transactions.TransactionService") as MockService:
-            from app.schemas.transaction import TransactionCreateResponse
-
             create_resp = TransactionCreateResponse.model_validate(txn)
             MockService.return_value.create_and_evaluate = AsyncMock(return_value=create_resp)
             resp = await admin_client.post("/api/v1/transactions", json=payload)
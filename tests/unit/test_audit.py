@@ -0,0 +1,42 @@
+"""Unit tests for the audit-logging dependency."""
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+from app.utils.audit import audit_logged
+
+
+def _request():
+    return SimpleNamespace(
+        client=SimpleNamespace(host="10.0.0.1"),
+        state=SimpleNamespace(request_id="req-1"),
+        url=SimpleNamespace(path="/api/v1/customers"),
+    )
+
+
+_USER = SimpleNamespace(username="admin", role="admin")
+
+
+class TestAuditLogged:
+    async def test_logs_action_with_request_context(self):
+        with patch("app.utils.audit.logger") as logger:
+            await audit_logged("create_customer")(_request(), _USER)
+
+        args = logger.info.call_args.args
+        assert args[1:] == (
+            "create_customer",
+            "admin",
+            "admin",
+            "10.0.0.1",
+            "req-1",
+            "/api/v1/customers",
+        )
+
+    async def test_skips_when_info_is_disabled(self):
+        request = MagicMock()
+        with patch("app.utils.audit.logger") as logger:
+            logger.is_enabled_for.return_value = False
+            await audit_logged("create_customer")(request, _USER)
+
+        logger.info.assert_not_called()
+        assert not request.mock_calls
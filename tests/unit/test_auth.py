@@ -1,9 +1,18 @@
 """Unit tests for authentication (JWT + password hashing)."""
 
+import time
+from datetime import UTC, datetime
+from unittest.mock import patch
+
+import jwt
 import pytest
-from jose import JWTError, jwt
+from fastapi import HTTPException
+from jwt import InvalidTokenError
 
+from app.auth.dependencies import require_role
 from app.auth.security import (
+    _decoded_cache,
+    _verified_cache,
     create_access_token,
     create_refresh_token,
     decode_token,
@@ -11,6 +20,14 @@ from app.auth.security import (
     verify_password,
 )
 from app.config import get_settings
+from app.schemas.auth import TokenUser
+
+# Signed once at import; a fixed past expiry needs no clock arithmetic.
+_EXPIRED_TOKEN = jwt.encode(
+    {"sub": "user-1", "role": "admin", "type": "access", "exp": datetime(2020, 1, 1, tzinfo=UTC)},
+    get_settings().jwt_secret_key,
+    algorithm=get_settings().jwt_algorithm,
+)
 
 
 class TestPasswordHashing:
@@ -29,6 +46,44 @@ class TestPasswordHashing:
         h2 = hash_password("same-password")
         assert h1 != h2  # bcrypt uses random salt
 
+    @pytest.mark.usefixtures("fresh_settings")
+    def test_rounds_from_settings(self, monkeypatch):
+        monkeypatch.setenv("BCRYPT_ROUNDS", "5")
+        hashed = hash_password("cheap-password")
+        assert hashed.startswith("$2b$05$")
+        assert verify_password("cheap-password", hashed)
+
+
+class TestVerifiedCredentialCache:
+    def test_repeat_verify_skips_bcrypt(self):
+        hashed = hash_password("cached-password")
+        assert verify_password("cached-password", hashed)
+        with patch("app.auth.security.bcrypt.checkpw") as checkpw:
+            assert verify_password("cached-password", hashed)
+        checkpw.assert_not_called()
+
+    def test_wrong_password_not_served_from_cache(self):
+        hashed = hash_password("cached-password")
+        assert verify_password("cached-password", hashed)
+        assert not verify_password("other-password", hashed)
+
+    def test_failures_are_not_cached(self):
+        hashed = hash_password("cached-password")
+        assert not verify_password("wrong-password", hashed)
+        with patch("app.auth.security.bcrypt.checkpw", return_value=False) as checkpw:
+            assert not verify_password("wrong-password", hashed)
+        checkpw.assert_called_once()
+
+    def test_expired_entry_reverifies(self):
+        hashed = hash_password("cached-password")
+        with (
+            patch.object(_verified_cache, "ttl", 0.0),
+            patch("app.auth.security.bcrypt.checkpw", return_value=True) as checkpw,
+        ):
+            verify_password("cached-password", hashed)
+            verify_password("cached-password", hashed)
+        assert checkpw.call_count == 2
+
 
 class TestAccessToken:
     def test_create_and_decode(self):
@@ -47,9 +102,11 @@ class TestAccessToken:
         assert payload["email"] == ""
 
     def test_contains_expiry(self):
+        before = int(time.time())
         token = create_access_token("user-123", "admin")
         payload = decode_token(token)
-        assert "exp" in payload
+        lifetime = get_settings().jwt_access_token_expire_seconds
+        assert before + lifetime <= payload["exp"] <= int(time.time()) + lifetime
 
 
 class TestRefreshToken:
@@ -73,34 +130,51 @@ class TestRefreshToken:
 
 class TestDecodeToken:
     def test_invalid_token(self):
-        with pytest.raises(JWTError):
+        with pytest.raises(InvalidTokenError):
             decode_token("not-a-valid-token")
 
     def test_wrong_secret(self):
         settings = get_settings()
         token = jwt.encode(
             {"sub": "user-1", "role": "admin"},
-            "wrong-secret",
+            "wrong-secret-wrong-secret-wrong-secret",
             algorithm=settings.jwt_algorithm,
         )
-        with pytest.raises(JWTError):
+        with pytest.raises(InvalidTokenError):
             decode_token(token)
 
     def test_expired_token(self):
-        from datetime import UTC, datetime, timedelta
+        with pytest.raises(InvalidTokenError):
+            decode_token(_EXPIRED_TOKEN)
 
-        settings = get_settings()
-        expired_payload = {
-            "sub": "user-1",
-            "role": "admin",
-            "type": "access",
-            "exp": datetime.now(UTC) - timedelta(hours=1),
-        }
-        token = jwt.encode(
-            expired_payload, settings.jwt_secret_key, algorithm=settings.jwt_algorithm
-        )
-        with pytest.raises(JWTError):
-            decode_token(token)
+
+class TestDecodedTokenCache:
+    def test_repeat_decode_skips_verification(self):
+        token = create_access_token("user-123", "admin")
+        first = decode_token(token)
+        with patch("app.auth.security.jwt.decode") as jwt_decode:
+            assert decode_token(token) == first
+        jwt_decode.assert_not_called()
+
+    def test_cached_claims_are_copies(self):
+        token = create_access_token("user-123", "admin")
+        decode_token(token)["role"] = "tampered"
+        assert decode_token(token)["role"] == "admin"
+
+    def test_invalid_token_not_cached(self):
+        with pytest.raises(InvalidTokenError):
+            decode_token("not-a-valid-token")
+        assert _decoded_cache.get("not-a-valid-token") is None
+
+    def test_entry_expires_with_token(self):
+        import time
+
+        token = create_access_token("user-123", "admin")
+        decode_token(token)
+        lifetime = get_settings().jwt_access_token_expire_minutes * 60
+        later = time.monotonic() + lifetime + 1
+        with patch("app.utils.cache.time.monotonic", return_value=later):
+            assert _decoded_cache.get(token) is None
 
 
 class TestTokenUserDependency:
@@ -122,3 +196,25 @@ class TestTokenUserDependency:
         payload = decode_token(token)
         assert payload["type"] == "refresh"
         # The get_current_user dependency should reject this
+
+
+class TestRequireRole:
+    def test_same_roles_share_checker(self):
+        assert require_role("admin", "analyst") is require_role("analyst", "admin")
+
+    def test_different_roles_get_distinct_checkers(self):
+        assert require_role("admin") is not require_role("admin", "analyst")
+
+    @pytest.mark.parametrize(
+        ("role", "allowed"),
+        [("viewer", ("admin",)), ("viewer", ("admin", "analyst")), ("analyst", ("admin",))],
+    )
+    async def test_disallowed_role_is_forbidden(self, role, allowed):
+        user = TokenUser(id="u1", username=role, role=role)
+        with pytest.raises(HTTPException) as exc_info:
+            await require_role(*allowed)(current_user=user)
+        assert exc_info.value.status_code == 403
+
+    async def test_allowed_role_returns_user(self):
+        user = TokenUser(id="u1", username="analyst", role="analyst")
+        assert await require_role("admin", "analyst")(current_user=user) is user
@@ -0,0 +1,51 @@
+"""Unit tests for the in-process TTL cache."""
+
+from unittest.mock import patch
+
+from app.utils.cache import TTLCache
+
+
+class TestTTLCache:
+    def test_get_returns_stored_value(self):
+        cache: TTLCache[str, int] = TTLCache(maxsize=4, ttl=60)
+        cache.set("a", 1)
+        assert cache.get("a") == 1
+
+    def test_missing_key_returns_none(self):
+        cache: TTLCache[str, int] = TTLCache(maxsize=4, ttl=60)
+        assert cache.get("missing") is None
+
+    def test_entry_expires(self):
+        cache: TTLCache[str, int] = TTLCache(maxsize=4, ttl=60)
+        with patch("app.utils.cache.time.monotonic", return_value=1000.0):
+            cache.set("a", 1)
+        with patch("app.utils.cache.time.monotonic", return_value=1060.0):
+            assert cache.get("a") is None
+        assert len(cache) == 0
+
+    def test_per_entry_ttl_overrides_default(self):
+        cache: TTLCache[str, int] = TTLCache(maxsize=4, ttl=60)
+        with patch("app.utils.cache.time.monotonic", return_value=1000.0):
+            cache.set("a", 1, ttl=5)
+        with patch("app.utils.cache.time.monotonic", return_value=1010.0):
+            assert cache.get("a") is None
+
+    def test_evicts_least_recently_used(self):
+        cache: TTLCache[str, int] = TTLCache(maxsize=2, ttl=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")  # "b" is now least recently used
+        cache.set("c", 3)
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+
+    def test_pop_and_clear(self):
+        cache: TTLCache[str, int] = TTLCache(maxsize=4, ttl=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.pop("a")
+        cache.pop("missing")
+        assert cache.get("a") is None
+        cache.clear()
+        assert len(cache) == 0
@@ -1,19 +1,21 @@
 """Unit tests for dependency injection utilities."""
 
 import contextlib
-from unittest.mock import AsyncMock, MagicMock
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
 
 import pytest
 
-from app.dependencies import get_db_session
+from app.dependencies import get_after_commit, get_db_session
 
 
 def _make_mock_request():
-    """Create a mock request with a session factory on app.state."""
-    session = AsyncMock()
-    session.commit = AsyncMock()
-    session.rollback = AsyncMock()
-    session.close = AsyncMock()
+    """Create a stand-in request with a session factory on app.state.
+
+    Only the session methods the dependency calls are mocks, so their awaits
+    can be asserted; the request and factory are plain objects.
+    """
+    session = SimpleNamespace(commit=AsyncMock(), rollback=AsyncMock(), close=AsyncMock(), info={})
 
     class _ContextManager:
         async def __aenter__(self):
@@ -22,16 +24,13 @@ def _make_mock_request():
         async def __aexit__(self, *args):
             await session.close()
 
-    factory = MagicMock()
-    factory.return_value = _ContextManager()
-
-    request = MagicMock()
-    request.app.state.session_factory = factory
+    request = SimpleNamespace(
+        app=SimpleNamespace(state=SimpleNamespace(session_factory=_ContextManager))
+    )
 
     return request, session
 
 
-@pytest.mark.asyncio
 class TestGetDbSession:
     async def test_commits_on_success(self):
         """Session should be committed when the request handler succeeds."""
@@ -64,3 +63,33 @@ class TestGetDbSession:
         session.rollback.assert_awaited_once()
         session.commit.assert_not_awaited()
         session.close.assert_awaited_once()
+
+    async def test_after_commit_hooks_run_after_commit(self):
+        """Queued hooks must only run once the commit has gone through."""
+        request, session = _make_mock_request()
+        calls = []
+        session.commit.side_effect = lambda: calls.append("commit")
+
+        async def hook():
+            calls.append("hook")
+
+        gen = get_db_session(request)
+        get_after_commit(await gen.__anext__()).append(hook)
+        with contextlib.suppress(StopAsyncIteration):
+            await gen.__anext__()
+
+        assert calls == ["commit", "hook"]
+        assert session.info == {}
+
+    async def test_after_commit_hooks_dropped_on_rollback(self):
+        """A rolled-back request must not run its after-commit hooks."""
+        request, session = _make_mock_request()
+        hook = AsyncMock()
+
+        gen = get_db_session(request)
+        get_after_commit(await gen.__anext__()).append(hook)
+        with pytest.raises(ValueError):
+            await gen.athrow(ValueError("test error"))
+
+        hook.assert_not_awaited()
+        assert session.info == {}
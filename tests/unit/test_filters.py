@@ -1,8 +1,13 @@
 """Unit tests for declarative filter classes."""
 
-from datetime import datetime, timezone
+import operator
+from datetime import UTC, datetime
 
+import pytest
+from fastapi_filter.contrib.sqlalchemy import Filter as _UntypedFilter
+from pydantic import ValidationError
 from sqlalchemy import select
+from sqlalchemy.sql.elements import BooleanClauseList
 
 from app.filters.customer import CustomerFilter
 from app.filters.transaction import TransactionFilter
@@ -10,6 +15,15 @@ from app.models.customer import Customer
 from app.models.transaction import Transaction
 
 
+def _conditions(query):
+    """``(column, operator, value)`` for each WHERE term, read off the clause tree."""
+    clause = query.whereclause
+    if clause is None:
+        return set()
+    terms = clause.clauses if isinstance(clause, BooleanClauseList) else (clause,)
+    return {(term.left.key, term.operator, term.right.value) for term in terms}
+
+
 class TestCustomerFilter:
     def test_defaults_are_none(self):
         f = CustomerFilter()
@@ -20,29 +34,25 @@ class TestCustomerFilter:
     def test_filter_with_status(self):
         f = CustomerFilter(status="active")
         query = f.filter(select(Customer))
-        compiled = str(query.compile(compile_kwargs={"literal_binds": True}))
-        assert "customers.status" in compiled
-        assert "'active'" in compiled
+        assert _conditions(query) == {("status", operator.eq, "active")}
 
     def test_filter_with_tier(self):
         f = CustomerFilter(tier="premium")
         query = f.filter(select(Customer))
-        compiled = str(query.compile(compile_kwargs={"literal_binds": True}))
-        assert "customers.tier" in compiled
-        assert "'premium'" in compiled
+        assert _conditions(query) == {("tier", operator.eq, "premium")}
 
     def test_filter_with_both(self):
         f = CustomerFilter(status="active", tier="premium")
         query = f.filter(select(Customer))
-        compiled = str(query.compile(compile_kwargs={"literal_binds": True}))
-        assert "customers.status" in compiled
-        assert "customers.tier" in compiled
+        assert _conditions(query) == {
+            ("status", operator.eq, "active"),
+            ("tier", operator.eq, "premium"),
+        }
 
     def test_no_filter_produces_clean_query(self):
         f = CustomerFilter()
         query = f.filter(select(Customer))
-        compiled = str(query.compile(compile_kwargs={"literal_binds": True}))
-        assert "WHERE" not in compiled
+        assert query.whereclause is None
 
 
 class TestTransactionFilter:
@@ -58,39 +68,69 @@ class TestTransactionFilter:
     def test_filter_by_customer_id(self):
         f = TransactionFilter(customer_id="CUST-001")
         query = f.filter(select(Transaction))
-        compiled = str(query.compile(compile_kwargs={"literal_binds": True}))
-        assert "WHERE" in compiled
-        assert "customer_id" in compiled
+        assert _conditions(query) == {("customer_id", operator.eq, "CUST-001")}
 
     def test_filter_by_type_and_channel(self):
         f = TransactionFilter(type="purchase", channel="online")
         query = f.filter(select(Transaction))
-        compiled = str(query.compile(compile_kwargs={"literal_binds": True}))
-        assert "transactions.type" in compiled
-        assert "transactions.channel" in compiled
+        assert _conditions(query) == {
+            ("type", operator.eq, "purchase"),
+            ("channel", operator.eq, "online"),
+        }
 
     def test_date_range_filter(self):
-        f = TransactionFilter(
-            created_at__gte=datetime(2024, 1, 1, tzinfo=timezone.utc),
-            created_at__lte=datetime(2024, 12, 31, tzinfo=timezone.utc),
-        )
+        start = datetime(2024, 1, 1, tzinfo=UTC)
+        end = datetime(2024, 12, 31, tzinfo=UTC)
+        f = TransactionFilter(created_at__gte=start, created_at__lte=end)
         query = f.filter(select(Transaction))
-        compiled = str(query.compile(compile_kwargs={"literal_binds": True}))
-        assert "transactions.created_at >=" in compiled
-        assert "transactions.created_at <=" in compiled
+        assert _conditions(query) == {
+            ("created_at", operator.ge, start),
+            ("created_at", operator.le, end),
+        }
 
     def test_no_filter_produces_clean_query(self):
         f = TransactionFilter()
         query = f.filter(select(Transaction))
-        compiled = str(query.compile(compile_kwargs={"literal_binds": True}))
-        assert "WHERE" not in compiled
+        assert query.whereclause is None
 
     def test_partial_filters_only_apply_set_values(self):
         """Only the provided filter field appears in the WHERE clause."""
         f = TransactionFilter(customer_id="CUST-001")
         query = f.filter(select(Transaction))
-        compiled = str(query.compile(compile_kwargs={"literal_binds": True}))
-        where_clause = compiled.split("WHERE")[1] if "WHERE" in compiled else ""
-        assert "customer_id" in where_clause
-        assert "channel" not in where_clause
-        assert "type" not in where_clause
+        assert {column for column, _, _ in _conditions(query)} == {"customer_id"}
+
+    def test_order_by_amount_sorts_on_cents_column(self):
+        """``?order_by=-amount`` predates the cents column and must keep working."""
+        f = TransactionFilter(order_by="-amount")
+        assert f.order_by == ["-amount_cents"]
+        query = f.sort(select(Transaction))
+        assert "ORDER BY transactions.amount_cents DESC" in str(query.compile())
+
+    def test_order_by_rejects_unknown_field(self):
+        with pytest.raises(ValidationError, match="bogus is not a valid ordering field"):
+            TransactionFilter(order_by=["bogus"])
+
+    @pytest.mark.parametrize(
+        "column", ["merchant_name", "merchant_category", "device_id", "description"]
+    )
+    def test_order_by_rejects_nullable_columns(self, column):
+        """A NULL in the leading sort column breaks the listing's keyset cursor."""
+        with pytest.raises(ValidationError, match=f"{column} is not a valid ordering field"):
+            TransactionFilter(order_by=[f"-{column}"])
+
+    def test_order_by_rejects_alias_and_column_together(self):
+        with pytest.raises(ValidationError, match="at most once"):
+            TransactionFilter(order_by=["amount", "-amount_cents"])
+
+    def test_matches_fastapi_filter_output(self):
+        """Precompiled clauses produce the same SQL as fastapi-filter's own walk."""
+        f = TransactionFilter(
+            customer_id="CUST-001",
+            channel="online",
+            created_at__gte=datetime(2024, 1, 1, tzinfo=UTC),
+        )
+        ours = f.filter(select(Transaction))
+        upstream = _UntypedFilter.filter(f, select(Transaction))
+        assert str(ours.compile(compile_kwargs={"literal_binds": True})) == str(
+            upstream.compile(compile_kwargs={"literal_binds": True})
+        )
@@ -5,12 +5,27 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
-from app.grpc.fraud_client import FraudEvaluationClient
+from app.grpc.fraud_client import (
+    CHANNEL_OPTIONS,
+    EVALUATE_TIMEOUT_SECONDS,
+    SERVICE_CONFIG,
+    FraudEvaluationClient,
+)
+from app.grpc.generated import fraud_evaluation_pb2
+
+
+@pytest.fixture()
+def stubbed_client():
+    """A client whose ``_get_stub`` returns a mock stub with an async ``Evaluate``."""
+    client = FraudEvaluationClient(target="localhost:50051")
+    stub = MagicMock()
+    stub.Evaluate = AsyncMock()
+    with patch.object(client, "_get_stub", return_value=stub):
+        yield client, stub
 
 
-@pytest.mark.asyncio
 class TestFraudEvaluationClient:
-    async def test_evaluate_calls_stub(self):
+    async def test_evaluate_calls_stub(self, stubbed_client):
         """Client should build a request and call the gRPC stub."""
         mock_response = SimpleNamespace(
             risk_score=25,
@@ -22,26 +37,26 @@ class TestFraudEvaluationClient:
             alert_created=False,
             alert_id="",
         )
-
-        client = FraudEvaluationClient(target="localhost:50051")
-
-        mock_stub = MagicMock()
-        mock_stub.Evaluate = AsyncMock(return_value=mock_response)
-
-        with patch.object(client, "_get_stub", return_value=mock_stub):
-            result = await client.evaluate(
-                external_id="TXN-001",
-                customer_id="CUST-001",
-                amount=100.0,
-                transaction_type="purchase",
-                channel="online",
-            )
+        client, mock_stub = stubbed_client
+        mock_stub.Evaluate.return_value = mock_response
+
+        result = await client.evaluate(
+            external_id="TXN-001",
+            customer_id="CUST-001",
+            amount=100.0,
+            transaction_type="purchase",
+            channel="online",
+        )
 
         assert result.risk_score == 25
         assert result.decision == "APPROVE"
         mock_stub.Evaluate.assert_awaited_once()
+        assert mock_stub.Evaluate.call_args.kwargs["timeout"] == EVALUATE_TIMEOUT_SECONDS
+        request = mock_stub.Evaluate.call_args.args[0]
+        assert request.merchant_name == ""
+        assert request.device_fingerprint == ""
 
-    async def test_evaluate_with_optional_fields(self):
+    async def test_evaluate_with_optional_fields(self, stubbed_client):
         """Optional fields should default to empty strings in the gRPC request."""
         mock_response = SimpleNamespace(
             risk_score=75,
@@ -62,41 +77,74 @@ class TestFraudEvaluationClient:
             alert_created=True,
             alert_id="ALERT-001",
         )
-
-        client = FraudEvaluationClient(target="localhost:50051")
-        mock_stub = MagicMock()
-        mock_stub.Evaluate = AsyncMock(return_value=mock_response)
-
-        with patch.object(client, "_get_stub", return_value=mock_stub):
-            result = await client.evaluate(
-                external_id="TXN-002",
-                customer_id="CUST-002",
-                amount=999999.99,
-                transaction_type="purchase",
-                channel="online",
-                merchant_name="Casino",
-                merchant_category="gambling",
-                location_country="KP",
-                ip_address="1.2.3.4",
-                device_fingerprint="fp-xyz",
-            )
+        client, mock_stub = stubbed_client
+        mock_stub.Evaluate.return_value = mock_response
+
+        result = await client.evaluate(
+            external_id="TXN-002",
+            customer_id="CUST-002",
+            amount=999999.99,
+            transaction_type="purchase",
+            channel="online",
+            merchant_name="Casino",
+            merchant_category="gambling",
+            location_country="KP",
+            ip_address="1.2.3.4",
+            device_fingerprint="fp-xyz",
+        )
 
         assert result.risk_score == 75
         assert result.alert_created is True
         assert len(result.triggered_rules) == 1
 
+    async def test_channel_pool_created_once_with_options(self):
+        """The channels are opened lazily, once, with the tuned options."""
+        client = FraudEvaluationClient(target="localhost:50051", pool_size=3)
+        with patch("app.grpc.fraud_client.grpc.aio.insecure_channel") as insecure_channel:
+            for _ in range(7):
+                client._get_stub()
+
+        assert insecure_channel.call_count == 3
+        insecure_channel.assert_called_with("localhost:50051", options=CHANNEL_OPTIONS)
+
+    def test_service_config_targets_fraud_service(self):
+        """The retry policy must name the service exactly as the proto declares it."""
+        service = fraud_evaluation_pb2.DESCRIPTOR.services_by_name["FraudEvaluationService"]
+        (method_config,) = SERVICE_CONFIG["methodConfig"]
+        assert method_config["name"] == [{"service": service.full_name}]
+        assert method_config["retryPolicy"]["retryableStatusCodes"] == ["UNAVAILABLE"]
+
+    async def test_stubs_used_round_robin(self):
+        client = FraudEvaluationClient(target="localhost:50051", pool_size=2)
+        with patch("app.grpc.fraud_client.grpc.aio.insecure_channel"):
+            picks = [client._get_stub() for _ in range(4)]
+
+        assert picks[0] is not picks[1]
+        assert picks[0] is picks[2]
+        assert picks[1] is picks[3]
+
+    async def test_connect_waits_for_every_channel(self):
+        client = FraudEvaluationClient(target="localhost:50051", pool_size=2)
+        with patch("app.grpc.fraud_client.grpc.aio.insecure_channel") as insecure_channel:
+            insecure_channel.return_value.channel_ready = AsyncMock()
+            await client.connect(timeout=1.0)
+
+        assert insecure_channel.call_count == 2
+        assert insecure_channel.return_value.channel_ready.await_count == 2
+
     async def test_close_channel(self):
-        """close() should close the gRPC channel."""
+        """close() should close every pooled gRPC channel."""
         client = FraudEvaluationClient(target="localhost:50051")
-        mock_channel = AsyncMock()
-        client._channel = mock_channel
-        client._stub = MagicMock()
+        mock_channels = [AsyncMock(), AsyncMock()]
+        client._channels = list(mock_channels)
+        client._stubs = [MagicMock(), MagicMock()]
 
         await client.close()
 
-        mock_channel.close.assert_awaited_once()
-        assert client._channel is None
-        assert client._stub is None
+        for mock_channel in mock_channels:
+            mock_channel.close.assert_awaited_once()
+        assert client._channels == []
+        assert client._stubs == []
 
     async def test_close_noop_without_channel(self):
         """close() with no channel should be a no-op."""
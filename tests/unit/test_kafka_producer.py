@@ -1,20 +1,31 @@
 """Unit tests for the Kafka producer."""
 
+import asyncio
 import json
+from datetime import UTC, datetime
 from decimal import Decimal
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, patch
 
-import pytest
+from app.services.kafka_producer import (
+    TOPIC_TRANSACTIONS_RAW,
+    TransactionPublisher,
+    _serialize_value,
+    publish_transaction,
+)
 
-from app.services.kafka_producer import TOPIC_TRANSACTIONS_RAW, publish_transaction
+
+def _mock_producer():
+    """Producer whose send() resolves to a pending delivery future."""
+    delivery = asyncio.get_running_loop().create_future()
+    producer = AsyncMock()
+    producer.send = AsyncMock(return_value=delivery)
+    return producer, delivery
 
 
-@pytest.mark.asyncio
 class TestPublishTransaction:
     async def test_publishes_with_correct_topic_and_key(self):
         """Transaction should be sent to the correct topic with external_id as key."""
-        mock_producer = AsyncMock()
-        mock_producer.send_and_wait = AsyncMock()
+        mock_producer, _delivery = _mock_producer()
 
         payload = {
             "external_id": "TXN-001",
@@ -23,37 +34,83 @@ class TestPublishTransaction:
         }
         await publish_transaction(mock_producer, payload)
 
-        mock_producer.send_and_wait.assert_awaited_once()
-        call_kwargs = mock_producer.send_and_wait.call_args
+        mock_producer.send.assert_awaited_once()
+        mock_producer.send_and_wait.assert_not_called()
+        call_kwargs = mock_producer.send.call_args
         assert call_kwargs.kwargs["topic"] == TOPIC_TRANSACTIONS_RAW
         assert call_kwargs.kwargs["key"] == "TXN-001"
         assert call_kwargs.kwargs["value"] == payload
 
     async def test_publishes_with_empty_key_when_missing(self):
         """Missing external_id should default to empty string key."""
-        mock_producer = AsyncMock()
-        mock_producer.send_and_wait = AsyncMock()
+        mock_producer, _delivery = _mock_producer()
 
         await publish_transaction(mock_producer, {"customer_id": "CUST-001"})
 
-        call_kwargs = mock_producer.send_and_wait.call_args
+        call_kwargs = mock_producer.send.call_args
         assert call_kwargs.kwargs["key"] == ""
 
+    async def test_delivery_failure_is_logged_not_raised(self):
+        """A failed background delivery is logged once the broker answers."""
+        mock_producer, delivery = _mock_producer()
+
+        with patch("app.services.kafka_producer.logger") as logger:
+            await publish_transaction(mock_producer, {"external_id": "TXN-002"})
+            delivery.set_exception(RuntimeError("broker down"))
+            await asyncio.sleep(0)
+
+        logger.warning.assert_called_once()
+
+
+class TestTransactionPublisher:
+    async def test_publish_returns_before_the_producer_is_called(self):
+        mock_producer, _delivery = _mock_producer()
+        publisher = TransactionPublisher(mock_producer)
+        publisher.start()
+
+        assert publisher.publish({"external_id": "TXN-010"}) is True
+        mock_producer.send.assert_not_called()
+
+        await publisher.stop()
+        mock_producer.send.assert_awaited_once()
+        assert mock_producer.send.call_args.kwargs["key"] == "TXN-010"
+        mock_producer.stop.assert_awaited_once()
+
+    async def test_full_queue_drops_event(self):
+        mock_producer, _delivery = _mock_producer()
+        publisher = TransactionPublisher(mock_producer, maxsize=1)
+
+        assert publisher.publish({"external_id": "TXN-011"}) is True
+        with patch("app.services.kafka_producer.logger") as logger:
+            assert publisher.publish({"external_id": "TXN-012"}) is False
+        logger.warning.assert_called_once()
+
+    async def test_send_failure_does_not_stop_the_worker(self):
+        mock_producer, _delivery = _mock_producer()
+        mock_producer.send.side_effect = [RuntimeError("no metadata"), _delivery]
+        publisher = TransactionPublisher(mock_producer)
+        publisher.start()
+
+        publisher.publish({"external_id": "TXN-013"})
+        publisher.publish({"external_id": "TXN-014"})
+        await publisher.stop()
+
+        assert mock_producer.send.await_count == 2
+
 
 class TestKafkaProducerSerialization:
     def test_value_serializer_handles_decimals(self):
         """The JSON serializer used by the producer should handle Decimal values."""
-        serializer = lambda v: json.dumps(v, default=str).encode("utf-8")
-        result = serializer({"amount": Decimal("150.00")})
+        result = _serialize_value({"amount": Decimal("150.00")})
         parsed = json.loads(result)
         assert parsed["amount"] == "150.00"
 
     def test_value_serializer_handles_nested_types(self):
         """The JSON serializer should handle datetime-like objects via str fallback."""
-        from datetime import UTC, datetime
-
-        serializer = lambda v: json.dumps(v, default=str).encode("utf-8")
         now = datetime.now(UTC)
-        result = serializer({"timestamp": now})
+        result = _serialize_value({"timestamp": now})
         parsed = json.loads(result)
         assert isinstance(parsed["timestamp"], str)
+
+    def test_value_serializer_is_compact(self):
+        assert _serialize_value({"a": 1, "b": None}) == b'{"a":1,"b":null}'
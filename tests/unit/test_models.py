@@ -1,6 +1,8 @@
 """Unit tests for database models and enums."""
 
 import enum
+import time
+import uuid
 
 import pytest
 
@@ -21,160 +23,112 @@ from app.models import (
     TransactionType,
     UserRole,
 )
+from app.models.base import uuid7
+
+# Every enum names its members after the values stored in the database.
+_ENUM_MEMBERS = [
+    (KYCStatus, ("pending", "verified", "rejected", "expired")),
+    (CustomerTier, ("standard", "premium", "private")),
+    (RiskRating, ("low", "medium", "high")),
+    (CustomerStatus, ("active", "suspended", "closed")),
+    (AccountType, ("cheque", "savings", "credit", "investment", "business")),
+    (AccountStatus, ("active", "frozen", "dormant", "closed")),
+    (TransactionType, ("purchase", "transfer", "withdrawal", "deposit", "payment", "refund")),
+    (Channel, ("online", "pos", "atm", "mobile", "branch")),
+    (TransactionStatus, ("pending", "completed", "failed", "reversed")),
+    (UserRole, ("admin", "analyst", "viewer")),
+]
+
+
+@pytest.mark.parametrize(("enum_cls", "values"), _ENUM_MEMBERS)
+class TestEnums:
+    def test_members(self, enum_cls: type[enum.Enum], values: tuple[str, ...]) -> None:
+        assert {m.name: m.value for m in enum_cls} == {v: v for v in values}
+
+    def test_enum_is_str_subclass(self, enum_cls: type[enum.Enum], values: tuple[str, ...]) -> None:
+        """Members compare equal to their plain-string values."""
+        for member, value in zip(enum_cls, values, strict=True):
+            assert isinstance(member, str)
+            assert member == value
 
 
-class TestKYCStatus:
-    def test_values(self):
-        assert KYCStatus.pending.value == "pending"
-        assert KYCStatus.verified.value == "verified"
-        assert KYCStatus.rejected.value == "rejected"
-        assert KYCStatus.expired.value == "expired"
-
-    def test_all_members(self):
-        assert len(KYCStatus) == 4
-
-
-class TestCustomerTier:
-    def test_values(self):
-        assert CustomerTier.standard.value == "standard"
-        assert CustomerTier.premium.value == "premium"
-        assert CustomerTier.private.value == "private"
-
-    def test_all_members(self):
-        assert len(CustomerTier) == 3
-
-
-class TestRiskRating:
-    def test_values(self):
-        assert RiskRating.low.value == "low"
-        assert RiskRating.medium.value == "medium"
-        assert RiskRating.high.value == "high"
-
-    def test_all_members(self):
-        assert len(RiskRating) == 3
-
-
-class TestCustomerStatus:
-    def test_values(self):
-        assert CustomerStatus.active.value == "active"
-        assert CustomerStatus.suspended.value == "suspended"
-        assert CustomerStatus.closed.value == "closed"
-
-    def test_all_members(self):
-        assert len(CustomerStatus) == 3
-
-
-class TestAccountType:
-    def test_values(self):
-        assert AccountType.cheque.value == "cheque"
-        assert AccountType.savings.value == "savings"
-        assert AccountType.credit.value == "credit"
-        assert AccountType.investment.value == "investment"
-        assert AccountType.business.value == "business"
-
-    def test_all_members(self):
-        assert len(AccountType) == 5
-
-
-class TestAccountStatus:
-    def test_values(self):
-        assert AccountStatus.active.value == "active"
-        assert AccountStatus.frozen.value == "frozen"
-        assert AccountStatus.dormant.value == "dormant"
-        assert AccountStatus.closed.value == "closed"
-
-    def test_all_members(self):
-        assert len(AccountStatus) == 4
-
-
-class TestTransactionType:
-    def test_values(self):
-        assert TransactionType.purchase.value == "purchase"
-        assert TransactionType.transfer.value == "transfer"
-        assert TransactionType.withdrawal.value == "withdrawal"
-        assert TransactionType.deposit.value == "deposit"
-        assert TransactionType.payment.value == "payment"
-        assert TransactionType.refund.value == "refund"
-
-    def test_all_members(self):
-        assert len(TransactionType) == 6
-
-
-class TestChannel:
-    def test_values(self):
-        assert Channel.online.value == "online"
-        assert Channel.pos.value == "pos"
-        assert Channel.atm.value == "atm"
-        assert Channel.mobile.value == "mobile"
-        assert Channel.branch.value == "branch"
-
-    def test_all_members(self):
-        assert len(Channel) == 5
-
-
-class TestTransactionStatus:
-    def test_values(self):
-        assert TransactionStatus.pending.value == "pending"
-        assert TransactionStatus.completed.value == "completed"
-        assert TransactionStatus.failed.value == "failed"
-        assert TransactionStatus.reversed.value == "reversed"
+class TestNativeEnumColumns:
+    @pytest.mark.parametrize(
+        ("column", "enum_cls"),
+        [
+            (Customer.__table__.c.kyc_status, KYCStatus),
+            (Customer.__table__.c.tier, CustomerTier),
+            (Customer.__table__.c.risk_rating, RiskRating),
+            (Customer.__table__.c.status, CustomerStatus),
+            (Account.__table__.c.account_type, AccountType),
+            (Account.__table__.c.status, AccountStatus),
+            (Transaction.__table__.c.type, TransactionType),
+            (Transaction.__table__.c.channel, Channel),
+            (Transaction.__table__.c.status, TransactionStatus),
+            (AdminUser.__table__.c.role, UserRole),
+        ],
+    )
+    def test_stores_member_values(self, column, enum_cls: type[enum.Enum]) -> None:
+        assert column.type.native_enum
+        assert column.type.enums == [member.value for member in enum_cls]
 
-    def test_all_members(self):
-        assert len(TransactionStatus) == 4
 
+class TestModelTableNames:
+    @pytest.mark.parametrize(
+        ("model", "tablename"),
+        [
+            (Customer, "customers"),
+            (Account, "accounts"),
+            (Transaction, "transactions"),
+            (AdminUser, "admin_users"),
+        ],
+    )
+    def test_tablename(self, model: type[Base], tablename: str) -> None:
+        assert model.__tablename__ == tablename
 
-class TestUserRole:
-    def test_values(self):
-        assert UserRole.admin.value == "admin"
-        assert UserRole.analyst.value == "analyst"
-        assert UserRole.viewer.value == "viewer"
 
-    def test_all_members(self):
-        assert len(UserRole) == 3
+class TestBaseMetadata:
+    def test_all_tables_registered(self):
+        tables = Base.metadata.tables
+        assert "customers" in tables
+        assert "accounts" in tables
+        assert "transactions" in tables
+        assert "admin_users" in tables
 
 
-class TestEnumStringBehavior:
-    """Verify all enums are str-based for direct comparison."""
+class TestTransactionPartitioning:
+    def test_partitioned_by_created_at(self):
+        opts = Transaction.__table__.dialect_options["postgresql"]
+        assert opts["partition_by"] == "RANGE (created_at)"
 
-    @pytest.mark.parametrize(
-        "enum_cls",
-        [
-            KYCStatus,
-            CustomerTier,
-            RiskRating,
-            CustomerStatus,
-            AccountType,
-            AccountStatus,
-            TransactionType,
-            Channel,
-            TransactionStatus,
-            UserRole,
-        ],
-    )
-    def test_enum_is_str_subclass(self, enum_cls: type[enum.Enum]) -> None:
-        for member in enum_cls:
-            assert isinstance(member, str)
-            assert member == member.value
+    def test_primary_key_includes_partition_key(self):
+        pk_columns = [c.name for c in Transaction.__table__.primary_key]
+        assert pk_columns == ["id", "created_at"]
 
+    def test_only_account_foreign_key(self):
+        targets = {fk.target_fullname for fk in Transaction.__table__.foreign_keys}
+        assert targets == {"accounts.id"}
 
-class TestModelTableNames:
-    def test_customer_tablename(self):
-        assert Customer.__tablename__ == "customers"
 
-    def test_account_tablename(self):
-        assert Account.__tablename__ == "accounts"
+class TestUUIDv7:
+    def test_version_and_variant(self):
+        value = uuid7()
+        assert value.version == 7
+        assert value.variant == uuid.RFC_4122
 
-    def test_transaction_tablename(self):
-        assert Transaction.__tablename__ == "transactions"
+    def test_time_ordered(self):
+        first = uuid7()
+        time.sleep(0.002)
+        assert str(first) < str(uuid7())
 
-    def test_admin_user_tablename(self):
-        assert AdminUser.__tablename__ == "admin_users"
+    def test_transaction_id_default_is_v7(self):
+        default = Transaction.__table__.c.id.default
+        assert uuid.UUID(default.arg(None)).version == 7
 
 
-class TestBaseMetadata:
-    def test_all_tables_registered(self):
-        table_names = set(Base.metadata.tables.keys())
-        assert "customers" in table_names
-        assert "accounts" in table_names
-        assert "transactions" in table_names
-        assert "admin_users" in table_names
+class TestUUIDMixin:
+    @pytest.mark.parametrize("model", [Customer, Account, AdminUser])
+    def test_id_is_generated_by_postgres(self, model):
+        column = model.__table__.c.id
+        assert column.default is None
+        assert str(column.server_default.arg) == "gen_random_uuid()"
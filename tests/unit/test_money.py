@@ -0,0 +1,27 @@
+"""Unit tests for cents conversion helpers."""
+
+from decimal import Decimal
+
+from app.utils.money import from_cents, to_cents
+
+
+class TestToCents:
+    def test_two_decimal_places(self):
+        assert to_cents(Decimal("150.00")) == 15000
+
+    def test_whole_amount(self):
+        assert to_cents(Decimal("5")) == 500
+
+    def test_rounds_half_away_from_zero(self):
+        assert to_cents(Decimal("1.005")) == 101
+        assert to_cents(Decimal("-1.005")) == -101
+
+
+class TestFromCents:
+    def test_keeps_two_decimal_places(self):
+        assert str(from_cents(15000)) == "150.00"
+        assert str(from_cents(0)) == "0.00"
+        assert str(from_cents(-5)) == "-0.05"
+
+    def test_round_trip(self):
+        assert from_cents(to_cents(Decimal("999999.99"))) == Decimal("999999.99")
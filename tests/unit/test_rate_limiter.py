@@ -0,0 +1,103 @@
+"""Unit tests for the Redis token-bucket rate limiter."""
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import fakeredis
+import pytest
+from fastapi import HTTPException
+from redis.exceptions import ConnectionError as RedisConnectionError
+from redis.exceptions import NoScriptError, ResponseError
+from redis.exceptions import TimeoutError as RedisTimeoutError
+
+from app.services.rate_limiter import (
+    TOKEN_BUCKET_SCRIPT,
+    enforce_rate_limit,
+    rate_limit_key,
+    take_token,
+)
+
+
+def _request(redis):
+    return SimpleNamespace(
+        client=SimpleNamespace(host="10.0.0.1"),
+        app=SimpleNamespace(state=SimpleNamespace(redis=redis)),
+    )
+
+
+class TestTakeToken:
+    async def test_runs_cached_script_against_client_bucket(self):
+        redis = AsyncMock()
+        redis.evalsha.return_value = 1
+
+        assert await take_token(redis, "10.0.0.1", 120, 2.0) is True
+        _sha, numkeys, key, capacity, rate = redis.evalsha.call_args.args
+        assert (numkeys, key, capacity, rate) == (1, rate_limit_key("10.0.0.1"), 120, 2.0)
+        redis.eval.assert_not_called()
+
+    async def test_loads_script_when_not_cached(self):
+        redis = AsyncMock()
+        redis.evalsha.side_effect = NoScriptError("NOSCRIPT")
+        redis.eval.return_value = 0
+
+        assert await take_token(redis, "10.0.0.1", 120, 2.0) is False
+        assert redis.eval.call_args.args[0] == TOKEN_BUCKET_SCRIPT
+
+    async def test_fails_open_when_redis_is_down(self):
+        redis = AsyncMock()
+        redis.evalsha.side_effect = RedisConnectionError("down")
+
+        assert await take_token(redis, "10.0.0.1", 120, 2.0) is True
+
+    async def test_fails_open_when_redis_times_out(self):
+        redis = AsyncMock()
+        redis.evalsha.side_effect = RedisTimeoutError("timeout")
+
+        assert await take_token(redis, "10.0.0.1", 120, 2.0) is True
+
+    async def test_script_errors_propagate(self):
+        redis = AsyncMock()
+        redis.evalsha.side_effect = ResponseError("WRONGTYPE")
+
+        with pytest.raises(ResponseError):
+            await take_token(redis, "10.0.0.1", 120, 2.0)
+
+
+class TestTokenBucketScript:
+    """Runs the Lua script itself on fakeredis (needs the ``lua`` extra)."""
+
+    async def test_drains_then_refills(self):
+        redis = fakeredis.aioredis.FakeRedis()
+
+        results = [await take_token(redis, "10.0.0.1", 3, 20.0) for _ in range(4)]
+        assert results == [True, True, True, False]
+
+        # The script reads the server clock; at 20 tokens/s one is back in 50ms
+        await asyncio.sleep(0.1)
+        assert await take_token(redis, "10.0.0.1", 3, 20.0) is True
+
+    async def test_buckets_are_per_client(self):
+        redis = fakeredis.aioredis.FakeRedis()
+
+        for _ in range(3):
+            await take_token(redis, "10.0.0.1", 3, 0.01)
+        assert await take_token(redis, "10.0.0.1", 3, 0.01) is False
+        assert await take_token(redis, "10.0.0.2", 3, 0.01) is True
+
+
+class TestEnforceRateLimit:
+    async def test_empty_bucket_returns_429(self):
+        redis = AsyncMock()
+        redis.evalsha.return_value = 0
+
+        with pytest.raises(HTTPException) as exc_info:
+            await enforce_rate_limit(_request(redis))
+        assert exc_info.value.status_code == 429
+        assert exc_info.value.headers == {"Retry-After": "1"}
+
+    async def test_token_available_passes(self):
+        redis = AsyncMock()
+        redis.evalsha.return_value = 1
+
+        await enforce_rate_limit(_request(redis))
@@ -1,7 +1,7 @@
 """Unit tests for repository classes.
 
 Tests verify that repositories correctly delegate to the SQLAlchemy session
-(execute, add, flush, refresh) without requiring a real database.
+(execute, add, flush) without requiring a real database.
 """
 
 import uuid
@@ -10,10 +10,9 @@ from decimal import Decimal
 from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock
 
-import pytest
-
 from app.filters.customer import CustomerFilter
 from app.filters.transaction import TransactionFilter
+from app.models.transaction import Transaction
 from app.repositories.account_repository import AccountRepository
 from app.repositories.customer_repository import CustomerRepository
 from app.repositories.transaction_repository import TransactionRepository
@@ -28,26 +27,36 @@ from app.schemas.transaction import TransactionCreate
 
 _NOW = datetime.now(UTC)
 
+# Fixed IDs for create payloads; no test depends on them being fresh.
+_UUIDS = [str(uuid.uuid4()) for _ in range(3)]
+
+
+# Result stand-ins expose only the accessor under test, so a repository
+# reading the result any other way fails with AttributeError.
+
 
 def _scalars_all(items: list):
-    """Build a chained mock: result.scalars().all() -> items."""
-    result = MagicMock()
-    result.scalars.return_value.all.return_value = items
-    return result
+    """Build a fake result: result.scalars().all() -> items."""
+    return SimpleNamespace(scalars=lambda: SimpleNamespace(all=lambda: items))
 
 
 def _scalar_one_or_none(item):
-    """Build a mock: result.scalar_one_or_none() -> item."""
-    result = MagicMock()
-    result.scalar_one_or_none.return_value = item
-    return result
+    """Build a fake result: result.scalar_one_or_none() -> item."""
+    return SimpleNamespace(scalar_one_or_none=lambda: item)
 
 
 def _scalar(value):
-    """Build a mock: result.scalar() -> value."""
-    result = MagicMock()
-    result.scalar.return_value = value
-    return result
+    """Build a fake result: result.scalar() -> value."""
+    return SimpleNamespace(scalar=lambda: value)
+
+
+def _one_or_none(row):
+    """Build a fake result: result.one_or_none() -> row."""
+    return SimpleNamespace(one_or_none=lambda: row)
+
+
+# Shared "no row" result; the fakes hold no per-test state.
+_NOT_FOUND = _scalar_one_or_none(None)
 
 
 def _make_session():
@@ -65,7 +74,6 @@ def _make_session():
 class TestCustomerRepository:
     """Tests for CustomerRepository."""
 
-    @pytest.mark.asyncio
     async def test_get_by_id_found(self):
         session = _make_session()
         customer = SimpleNamespace(id="c1", first_name="Alice")
@@ -77,16 +85,23 @@ class TestCustomerRepository:
         assert result is customer
         session.execute.assert_awaited_once()
 
-    @pytest.mark.asyncio
     async def test_get_by_id_not_found(self):
         session = _make_session()
-        session.execute.return_value = _scalar_one_or_none(None)
+        session.execute.return_value = _NOT_FOUND
 
         repo = CustomerRepository(session)
         result = await repo.get_by_id("nonexistent")
 
         assert result is None
 
+    async def test_exists(self):
+        session = _make_session()
+        session.execute.return_value = _scalar(True)
+
+        repo = CustomerRepository(session)
+        assert await repo.exists("c1") is True
+        session.execute.assert_awaited_once()
+
     def test_get_list_query_returns_select(self):
         session = _make_session()
         repo = CustomerRepository(session)
@@ -104,7 +119,6 @@ class TestCustomerRepository:
         compiled = str(query.compile(compile_kwargs={"literal_binds": True}))
         assert "WHERE" in compiled
 
-    @pytest.mark.asyncio
     async def test_create_adds_and_flushes(self):
         session = _make_session()
         repo = CustomerRepository(session)
@@ -123,9 +137,8 @@ class TestCustomerRepository:
 
         session.add.assert_called_once()
         session.flush.assert_awaited_once()
-        session.refresh.assert_awaited_once()
+        session.refresh.assert_not_awaited()
 
-    @pytest.mark.asyncio
     async def test_update_applies_partial_fields(self):
         session = _make_session()
         customer = SimpleNamespace(id="c1", first_name="Old", tier="standard")
@@ -137,12 +150,11 @@ class TestCustomerRepository:
 
         assert result.first_name == "New"
         session.flush.assert_awaited_once()
-        session.refresh.assert_awaited_once()
+        session.refresh.assert_not_awaited()
 
-    @pytest.mark.asyncio
     async def test_update_returns_none_when_not_found(self):
         session = _make_session()
-        session.execute.return_value = _scalar_one_or_none(None)
+        session.execute.return_value = _NOT_FOUND
 
         repo = CustomerRepository(session)
         data = CustomerUpdate(first_name="New")
@@ -151,17 +163,15 @@ class TestCustomerRepository:
         assert result is None
         session.flush.assert_not_awaited()
 
-    @pytest.mark.asyncio
     async def test_get_summary_returns_none_when_not_found(self):
         session = _make_session()
-        session.execute.return_value = _scalar_one_or_none(None)
+        session.execute.return_value = _one_or_none(None)
 
         repo = CustomerRepository(session)
         result = await repo.get_summary("nonexistent")
 
         assert result is None
 
-    @pytest.mark.asyncio
     async def test_get_summary_aggregates(self):
         session = _make_session()
         customer = SimpleNamespace(
@@ -173,26 +183,24 @@ class TestCustomerRepository:
             risk_rating="low",
             onboarded_at=_NOW,
         )
-
-        # execute calls: get_by_id, accounts query (.all()), txn stats (.one())
-        accounts_result = MagicMock()
-        accounts_result.all.return_value = [
-            SimpleNamespace(account_number="1012345678", account_type="cheque"),
-            SimpleNamespace(account_number="1012345679", account_type="savings"),
-            SimpleNamespace(account_number="1012345680", account_type="credit"),
-        ]
-        txn_stats_result = MagicMock()
-        txn_stats_result.one.return_value = (15, Decimal("7500.00"), Decimal("500.00"))
-
-        session.execute.side_effect = [
-            _scalar_one_or_none(customer),  # get_by_id
-            accounts_result,  # accounts query
-            txn_stats_result,  # txn stats
-        ]
+        # One row carries the customer, its account rollup and the txn stats;
+        # amounts come back in cents
+        session.execute.return_value = _one_or_none(
+            SimpleNamespace(
+                Customer=customer,
+                account_count=3,
+                account_number="1012345678",
+                account_type="cheque",
+                txn_count=15,
+                txn_total=750000,
+                txn_avg=Decimal("50000.0000000000000000"),
+            )
+        )
 
         repo = CustomerRepository(session)
         summary = await repo.get_summary("c1")
 
+        session.execute.assert_awaited_once()
         assert summary is not None
         assert summary.customer_id == "c1"
         assert summary.full_name == "Alice Smith"
@@ -203,6 +211,16 @@ class TestCustomerRepository:
         assert summary.total_spend_30d == "7500.00"
         assert summary.avg_transaction_amount == "500.00"
 
+    async def test_get_summary_query_shape(self):
+        """The primary account is optional; the stats aggregate always yields a row."""
+        session = _make_session()
+        session.execute.return_value = _one_or_none(None)
+        await CustomerRepository(session).get_summary("c1")
+
+        compiled = str(session.execute.call_args.args[0].compile()).lower()
+        assert "left outer join (select accounts.account_number" in compiled
+        assert ") as primary_account on true join (select count(*) as txn_count" in compiled
+
 
 # =========================================================================
 # AccountRepository
@@ -212,7 +230,6 @@ class TestCustomerRepository:
 class TestAccountRepository:
     """Tests for AccountRepository."""
 
-    @pytest.mark.asyncio
     async def test_get_by_id_found(self):
         session = _make_session()
         account = SimpleNamespace(id="a1", account_type="cheque")
@@ -222,18 +239,24 @@ class TestAccountRepository:
         result = await repo.get_by_id("a1")
 
         assert result is account
+        assert session.execute.call_args.args[1] == {"id": "a1"}
 
-    @pytest.mark.asyncio
     async def test_get_by_id_not_found(self):
         session = _make_session()
-        session.execute.return_value = _scalar_one_or_none(None)
+        session.execute.return_value = _NOT_FOUND
 
         repo = AccountRepository(session)
         result = await repo.get_by_id("nonexistent")
 
         assert result is None
 
-    @pytest.mark.asyncio
+    async def test_exists_false(self):
+        session = _make_session()
+        session.execute.return_value = _scalar(False)
+
+        repo = AccountRepository(session)
+        assert await repo.exists("nonexistent") is False
+
     async def test_get_by_customer(self):
         session = _make_session()
         accounts = [SimpleNamespace(id="a1"), SimpleNamespace(id="a2")]
@@ -244,7 +267,6 @@ class TestAccountRepository:
 
         assert len(result) == 2
 
-    @pytest.mark.asyncio
     async def test_get_by_customer_empty(self):
         session = _make_session()
         session.execute.return_value = _scalars_all([])
@@ -254,13 +276,12 @@ class TestAccountRepository:
 
         assert result == []
 
-    @pytest.mark.asyncio
     async def test_create_adds_and_flushes(self):
         session = _make_session()
         repo = AccountRepository(session)
 
         data = AccountCreate(
-            customer_id=str(uuid.uuid4()),
+            customer_id=_UUIDS[0],
             account_number="1012345678",
             account_type="cheque",
             currency="ZAR",
@@ -270,9 +291,8 @@ class TestAccountRepository:
 
         session.add.assert_called_once()
         session.flush.assert_awaited_once()
-        session.refresh.assert_awaited_once()
+        session.refresh.assert_not_awaited()
 
-    @pytest.mark.asyncio
     async def test_update_applies_fields(self):
         session = _make_session()
         account = SimpleNamespace(id="a1", status="active")
@@ -285,10 +305,9 @@ class TestAccountRepository:
         assert result.status == "frozen"
         session.flush.assert_awaited_once()
 
-    @pytest.mark.asyncio
     async def test_update_returns_none_when_not_found(self):
         session = _make_session()
-        session.execute.return_value = _scalar_one_or_none(None)
+        session.execute.return_value = _NOT_FOUND
 
         repo = AccountRepository(session)
         data = AccountUpdate(status="frozen")
@@ -306,7 +325,6 @@ class TestAccountRepository:
 class TestTransactionRepository:
     """Tests for TransactionRepository."""
 
-    @pytest.mark.asyncio
     async def test_get_by_id_found(self):
         session = _make_session()
         txn = SimpleNamespace(id="t1", type="purchase")
@@ -317,10 +335,9 @@ class TestTransactionRepository:
 
         assert result is txn
 
-    @pytest.mark.asyncio
     async def test_get_by_id_not_found(self):
         session = _make_session()
-        session.execute.return_value = _scalar_one_or_none(None)
+        session.execute.return_value = _NOT_FOUND
 
         repo = TransactionRepository(session)
         result = await repo.get_by_id("nonexistent")
@@ -360,15 +377,43 @@ class TestTransactionRepository:
         compiled = str(query.compile(compile_kwargs={"literal_binds": True}))
         assert "transaction" in compiled.lower()
 
-    @pytest.mark.asyncio
+    def test_scoped_queries_use_keyset_order(self):
+        session = _make_session()
+        repo = TransactionRepository(session)
+        for query in (
+            repo.get_list_query(TransactionFilter()),
+            repo.get_by_customer_query("cust-1"),
+            repo.get_by_account_query("acc-1"),
+        ):
+            compiled = str(query.compile()).lower()
+            assert "order by transactions.created_at desc, transactions.id desc" in compiled
+
+    def test_list_query_selects_columns_not_entities(self):
+        repo = TransactionRepository(_make_session())
+        query = repo.get_list_query(TransactionFilter())
+        assert all(desc["entity"] is None for desc in query.column_descriptions)
+        assert [desc["name"] for desc in query.column_descriptions] == [
+            c.name for c in Transaction.__table__.columns
+        ]
+
+    def test_requested_sort_leads_keyset_order(self):
+        session = _make_session()
+        repo = TransactionRepository(session)
+        query = repo.get_list_query(TransactionFilter(order_by=["-amount_cents"]))
+        compiled = str(query.compile()).lower()
+        assert (
+            "order by transactions.amount_cents desc, "
+            "transactions.created_at desc, transactions.id desc"
+        ) in compiled
+
     async def test_create_adds_and_flushes(self):
         session = _make_session()
         repo = TransactionRepository(session)
 
         data = TransactionCreate(
             external_id="TXN-001",
-            account_id=str(uuid.uuid4()),
-            customer_id=str(uuid.uuid4()),
+            account_id=_UUIDS[1],
+            customer_id=_UUIDS[0],
             type="purchase",
             amount=Decimal("250.00"),
             currency="ZAR",
@@ -380,8 +425,9 @@ class TestTransactionRepository:
         await repo.create(data)
 
         session.add.assert_called_once()
+        assert session.add.call_args.args[0].amount_cents == 25000
         session.flush.assert_awaited_once()
-        session.refresh.assert_awaited_once()
+        session.refresh.assert_not_awaited()
 
 
 # =========================================================================
@@ -392,7 +438,6 @@ class TestTransactionRepository:
 class TestUserRepository:
     """Tests for UserRepository."""
 
-    @pytest.mark.asyncio
     async def test_get_by_username_found(self):
         session = _make_session()
         user = SimpleNamespace(id="u1", username="admin", role="admin")
@@ -404,17 +449,15 @@ class TestUserRepository:
         assert result is user
         assert result.username == "admin"
 
-    @pytest.mark.asyncio
     async def test_get_by_username_not_found(self):
         session = _make_session()
-        session.execute.return_value = _scalar_one_or_none(None)
+        session.execute.return_value = _NOT_FOUND
 
         repo = UserRepository(session)
         result = await repo.get_by_username("ghost")
 
         assert result is None
 
-    @pytest.mark.asyncio
     async def test_get_by_id_found(self):
         session = _make_session()
         user = SimpleNamespace(id="u1", username="admin")
@@ -425,21 +468,19 @@ class TestUserRepository:
 
         assert result is user
 
-    @pytest.mark.asyncio
     async def test_get_by_id_not_found(self):
         session = _make_session()
-        session.execute.return_value = _scalar_one_or_none(None)
+        session.execute.return_value = _NOT_FOUND
 
         repo = UserRepository(session)
         result = await repo.get_by_id("nonexistent")
 
         assert result is None
 
-    @pytest.mark.asyncio
     async def test_create_adds_and_flushes(self):
         session = _make_session()
         user = SimpleNamespace(
-            id=str(uuid.uuid4()),
+            id=_UUIDS[2],
             username="newuser",
             email="new@test.co.za",
             hashed_password="$2b$12$hash",
@@ -453,4 +494,4 @@ class TestUserRepository:
 
         session.add.assert_called_once_with(user)
         session.flush.assert_awaited_once()
-        session.refresh.assert_awaited_once_with(user)
+        session.refresh.assert_not_awaited()
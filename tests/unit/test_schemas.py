@@ -8,8 +8,14 @@ from pydantic import ValidationError
 
 from app.schemas.account import AccountCreate, AccountResponse, AccountUpdate
 from app.schemas.auth import RefreshRequest, TokenResponse, TokenUser, UserResponse
+from app.schemas.common import from_trusted_row
 from app.schemas.customer import CustomerCreate, CustomerResponse, CustomerSummary, CustomerUpdate
-from app.schemas.transaction import TransactionCreate, TransactionResponse
+from app.schemas.transaction import (
+    TransactionCreate,
+    TransactionCreateResponse,
+    TransactionResponse,
+)
+from tests.conftest import make_account_model, make_transaction_model
 
 
 class TestTokenResponse:
@@ -156,6 +162,18 @@ class TestAccountResponse:
     def test_from_attributes(self):
         assert AccountResponse.model_config.get("from_attributes") is True
 
+    def test_from_trusted_row_matches_model_validate(self):
+        row = make_account_model()
+        built = from_trusted_row(AccountResponse, row)
+        assert built == AccountResponse.model_validate(row)
+        assert built.model_dump_json() == AccountResponse.model_validate(row).model_dump_json()
+
+    def test_from_trusted_row_takes_non_column_fields_as_values(self):
+        row = make_transaction_model()
+        built = from_trusted_row(TransactionCreateResponse, row, fraud_evaluation=None)
+        assert built.id == row.id
+        assert built.fraud_evaluation is None
+
 
 class TestTransactionCreate:
     def test_valid(self):
@@ -0,0 +1,63 @@
+"""Unit tests for the customer summary cache."""
+
+from unittest.mock import AsyncMock
+
+import fakeredis
+from redis.exceptions import ConnectionError as RedisConnectionError
+
+from app.schemas.customer import CustomerSummary
+from app.services.summary_cache import (
+    SUMMARY_CACHE_TTL_SECONDS,
+    cache_summary,
+    get_cached_summary,
+    invalidate_summary,
+    summary_cache_key,
+)
+
+
+def _summary() -> CustomerSummary:
+    return CustomerSummary(
+        customer_id="cust-1",
+        full_name="Jane Doe",
+        tier="standard",
+        kyc_status="verified",
+        account_age_days=30,
+        total_accounts=1,
+        total_transactions_30d=3,
+        total_spend_30d="150.00",
+        avg_transaction_amount="50.00",
+        risk_rating="low",
+    )
+
+
+class TestSummaryCache:
+    async def test_round_trip_with_ttl(self):
+        redis = fakeredis.aioredis.FakeRedis(decode_responses=True)
+        await cache_summary(redis, _summary())
+        assert await get_cached_summary(redis, "cust-1") == _summary()
+        ttl = await redis.ttl(summary_cache_key("cust-1"))
+        assert 0 < ttl <= SUMMARY_CACHE_TTL_SECONDS
+
+    async def test_invalidate_removes_entry(self):
+        redis = fakeredis.aioredis.FakeRedis(decode_responses=True)
+        await cache_summary(redis, _summary())
+        await invalidate_summary(redis, "cust-1")
+        assert await get_cached_summary(redis, "cust-1") is None
+
+    async def test_unreadable_entry_is_a_miss_and_dropped(self):
+        redis = fakeredis.aioredis.FakeRedis(decode_responses=True)
+        key = summary_cache_key("cust-1")
+        for raw in ("not json", '{"customer_id": "cust-1"}'):
+            await redis.set(key, raw)
+            assert await get_cached_summary(redis, "cust-1") is None
+            assert await redis.get(key) is None
+
+    async def test_redis_failures_are_swallowed(self):
+        redis = AsyncMock()
+        redis.get.side_effect = RedisConnectionError("down")
+        redis.set.side_effect = RedisConnectionError("down")
+        redis.delete.side_effect = RedisConnectionError("down")
+
+        assert await get_cached_summary(redis, "cust-1") is None
+        await cache_summary(redis, _summary())
+        await invalidate_summary(redis, "cust-1")
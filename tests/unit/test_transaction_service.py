@@ -0,0 +1,102 @@
+"""Unit tests for the transaction service orchestration."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.config import get_settings
+from app.services.transaction_service import TransactionService, _account_number_cache
+from tests.conftest import make_transaction_model
+
+
+@pytest.fixture(autouse=True)
+def _clear_account_number_cache():
+    _account_number_cache.clear()
+    yield
+    _account_number_cache.clear()
+
+
+class TestCreateAndEvaluate:
+    async def test_fraud_evaluation_and_event_lookup_overlap(self):
+        """The gRPC call is still in flight when the event's account lookup runs."""
+        txn = make_transaction_model()
+        looked_up = asyncio.Event()
+        timed_out = []
+
+        async def evaluate(**_kwargs):
+            try:
+                await asyncio.wait_for(looked_up.wait(), timeout=0.5)
+            except TimeoutError:
+                timed_out.append(True)
+            raise RuntimeError("fraud service unavailable")
+
+        async def execute(*_args):
+            looked_up.set()
+            return MagicMock(scalar_one_or_none=lambda: "1012345678")
+
+        fraud_client = MagicMock()
+        fraud_client.evaluate = AsyncMock(side_effect=evaluate)
+        session = AsyncMock()
+        session.execute.side_effect = execute
+
+        service = TransactionService(
+            session, get_settings(), fraud_client=fraud_client, kafka_publisher=MagicMock()
+        )
+        service.repo.create = AsyncMock(return_value=txn)
+
+        response = await service.create_and_evaluate(MagicMock(), [])
+
+        assert not timed_out
+        fraud_client.evaluate.assert_awaited_once()
+        assert response.id == txn.id
+        assert response.fraud_evaluation is None
+
+    async def test_event_is_published_only_after_commit(self):
+        """The event waits on the after-commit hooks, not the request handler."""
+        txn = make_transaction_model()
+        session = AsyncMock()
+        session.execute.return_value = MagicMock(scalar_one_or_none=lambda: "1012345678")
+        publisher = MagicMock()
+        service = TransactionService(session, get_settings(), kafka_publisher=publisher)
+        service.repo.create = AsyncMock(return_value=txn)
+        after_commit = []
+
+        await service.create_and_evaluate(MagicMock(), after_commit)
+
+        publisher.publish.assert_not_called()
+        assert len(after_commit) == 1
+        await after_commit[0]()
+        publisher.publish.assert_called_once()
+        event = publisher.publish.call_args.args[0]
+        assert event["external_id"] == txn.external_id
+        assert event["account_number"] == "1012345678"
+
+    async def test_no_hook_without_publisher(self):
+        service = TransactionService(AsyncMock(), get_settings())
+        service.repo.create = AsyncMock(return_value=make_transaction_model())
+        after_commit = []
+
+        await service.create_and_evaluate(MagicMock(), after_commit)
+
+        assert after_commit == []
+
+
+class TestResolveAccountNumber:
+    async def test_repeat_lookup_is_served_from_cache(self):
+        session = AsyncMock()
+        session.execute.return_value = MagicMock(scalar_one_or_none=lambda: "1012345678")
+        service = TransactionService(session, get_settings())
+
+        assert await service._resolve_account_number("acc-1") == "1012345678"
+        assert await service._resolve_account_number("acc-1") == "1012345678"
+        session.execute.assert_awaited_once()
+
+    async def test_missing_account_is_not_cached(self):
+        session = AsyncMock()
+        session.execute.return_value = MagicMock(scalar_one_or_none=lambda: None)
+        service = TransactionService(session, get_settings())
+
+        assert await service._resolve_account_number("acc-missing") is None
+        assert await service._resolve_account_number("acc-missing") is None
+        assert session.execute.await_count == 2